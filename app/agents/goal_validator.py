@@ -3,24 +3,136 @@ Goal Validator Agent for PI Planning Dashboard
 CrewAI agent that validates and improves PI goals using SMART criteria
 """
 
+import os
 import re
+import multiprocessing
+import copy
+import json
 import time
 import random
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+from utils.keyword_matcher import KeywordMatcher
+from utils.analysis_cache import AnalysisCache, content_key
+
+# Bump whenever goal scoring or improvement logic changes, so cached analyses are not reused
+ANALYSIS_VERSION = 1
+
+# Keyword lists in the SMART criteria that the matcher counts
+SMART_KEYWORD_ROLES = ('keywords', 'anti_keywords', 'warning_keywords', 'contexts', 'bonus_keywords')
+
+# Goal header grammars, written in lowercase; each header starts a new goal
+DEFAULT_GOAL_HEADERS = (
+    r'goal\s+\d+:',
+    r'objective\s+\d+:',
+    r'goal:',
+    r'objective:'
+)
+
+class GoalSegmenter:
+    """
+    Splits a document into goals at header tokens
+    
+    All header grammars are combined into one regex, so a single left-to-right
+    pass finds every header; each goal is then the slice from its header to
+    the next one (or the end of the document). Cost is linear in document size.
+    Headers are matched case-insensitively by scanning a lowercased copy of the
+    text, which keeps the regex engine's fast literal-prefix search.
+    """
+    
+    def __init__(self, header_patterns: Sequence[str] = DEFAULT_GOAL_HEADERS):
+        self.header_patterns = tuple(header_patterns)
+        combined = '|'.join(f'(?:{pattern})' for pattern in self.header_patterns)
+        self._headers = re.compile(combined) if self.header_patterns else None
+        self._headers_ignore_case = re.compile(combined, re.IGNORECASE) if self.header_patterns else None
+    
+    def segment(self, text_content: str) -> List[str]:
+        """Return the text of each headed section, in document order"""
+        if self._headers is None:
+            return []
+        
+        lowered = text_content.lower()
+        if len(lowered) == len(text_content):
+            matches = self._headers.finditer(lowered)
+        else:
+            # Some characters change length when lowercased, so offsets would drift
+            matches = self._headers_ignore_case.finditer(text_content)
+        
+        starts = [match.start() for match in matches]
+        ends = starts[1:] + [len(text_content)]
+        
+        return [text_content[start:end].strip() for start, end in zip(starts, ends)]
+
+def _add_hits(score: float, weight: float, hits: int) -> float:
+    """Add weight once per hit, one step at a time, as per-keyword checks would"""
+    for _ in range(hits):
+        score += weight
+    return score
+
+class SmartMatcher:
+    """
+    Matches text against every SMART keyword in a single pass
+    
+    All keywords are compiled into one trie-shaped regex that runs once over
+    the lowercased text, so adding keywords does not add passes; patterns are
+    precompiled once per agent. scan() returns distinct hit counts as
+    {criterion: {role: count}}.
+    """
+    
+    def __init__(self, smart_criteria: Dict[str, Dict[str, Any]]):
+        self._criteria = list(smart_criteria)
+        self._keywords = KeywordMatcher(
+            (keyword.lower(), (criterion, role, keyword.lower()))
+            for criterion, definition in smart_criteria.items()
+            for role in SMART_KEYWORD_ROLES
+            for keyword in dict.fromkeys(definition.get(role, []))
+        )
+        
+        # Patterns are few and stop at their first hit, so each is compiled on its own
+        self._patterns = [
+            (criterion, re.compile(pattern, definition.get('pattern_flags', 0)))
+            for criterion, definition in smart_criteria.items()
+            for pattern in definition.get('patterns', [])
+        ]
+    
+    def scan(self, text: str) -> Dict[str, Dict[str, int]]:
+        """Count the distinct keywords and patterns of each criterion found in text"""
+        hits = {criterion: {} for criterion in self._criteria}
+        
+        for criterion, role, _ in self._keywords.scan(text.lower()):
+            hits[criterion][role] = hits[criterion].get(role, 0) + 1
+        
+        for criterion, pattern in self._patterns:
+            if pattern.search(text):
+                hits[criterion]['patterns'] = hits[criterion].get('patterns', 0) + 1
+        
+        return hits
+
 class GoalValidatorAgent:
     """
     CrewAI agent specialized in validating and improving PI goals
     Uses SMART criteria (Specific, Measurable, Achievable, Relevant, Time-bound)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        simulate_delay: bool = False,
+        goal_headers: Sequence[str] = DEFAULT_GOAL_HEADERS,
+        analysis_cache: Optional[AnalysisCache] = None
+    ):
         self.agent_name = "Goal Validator Agent"
         self.role = "SMART Goals Analyst"
         self.goal = "Validate and improve PI goals from documents"
         self.backstory = "Expert in SMART goal methodology and PI planning best practices"
         
+        # Artificial "thinking" time, only wanted for demos
+        self.simulate_delay = simulate_delay
+        
+        # Header grammars that mark where each goal starts
+        self.segmenter = GoalSegmenter(goal_headers)
+        
         # SMART criteria definitions
         self.smart_criteria = {
             'specific': {
@@ -31,7 +143,8 @@ class GoalValidatorAgent:
             'measurable': {
                 'description': 'Goal has quantifiable success criteria',
                 'keywords': ['%', 'percent', 'number', 'count', 'metric', 'kpi', 'score', 'rating'],
-                'patterns': [r'\d+%', r'\d+\.\d+', r'\$\d+', r'\d+\s*(seconds?|minutes?|hours?|days?|weeks?)']
+                'patterns': [r'\d+%', r'\d+\.\d+', r'\$\d+', r'\d+\s*(seconds?|minutes?|hours?|days?|weeks?)'],
+                'bonus_keywords': ['success criteria', 'metrics']
             },
             'achievable': {
                 'description': 'Goal is realistic and attainable',
@@ -41,14 +154,27 @@ class GoalValidatorAgent:
             'relevant': {
                 'description': 'Goal aligns with business objectives',
                 'keywords': ['business value', 'revenue', 'customer', 'user', 'efficiency', 'cost'],
-                'contexts': ['business', 'customer', 'user experience', 'performance', 'security']
+                'contexts': ['business', 'customer', 'user experience', 'performance', 'security'],
+                'bonus_keywords': ['business value', 'impact']
             },
             'time_bound': {
                 'description': 'Goal has clear timeline and deadlines',
                 'keywords': ['by', 'within', 'deadline', 'timeline', 'end of', 'complete by'],
-                'patterns': [r'by\s+\w+\s+\d{4}', r'within\s+\d+\s+\w+', r'end\s+of\s+\w+']
+                'patterns': [r'by\s+\w+\s+\d{4}', r'within\s+\d+\s+\w+', r'end\s+of\s+\w+'],
+                'pattern_flags': re.IGNORECASE,
+                'bonus_keywords': ['pi', 'program increment']
             }
         }
+        
+        # Compiled once; every goal is then scanned in a single pass
+        self.matcher = SmartMatcher(self.smart_criteria)
+        
+        # Per-goal results are memoized by goal text and criteria version
+        self.analysis_cache = analysis_cache
+        self.criteria_version = content_key(
+            str(ANALYSIS_VERSION),
+            json.dumps(self.smart_criteria, sort_keys=True, default=str)
+        )
     
     def validate_goals(self, text_content: str) -> Dict[str, Any]:
         """
@@ -62,7 +188,8 @@ class GoalValidatorAgent:
         """
         
         # Simulate agent processing time
-        time.sleep(1)
+        if self.simulate_delay:
+            time.sleep(1)
         
         # Extract individual goals from text
         goals = self._extract_goals(text_content)
@@ -72,7 +199,7 @@ class GoalValidatorAgent:
         total_smart_score = 0
         
         for i, goal_text in enumerate(goals):
-            goal_analysis = self._analyze_single_goal(goal_text, i + 1)
+            goal_analysis = self.analyze_goal(goal_text, i + 1)
             validated_goals.append(goal_analysis)
             total_smart_score += goal_analysis['smart_score']
         
@@ -90,22 +217,48 @@ class GoalValidatorAgent:
             'processed_at': datetime.now().isoformat()
         }
     
-    def _extract_goals(self, text_content: str) -> List[str]:
-        """Extract individual goals from text content"""
+    def validate_documents(
+        self,
+        documents: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many goal documents across a process pool
         
-        # Look for common goal patterns
-        goal_patterns = [
-            r'GOAL\s+\d+:.*?(?=GOAL\s+\d+:|$)',
-            r'OBJECTIVE\s+\d+:.*?(?=OBJECTIVE\s+\d+:|$)',
-            r'Goal:.*?(?=Goal:|$)',
-            r'Objective:.*?(?=Objective:|$)'
-        ]
+        Args:
+            documents: (document_name, text_content) pairs
+            max_workers: Worker processes to use (defaults to one per CPU core)
+            
+        Returns:
+            One validation result per document, in input order. Each result
+            carries its document_name; a document that fails to validate gets
+            an 'error' entry instead of goals.
+        """
         
-        goals = []
+        if not documents:
+            return []
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(documents))
+        agent_options = {
+            'simulate_delay': self.simulate_delay,
+            'goal_headers': self.segmenter.header_patterns,
+            'analysis_cache': self.analysis_cache
+        }
+        jobs = [(name, text, agent_options) for name, text in documents]
         
-        for pattern in goal_patterns:
-            matches = re.findall(pattern, text_content, re.DOTALL | re.IGNORECASE)
-            goals.extend([match.strip() for match in matches])
+        # A single document is not worth the process start-up cost
+        if max_workers == 1:
+            return [_validate_document(job) for job in jobs]
+        
+        # Spawn rather than fork: forking the multi-threaded Streamlit server can deadlock
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            return list(executor.map(_validate_document, jobs))
+    
+    def _extract_goals(self, text_content: str) -> List[str]:
+        """Extract individual goals from text content"""
+        
+        # Slice the document between goal headers in a single pass
+        goals = self.segmenter.segment(text_content)
         
         # If no structured goals found, try to split by common separators
         if not goals:
@@ -117,11 +270,31 @@ class GoalValidatorAgent:
         cleaned_goals = []
         for goal in goals:
             # Remove extra whitespace and normalize
-            cleaned_goal = re.sub(r'\s+', ' ', goal.strip())
+            cleaned_goal = ' '.join(goal.split())
             if len(cleaned_goal) > 20:  # Minimum goal length
                 cleaned_goals.append(cleaned_goal)
         
-        return cleaned_goals[:10]  # Limit to 10 goals max
+        return cleaned_goals
+    
+    def analyze_goal(self, goal_text: str, goal_number: int = 1) -> Dict[str, Any]:
+        """
+        Analyze one goal, reusing the cached result for identical goal text
+        
+        Whitespace is normalized first, so reflowed text hits the same entry.
+        """
+        
+        normalized = ' '.join(goal_text.split())
+        if self.analysis_cache is None or not normalized:
+            return self._analyze_single_goal(normalized, goal_number)
+        
+        key = content_key(self.criteria_version, normalized)
+        analysis = self.analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_single_goal(normalized, goal_number)
+            self.analysis_cache.put(key, analysis)
+        
+        # Callers may edit the result, so never hand out the cached object
+        return copy.deepcopy(analysis)
     
     def _analyze_single_goal(self, goal_text: str, goal_number: int) -> Dict[str, Any]:
         """Analyze a single goal against SMART criteria"""
@@ -136,8 +309,11 @@ class GoalValidatorAgent:
         recommendations = []
         smart_score = 0
         
+        # One scan collects the keyword and pattern hits for every criterion
+        hits = self.matcher.scan(goal_text)
+        
         # Specific
-        specific_score = self._check_specific(goal_text)
+        specific_score = self._check_specific(goal_text, hits)
         smart_assessment['specific'] = specific_score > 0.4
         if not smart_assessment['specific']:
             issues.append("Goal lacks specificity - too vague or general")
@@ -145,7 +321,7 @@ class GoalValidatorAgent:
         smart_score += specific_score * 20
         
         # Measurable
-        measurable_score = self._check_measurable(goal_text)
+        measurable_score = self._check_measurable(goal_text, hits)
         smart_assessment['measurable'] = measurable_score > 0.3
         if not smart_assessment['measurable']:
             issues.append("Goal lacks measurable success criteria")
@@ -153,7 +329,7 @@ class GoalValidatorAgent:
         smart_score += measurable_score * 20
         
         # Achievable
-        achievable_score = self._check_achievable(goal_text)
+        achievable_score = self._check_achievable(goal_text, hits)
         smart_assessment['achievable'] = achievable_score > 0.3
         if not smart_assessment['achievable']:
             issues.append("Goal may be unrealistic or overly ambitious")
@@ -161,7 +337,7 @@ class GoalValidatorAgent:
         smart_score += achievable_score * 20
         
         # Relevant
-        relevant_score = self._check_relevant(goal_text)
+        relevant_score = self._check_relevant(goal_text, hits)
         smart_assessment['relevant'] = relevant_score > 0.3
         if not smart_assessment['relevant']:
             issues.append("Goal lacks clear business relevance or value")
@@ -169,7 +345,7 @@ class GoalValidatorAgent:
         smart_score += relevant_score * 20
         
         # Time-bound
-        time_bound_score = self._check_time_bound(goal_text)
+        time_bound_score = self._check_time_bound(goal_text, hits)
         smart_assessment['time_bound'] = time_bound_score > 0.3
         if not smart_assessment['time_bound']:
             issues.append("Goal lacks clear timeline or deadline")
@@ -189,22 +365,13 @@ class GoalValidatorAgent:
             'recommendations': recommendations
         }
     
-    def _check_specific(self, goal_text: str) -> float:
+    def _check_specific(self, goal_text: str, hits: Optional[Dict[str, Dict[str, int]]] = None) -> float:
         """Check if goal is specific"""
-        score = 0.0
-        text_lower = goal_text.lower()
+        specific_hits = (hits or self.matcher.scan(goal_text))['specific']
         
-        # Check for specific action words
-        specific_words = self.smart_criteria['specific']['keywords']
-        for word in specific_words:
-            if word in text_lower:
-                score += 0.2
-        
-        # Penalize vague words
-        vague_words = self.smart_criteria['specific']['anti_keywords']
-        for word in vague_words:
-            if word in text_lower:
-                score -= 0.1
+        # Reward specific action words, penalize vague ones
+        score = _add_hits(0.0, 0.2, specific_hits.get('keywords', 0))
+        score = _add_hits(score, -0.1, specific_hits.get('anti_keywords', 0))
         
         # Check for detailed descriptions
         if len(goal_text.split()) > 20:
@@ -212,90 +379,56 @@ class GoalValidatorAgent:
         
         return min(1.0, max(0.0, score))
     
-    def _check_measurable(self, goal_text: str) -> float:
+    def _check_measurable(self, goal_text: str, hits: Optional[Dict[str, Dict[str, int]]] = None) -> float:
         """Check if goal is measurable"""
-        score = 0.0
-        text_lower = goal_text.lower()
-        
-        # Check for measurement keywords
-        measure_words = self.smart_criteria['measurable']['keywords']
-        for word in measure_words:
-            if word in text_lower:
-                score += 0.2
+        measurable_hits = (hits or self.matcher.scan(goal_text))['measurable']
         
-        # Check for numeric patterns
-        patterns = self.smart_criteria['measurable']['patterns']
-        for pattern in patterns:
-            if re.search(pattern, goal_text):
-                score += 0.3
+        # Measurement keywords and numeric patterns
+        score = _add_hits(0.0, 0.2, measurable_hits.get('keywords', 0))
+        score = _add_hits(score, 0.3, measurable_hits.get('patterns', 0))
         
         # Check for success criteria section
-        if 'success criteria' in text_lower or 'metrics' in text_lower:
+        if measurable_hits.get('bonus_keywords'):
             score += 0.3
         
         return min(1.0, max(0.0, score))
     
-    def _check_achievable(self, goal_text: str) -> float:
+    def _check_achievable(self, goal_text: str, hits: Optional[Dict[str, Dict[str, int]]] = None) -> float:
         """Check if goal is achievable"""
-        score = 0.7  # Default to achievable unless red flags
-        text_lower = goal_text.lower()
+        achievable_hits = (hits or self.matcher.scan(goal_text))['achievable']
         
-        # Check for warning words that suggest unrealistic goals
-        warning_words = self.smart_criteria['achievable']['warning_keywords']
-        for word in warning_words:
-            if word in text_lower:
-                score -= 0.2
-        
-        # Check for realistic language
-        realistic_words = self.smart_criteria['achievable']['keywords']
-        for word in realistic_words:
-            if word in text_lower:
-                score += 0.1
+        # Default to achievable unless red flags; realistic language helps
+        score = _add_hits(0.7, -0.2, achievable_hits.get('warning_keywords', 0))
+        score = _add_hits(score, 0.1, achievable_hits.get('keywords', 0))
         
         return min(1.0, max(0.0, score))
     
-    def _check_relevant(self, goal_text: str) -> float:
+    def _check_relevant(self, goal_text: str, hits: Optional[Dict[str, Dict[str, int]]] = None) -> float:
         """Check if goal is relevant to business"""
-        score = 0.0
-        text_lower = goal_text.lower()
+        relevant_hits = (hits or self.matcher.scan(goal_text))['relevant']
         
         # Check for business relevance keywords
-        relevant_words = self.smart_criteria['relevant']['keywords']
-        for word in relevant_words:
-            if word in text_lower:
-                score += 0.2
+        score = _add_hits(0.0, 0.2, relevant_hits.get('keywords', 0))
         
         # Check for business value statement
-        if 'business value' in text_lower or 'impact' in text_lower:
+        if relevant_hits.get('bonus_keywords'):
             score += 0.3
         
         # Check for context alignment
-        contexts = self.smart_criteria['relevant']['contexts']
-        for context in contexts:
-            if context in text_lower:
-                score += 0.1
+        score = _add_hits(score, 0.1, relevant_hits.get('contexts', 0))
         
         return min(1.0, max(0.0, score))
     
-    def _check_time_bound(self, goal_text: str) -> float:
+    def _check_time_bound(self, goal_text: str, hits: Optional[Dict[str, Dict[str, int]]] = None) -> float:
         """Check if goal is time-bound"""
-        score = 0.0
-        text_lower = goal_text.lower()
-        
-        # Check for time-related keywords
-        time_words = self.smart_criteria['time_bound']['keywords']
-        for word in time_words:
-            if word in text_lower:
-                score += 0.2
+        time_hits = (hits or self.matcher.scan(goal_text))['time_bound']
         
-        # Check for time patterns
-        patterns = self.smart_criteria['time_bound']['patterns']
-        for pattern in patterns:
-            if re.search(pattern, goal_text, re.IGNORECASE):
-                score += 0.4
+        # Time-related keywords and date patterns
+        score = _add_hits(0.0, 0.2, time_hits.get('keywords', 0))
+        score = _add_hits(score, 0.4, time_hits.get('patterns', 0))
         
         # Check for PI-specific timeline
-        if 'pi' in text_lower or 'program increment' in text_lower:
+        if time_hits.get('bonus_keywords'):
             score += 0.3
         
         return min(1.0, max(0.0, score))
@@ -392,3 +525,20 @@ class GoalValidatorAgent:
         ])
         
         return recommendations[:6]  # Limit to top 6 recommendations
+
+def _validate_document(job: Tuple[str, str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate one (name, text, agent_options) job; runs inside pool workers"""
+    document_name, text_content, agent_options = job
+    
+    try:
+        result = GoalValidatorAgent(**agent_options).validate_goals(text_content)
+    except Exception as e:
+        result = {
+            'original_text': text_content,
+            'goals_count': 0,
+            'goals': [],
+            'error': str(e)
+        }
+    
+    result['document_name'] = document_name
+    return result
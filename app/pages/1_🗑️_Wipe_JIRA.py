@@ -14,6 +14,11 @@ sys.path.insert(0, str(app_dir))
 
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from utils.mcp_client import get_mcp_client, test_mcp_connection
+from utils.jira_api import get_jira_client
+from utils.issue_records import parse_issue_page, count_issue_types
+from utils.issue_cache import get_issue_cache
+from utils.push_journal import get_push_journal
+from utils.push_diff import clear_snapshot
 from utils.config import get_jira_config, is_demo_mode
 
 # Page configuration
@@ -23,52 +28,97 @@ st.set_page_config(
     layout="wide"
 )
 
-def get_project_summary_via_mcp(mcp_client, project_key):
-    """Get project summary using MCP client"""
-    # Use jira_get_project_issues to get all issues for the project
-    result = mcp_client.call_tool("jira_get_project_issues", {
-        "project_key": project_key
-    })
+# Largest page the MCP jira_search tool will return
+MCP_SEARCH_PAGE_SIZE = 50
+
+# Cleanup options that delete issues (as opposed to components, versions, ...)
+ISSUE_CLEANUP_OPTIONS = ('epics', 'stories', 'tasks', 'bugs', 'subtasks')
+
+# Pushed item kinds (push journal and sync snapshot) deleted by each cleanup option;
+# Features hang off their Epic's key
+PUSHED_KINDS_BY_OPTION = {
+    'epics': ('epic', 'feature'),
+    'stories': ('feature',)
+}
+
+def search_issue_records_via_mcp(mcp_client, jql: str, fields: str = "issuetype"):
+    """Fetch every issue matching jql as compact records, paging through jira_search"""
+    def search_arguments(start_at: int) -> dict:
+        return {
+            "jql": jql,
+            "fields": fields,
+            "limit": MCP_SEARCH_PAGE_SIZE,
+            "start_at": start_at
+        }
+    
+    def read_page(result) -> list:
+        if not result["success"]:
+            raise Exception(f"Failed to get project issues: {result.get('error', 'Unknown error')}")
+        page_records, _ = parse_issue_page(result["result"])
+        return page_records
+    
+    result = mcp_client.call_tool("jira_search", search_arguments(0))
     
     if not result["success"]:
         raise Exception(f"Failed to get project issues: {result.get('error', 'Unknown error')}")
     
-    issues = result["result"].get("content", [])
-    if not issues or len(issues) == 0:
-        return {
-            'epics': 0,
-            'stories': 0,
-            'tasks': 0,
-            'bugs': 0
-        }
+    records, total = parse_issue_page(result["result"])
     
-    # Parse the text content to extract issue counts
-    content_text = issues[0].get("text", "")
+    # The server may cap pages below the requested limit, so step by what the first page returned
+    page_size = len(records)
+    if not page_size:
+        return records
     
-    # Initialize counters
-    summary = {
-        'epics': 0,
-        'stories': 0,
-        'tasks': 0,
-        'bugs': 0
-    }
+    # Fetch the remaining pages concurrently now that the total is known
+    offsets = list(range(page_size, total, page_size))
+    page_results = mcp_client.call_tools_concurrently([
+        ("jira_search", search_arguments(start_at)) for start_at in offsets
+    ])
+    
+    for start_at, page_result in zip(offsets, page_results):
+        page_records = read_page(page_result)
+        records.extend(page_records)
+        
+        # A short page leaves a gap before the next offset; fill it one page at a time
+        page_end = min(start_at + page_size, total)
+        position = start_at + len(page_records)
+        while page_records and position < page_end:
+            page_records = read_page(mcp_client.call_tool("jira_search", search_arguments(position)))
+            page_records = page_records[:page_end - position]
+            records.extend(page_records)
+            position += len(page_records)
+    
+    return records
+
+def count_issues_via_mcp(mcp_client, jql: str) -> int:
+    """Get the total number of issues matching jql with a single-row search"""
+    result = mcp_client.call_tool("jira_search", {"jql": jql, "fields": "issuetype", "limit": 1})
+    
+    if not result["success"]:
+        raise Exception(f"Failed to count project issues: {result.get('error', 'Unknown error')}")
     
-    # Simple parsing - count issue types mentioned in the response
-    if "Epic" in content_text:
-        summary['epics'] = content_text.count("Epic")
-    if "Story" in content_text:
-        summary['stories'] = content_text.count("Story")
-    if "Task" in content_text:
-        summary['tasks'] = content_text.count("Task")
-    if "Bug" in content_text:
-        summary['bugs'] = content_text.count("Bug")
-    
-    return summary
+    _, total = parse_issue_page(result["result"])
+    return total
+
+def get_cached_issue_records(mcp_client, jql: str):
+    """Read issues through the shared cache so reruns only fetch what changed"""
+    return get_issue_cache().get_or_fetch(
+        jql,
+        fetch=lambda query: search_issue_records_via_mcp(mcp_client, query),
+        count=lambda query: count_issues_via_mcp(mcp_client, query),
+        fields="issuetype"
+    )
+
+def get_project_summary_via_mcp(mcp_client, project_key):
+    """Get project summary using MCP client"""
+    # Only the issue type is needed for counting, so skip every other field
+    records = get_cached_issue_records(mcp_client, f"project = {project_key}")
+    return count_issue_types(records)
 
 def cleanup_items_via_mcp(mcp_client, option_name: str, project_key: str):
     """Cleanup items using MCP client"""
     try:
-        if option_name in ['epics', 'stories', 'tasks', 'bugs', 'subtasks']:
+        if option_name in ISSUE_CLEANUP_OPTIONS:
             # Map option names to JIRA issue types
             issue_type_map = {
                 'epics': 'Epic',
@@ -80,15 +130,15 @@ def cleanup_items_via_mcp(mcp_client, option_name: str, project_key: str):
             
             issue_type = issue_type_map[option_name]
             
-            # First, search for issues of this type
-            search_result = mcp_client.call_tool("jira_search", {
-                "jql": f"project = {project_key} AND issuetype = '{issue_type}'"
-            })
-            
-            if not search_result["success"]:
+            # Deletion is simulated, so only the number of matching issues is needed
+            try:
+                found = count_issues_via_mcp(
+                    mcp_client, f"project = {project_key} AND issuetype = '{issue_type}'"
+                )
+            except Exception as e:
                 return {
                     'success': False,
-                    'error': f"Failed to search for {issue_type} issues: {search_result.get('error', 'Unknown error')}"
+                    'error': f"Failed to search for {issue_type} issues: {str(e)}"
                 }
             
             # For now, simulate deletion (actual deletion would require delete tools)
@@ -98,7 +148,7 @@ def cleanup_items_via_mcp(mcp_client, option_name: str, project_key: str):
             return {
                 'success': True,
                 'count': count,
-                'message': f"Simulated deletion of {count} {issue_type} issues (MCP delete tools not implemented yet)"
+                'message': f"Found {found} {issue_type} issues; simulated deletion of {count} (MCP delete tools not implemented yet)"
             }
         
         elif option_name in ['components', 'versions', 'labels', 'workflows']:
@@ -304,6 +354,15 @@ def execute_cleanup(mcp_client, cleanup_options: dict, project_key: str):
     
     progress_bar = st.progress(0)
     status_text = st.empty()
+    item_status_text = st.empty()
+    
+    # Issue deletes go straight to JIRA when real credentials are configured
+    jira_config = get_jira_config()
+    has_valid_credentials = bool(
+        jira_config['server'] and jira_config['user'] and jira_config['token']
+        and jira_config['token'] != 'your-jira-api-token'
+    )
+    jira_client = get_jira_client(jira_config) if has_valid_credentials and not is_demo_mode() else None
     
     results = {
         'success': [],
@@ -317,16 +376,28 @@ def execute_cleanup(mcp_client, cleanup_options: dict, project_key: str):
             continue
         
         current_step += 1
-        progress = current_step / total_steps
-        progress_bar.progress(progress)
+        progress_bar.progress((current_step - 1) / total_steps)
         
         status_text.text(f"Processing {option_name}... ({current_step}/{total_steps})")
         
+        def report_progress(done, total, issue_key, error, option_name=option_name, step=current_step):
+            """Stream per-issue deletion progress into the page"""
+            if total:
+                progress_bar.progress(min(1.0, (step - 1 + done / total) / total_steps))
+            if error:
+                item_status_text.text(f"{option_name}: {done}/{total} processed - failed {error}")
+            elif issue_key:
+                item_status_text.text(f"{option_name}: {done}/{total} processed - deleted {issue_key}")
+        
         try:
-            # Use MCP to perform cleanup operations
-            time.sleep(1)  # Simulate API call delay
-            
-            result = cleanup_items_via_mcp(mcp_client, option_name, project_key)
+            if jira_client:
+                result = jira_client.cleanup_items(option_name, progress_callback=report_progress)
+            else:
+                # Use MCP to perform cleanup operations
+                if is_demo_mode():
+                    time.sleep(1)  # Simulate API call delay
+                
+                result = cleanup_items_via_mcp(mcp_client, option_name, project_key)
             
             if result['success']:
                 results['success'].append({
@@ -337,7 +408,9 @@ def execute_cleanup(mcp_client, cleanup_options: dict, project_key: str):
             else:
                 results['errors'].append({
                     'option': option_name,
-                    'error': result['error']
+                    'error': result['error'],
+                    'count': result.get('count', 0),
+                    'deleted_keys': result.get('deleted_keys', [])
                 })
         
         except Exception as e:
@@ -346,6 +419,25 @@ def execute_cleanup(mcp_client, cleanup_options: dict, project_key: str):
                 'error': str(e)
             })
     
+    # Cached reads of this project are stale now
+    get_issue_cache().invalidate(f"project = {project_key}")
+    
+    # Keys recorded by earlier pushes point at deleted issues; push those items again next time.
+    # A finished option removed every issue of its kinds; a partly failed one only the keys it lists
+    deleted_kinds = {
+        kind
+        for success in results['success'] if success['count']
+        for kind in PUSHED_KINDS_BY_OPTION.get(success['option'], ())
+    }
+    deleted_keys = {
+        issue_key
+        for error in results['errors'] if error.get('count')
+        for issue_key in error.get('deleted_keys', [])
+    }
+    if deleted_kinds or deleted_keys:
+        get_push_journal(project_key).clear(deleted_kinds, deleted_keys)
+        clear_snapshot(project_key, deleted_kinds, deleted_keys)
+    
     # Display results
     progress_bar.progress(1.0)
     status_text.text("Cleanup completed!")
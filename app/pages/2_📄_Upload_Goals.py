@@ -17,7 +17,8 @@ from components.sidebar import render_sidebar, render_page_header, render_progre
 from components.file_uploader import render_file_uploader
 from agents.goal_validator import GoalValidatorAgent
 from utils.file_handlers import DocumentProcessor
-from utils.config import get_file_upload_config, save_session_data, load_session_data, load_config
+from utils.analysis_cache import get_goal_analysis_cache
+from utils.config import get_file_upload_config, save_session_data, load_session_data, load_config, simulate_agent_delays
 import openai
 import io
 from docx import Document
@@ -152,12 +153,16 @@ def process_with_ai_agent(text_content: str, filename: str):
     st.markdown("#### 🤖 AI Agent Analysis")
     
     # Initialize Goal Validator Agent
-    goal_agent = GoalValidatorAgent()
+    goal_agent = GoalValidatorAgent(
+        simulate_delay=simulate_agent_delays(),
+        analysis_cache=get_goal_analysis_cache()
+    )
     
     with st.spinner("AI agent is analyzing your goals..."):
         try:
             # Simulate agent processing time
-            time.sleep(2)
+            if goal_agent.simulate_delay:
+                time.sleep(2)
             
             # Process goals with AI agent
             analysis_result = goal_agent.validate_goals(text_content)
@@ -283,6 +288,9 @@ def edit_goals_interface(goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     edited_goals = []
     
+    # Edited goals are rescored; unchanged text is served from the analysis cache
+    goal_agent = GoalValidatorAgent(analysis_cache=get_goal_analysis_cache())
+    
     st.info("Review and edit the AI-improved goals below. You can modify the text to better match your requirements.")
     
     for i, goal in enumerate(goals):
@@ -298,6 +306,12 @@ def edit_goals_interface(goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             key=f"goal_edit_{i}"
         )
         
+        # Rescore the goal only when its text was changed
+        assessment = goal
+        if edited_text.strip() and edited_text != improved_text:
+            assessment = goal_agent.analyze_goal(edited_text, i + 1)
+            st.caption(f"SMART score after edits: {assessment['smart_score']}%")
+        
         # Additional metadata
         col1, col2 = st.columns(2)
         
@@ -324,9 +338,9 @@ def edit_goals_interface(goals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             'priority': priority,
             'category': category,
             'original_text': goal.get('original_text', ''),
-            'smart_assessment': goal.get('smart_assessment', {}),
-            'issues': goal.get('issues', []),
-            'recommendations': goal.get('recommendations', [])
+            'smart_assessment': assessment.get('smart_assessment', {}),
+            'issues': assessment.get('issues', []),
+            'recommendations': assessment.get('recommendations', [])
         }
         
         edited_goals.append(edited_goal)
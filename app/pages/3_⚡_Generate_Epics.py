@@ -17,7 +17,9 @@ sys.path.insert(0, str(app_dir))
 
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from agents.epic_generator import EpicGeneratorAgent
-from utils.config import load_session_data, save_session_data, load_config
+from utils.id_allocator import get_id_allocator
+from utils.template_registry import get_template_registry
+from utils.config import load_session_data, save_session_data, load_config, simulate_agent_delays
 import openai
 
 # Page configuration
@@ -125,13 +127,49 @@ def generate_epics_and_features(goals: List[Dict[str, Any]]):
     # Update workflow status
     update_workflow_status('epic_generation', 'progress')
     
+    status_text = st.empty()
+    progress_bar = st.progress(0.0)
+    table_placeholder = st.empty()
+    
     with st.spinner("Epic Generator Agent is analyzing your goals and creating Epics & Features..."):
         try:
             # Initialize Epic Generator Agent
-            epic_agent = EpicGeneratorAgent()
+            epic_agent = EpicGeneratorAgent(
+                simulate_delay=simulate_agent_delays(),
+                id_allocator=get_id_allocator(),
+                template_registry=get_template_registry()
+            )
+            
+            # Show each Epic as soon as it is generated; rows are appended to one table element
+            generated_epics = []
+            summary = None
+            live_table = table_placeholder.dataframe(
+                pd.DataFrame(columns=['Epic', 'Priority', 'Features', 'Story Points']),
+                use_container_width=True,
+                hide_index=True
+            )
+            
+            for epic, summary in epic_agent.iter_epics(goals):
+                generated_epics.append(epic)
+                live_table.add_rows(pd.DataFrame([{
+                    'Epic': epic['title'],
+                    'Priority': epic['priority'],
+                    'Features': epic['feature_count'],
+                    'Story Points': epic['total_effort']
+                }]))
+                
+                progress_bar.progress(summary['total_epics'] / len(goals))
+                status_text.text(
+                    f"Generated {summary['total_epics']} of {len(goals)} Epics "
+                    f"({summary['total_features']} Features, {summary['total_effort_points']} points)"
+                )
+            
+            result = epic_agent.build_result(generated_epics, summary)
             
-            # Generate epics and features
-            result = epic_agent.generate_epics_and_features(goals)
+            # Clear the live view; the full results are displayed below
+            status_text.empty()
+            progress_bar.empty()
+            table_placeholder.empty()
             
             # Save results
             save_session_data('generated_epics', result)
@@ -8,7 +8,9 @@ import sys
 import time
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add the app directory to Python path for imports
 app_dir = Path(__file__).parent.parent
@@ -16,152 +18,100 @@ sys.path.insert(0, str(app_dir))
 
 from components.sidebar import render_sidebar, render_page_header, render_progress_indicator, update_workflow_status
 from utils.config import load_session_data, save_session_data, load_config
+from utils.push_scheduler import PushTask, run_push_tasks
+from utils.push_journal import PushJournal, get_push_journal
+from utils.issue_cache import get_issue_cache
+from utils.issue_records import parse_issue_page
+from utils.push_diff import (
+    iter_plan_items, plan_item_id, build_snapshot, diff_against_snapshot, jira_update_fields,
+    apply_results_to_snapshot, load_snapshot, save_snapshot
+)
 
-# MCP tool integration - connects to standalone MCP server
-def use_mcp_tool(server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Interface to MCP tools - connects to standalone MCP Atlassian server
-    """
-    import requests
-    import json
+def call_mcp_tools_concurrently(calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Send a batch of MCP tool calls over one pooled session with a bounded in-flight window"""
+    from utils.mcp_client import get_mcp_client
     
-    # MCP server configuration - try multiple possible URLs
     config = load_config()
-    possible_urls = [
-        config.get('jira_mcp_server_url', 'http://localhost:3000'),
-        "http://localhost:3000",
-        "http://localhost:3000:3000", 
-        "http://localhost:9000",
-        "http://127.0.0.1:3000"
-    ]
-    
-    # Try different endpoint paths
-    endpoint_paths = ["/mcp", "/sse", "", "/api"]
-    
-    last_error = None
-    
-    for base_url in possible_urls:
-        for endpoint in endpoint_paths:
-            mcp_server_url = f"{base_url.rstrip('/')}{endpoint}"
-            
-            try:
-                # Prepare the MCP request payload (JSON-RPC 2.0 format)
-                mcp_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments
-                    }
-                }
-                
-                # Make HTTP request to MCP server
-                response = requests.post(
-                    mcp_server_url,
-                    json=mcp_payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json"
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    st.info(f"✅ Connected to MCP server at: {mcp_server_url}")
-                    return result.get("result", result)
-                else:
-                    last_error = f"MCP server at {mcp_server_url} returned status {response.status_code}: {response.text}"
-                    
-            except requests.exceptions.ConnectionError as e:
-                last_error = f"Cannot connect to MCP server at {mcp_server_url}"
-                continue
-            except requests.exceptions.Timeout:
-                last_error = f"MCP server request timed out at {mcp_server_url}"
-                continue
-            except Exception as e:
-                last_error = f"MCP server error at {mcp_server_url}: {str(e)}"
-                continue
-    
-    # If we get here, none of the URLs worked
-    raise Exception(f"Could not connect to MCP server. Tried URLs: {possible_urls}. Last error: {last_error}")
-
-def call_jira_mcp_server(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return get_mcp_client().call_tools_concurrently(
+        calls, max_in_flight=config.get('max_concurrent_api_calls', 5)
+    )
+
+def run_mcp_push_tasks(tasks: List[PushTask]):
     """
-    Call the actual JIRA MCP server to perform JIRA operations using our MCP client
+    Run push tasks over MCP, one in-flight window of calls per batch
+
+    Each batch finishes (and its creates are journaled) before the next one
+    is sent, so a large DAG level never waits on a single long batch.
     """
-    try:
-        # Import our MCP client
-        from utils.mcp_client import get_mcp_client
-        
-        st.info(f"🔄 Making MCP call to JIRA server: {tool_name}")
-        
-        # Get the MCP client
-        mcp_client = get_mcp_client()
+    config = load_config()
+    return run_push_tasks(tasks, call_mcp_tools_concurrently, max_batch=config.get('max_concurrent_api_calls', 5))
+
+def mcp_call(tool_name: str, arguments: Dict[str, Any]):
+    """Push task step: have the scheduler make one MCP tool call, then parse its response"""
+    return parse_mcp_response((yield tool_name, arguments))
+
+def parse_mcp_response(mcp_response: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract JIRA issue information from a raw MCP tool response"""
+    # Process the MCP response
+    if mcp_response and mcp_response.get('success'):
+        # Successful response - extract JIRA issue information from the result
+        result_content = mcp_response.get('result', {}).get('content', [])
         
-        # Make the MCP call using our client
-        mcp_response = mcp_client.call_tool(tool_name, arguments)
+        if mcp_response.get('result', {}).get('isError'):
+            # The tool ran but reported a failure (e.g. JIRA rejected the request)
+            return {
+                'success': False,
+                'error': ' '.join(item.get('text', '') for item in result_content) or 'MCP tool error',
+                'mcp_response': mcp_response
+            }
         
-        # Process the MCP response
-        if mcp_response and mcp_response.get('success'):
-            # Successful response - extract JIRA issue information from the result
-            result_content = mcp_response.get('result', {}).get('content', [])
+        if result_content and len(result_content) > 0:
+            # Parse the response text to extract issue details
+            response_text = result_content[0].get('text', '')
             
-            if result_content and len(result_content) > 0:
-                # Parse the response text to extract issue details
-                response_text = result_content[0].get('text', '')
+            try:
+                import json
+                # Try to parse as JSON
+                issue_data = json.loads(response_text)
                 
-                try:
-                    import json
-                    # Try to parse as JSON
-                    issue_data = json.loads(response_text)
-                    
-                    if 'issue' in issue_data:
-                        issue = issue_data['issue']
-                        return {
-                            'success': True,
-                            'key': issue.get('key'),
-                            'id': issue.get('id'),
-                            'url': issue.get('url'),
-                            'self': issue.get('url'),  # Use URL as self reference
-                            'fields': issue,
-                            'mcp_response': mcp_response
-                        }
-                    else:
-                        # Fallback parsing
-                        return {
-                            'success': True,
-                            'raw_response': response_text,
-                            'mcp_response': mcp_response
-                        }
-                        
-                except json.JSONDecodeError:
-                    # If not JSON, treat as success with raw text
+                if 'issue' in issue_data:
+                    issue = issue_data['issue']
+                    return {
+                        'success': True,
+                        'key': issue.get('key'),
+                        'id': issue.get('id'),
+                        'url': issue.get('url'),
+                        'self': issue.get('url'),  # Use URL as self reference
+                        'fields': issue,
+                        'mcp_response': mcp_response
+                    }
+                else:
+                    # Fallback parsing
                     return {
                         'success': True,
                         'raw_response': response_text,
                         'mcp_response': mcp_response
                     }
-            else:
+                    
+            except json.JSONDecodeError:
+                # If not JSON, treat as success with raw text
                 return {
                     'success': True,
+                    'raw_response': response_text,
                     'mcp_response': mcp_response
                 }
         else:
-            # MCP call failed
-            error_msg = mcp_response.get('error', 'Unknown MCP error') if mcp_response else 'No response from MCP server'
             return {
-                'success': False,
-                'error': error_msg,
+                'success': True,
                 'mcp_response': mcp_response
             }
-            
-    except Exception as e:
-        # MCP client error
+    else:
+        # MCP call failed
+        error_msg = mcp_response.get('error', 'Unknown MCP error') if mcp_response else 'No response from MCP server'
         return {
             'success': False,
-            'error': f'MCP client error: {str(e)}'
+            'error': error_msg,
+            'mcp_response': mcp_response
         }
 
 # Page configuration
@@ -306,6 +256,11 @@ def display_review_interface(generated_epics: Dict[str, Any]):
         if st.button("🚀 Push to JIRA", use_container_width=True, type="primary"):
             push_to_jira(edited_epics, project_key, issue_type_epic, push_epics_only, dry_run)
     
+    # Incremental sync of edits made after a previous push
+    snapshot = load_snapshot(project_key)
+    if snapshot:
+        display_sync_interface(edited_epics, snapshot, project_key, issue_type_epic)
+    
     # Navigation buttons
     st.markdown("---")
     col1, col2 = st.columns(2)
@@ -454,6 +409,390 @@ def display_editable_epics(generated_epics: Dict[str, Any]) -> Dict[str, Any]:
         }
     }
 
+# Reported for creates that may have succeeded but whose key the MCP server did not return
+UNVERIFIED_CREATE_ERROR = (
+    "The create may have succeeded but no issue key came back (e.g. the call timed out); "
+    "the next push looks the issue up in JIRA before creating it again"
+)
+
+# Journaled keys checked per jira_search call (the MCP server's page size)
+JOURNAL_VERIFY_CHUNK_SIZE = 50
+
+# JIRA's own errors for issues that do not exist (or that the user cannot see)
+MISSING_ISSUE_MESSAGE = 'issue does not exist or you do not have permission to see it'
+MISSING_KEY_PATTERN = re.compile(r"An issue with key '([A-Z][A-Z0-9_]*-\d+)' does not exist for field 'key'")
+
+def jira_tool_error(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Error text of a tool call that reached JIRA and was rejected by it
+
+    None for successes and for transport or MCP errors (unreachable server,
+    proxy errors, unknown tools), which say nothing about the issue itself.
+    """
+    raw = response.get('mcp_response') or {}
+    if response.get('success') or not raw.get('success') or not raw.get('result', {}).get('isError'):
+        return None
+    return str(response.get('error', ''))
+
+def is_missing_issue_response(response: Dict[str, Any]) -> bool:
+    """True only when JIRA itself answered that the requested issue does not exist"""
+    error = jira_tool_error(response)
+    return error is not None and MISSING_ISSUE_MESSAGE in error.lower()
+
+def created_issue_key(mcp_response: Dict[str, Any], project_key: str) -> Optional[str]:
+    """Key of the issue a create call made, parsed from the text when the server did not answer JSON"""
+    if not mcp_response or not mcp_response.get('success'):
+        return None
+    if mcp_response.get('key'):
+        return mcp_response['key']
+    match = re.search(rf"\b{re.escape(project_key)}-\d+\b", mcp_response.get('raw_response', ''))
+    return match.group(0) if match else None
+
+def create_may_have_applied(mcp_response: Dict[str, Any]) -> bool:
+    """True when a create call that returned no key may still have created the issue"""
+    if mcp_response.get('success'):
+        return True
+    # Timed out after the request was sent: JIRA may have processed it
+    return bool((mcp_response.get('mcp_response') or {}).get('timed_out'))
+
+def search_records(response: Dict[str, Any]):
+    """Issue records from a successful jira_search response"""
+    records, _ = parse_issue_page(response['mcp_response']['result'])
+    return records
+
+def plan_journal_keys(edited_epics: Dict[str, Any], project_key: str, issue_type_epic: str) -> Dict[str, str]:
+    """Journal key of every Epic and Feature in the plan, by plan item ID"""
+    journal_keys = {}
+    for kind, item_id, epic_id, item, _ in iter_plan_items(edited_epics):
+        if kind == 'epic':
+            journal_keys[item_id] = PushJournal.item_key(issue_type_epic, project_key, item_id, item)
+        else:
+            # Features are journaled under their Epic's key
+            journal_keys[item_id] = PushJournal.item_key('Story', project_key, item_id, item, journal_keys[epic_id])
+    return journal_keys
+
+def verify_journaled_keys(jira_keys: List[str]):
+    """
+    Find which of jira_keys no longer exist, with one jira_search (a push task body)
+
+    JIRA rejects a `key in (...)` query naming a deleted issue and lists each
+    such key in its error; those keys are set aside and the rest searched
+    again. Any other error fails the check.
+    """
+    remaining = list(jira_keys)
+    missing = []
+    
+    while remaining:
+        response = yield from mcp_call('jira_search', {
+            'jql': f"key in ({', '.join(remaining)})",
+            'fields': 'summary',
+            'limit': len(remaining)
+        })
+        if response.get('success'):
+            found = {record.key for record in search_records(response)}
+            missing.extend(key for key in remaining if key not in found)
+            break
+        
+        absent = set(MISSING_KEY_PATTERN.findall(jira_tool_error(response) or '')) & set(remaining)
+        if not absent:
+            return {'success': False, 'error': response.get('error', 'Unknown error')}
+        missing.extend(key for key in remaining if key in absent)
+        remaining = [key for key in remaining if key not in absent]
+    
+    return {'success': True, 'missing': missing}
+
+def check_journal(journal: PushJournal, journal_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Journal entries a push can resume from, by journal key
+
+    Journaled JIRA keys are verified with one jira_search per chunk of
+    JOURNAL_VERIFY_CHUNK_SIZE instead of one lookup per item. Entries whose
+    issue was deleted are left out, so the item is created again. Entries in
+    a chunk that could not be verified carry the error in 'verify_error', so
+    their items fail without being created twice. Unverified entries (no
+    key) are returned as they are and looked up by their own push task.
+    """
+    entries = {}
+    for journal_key in journal_keys:
+        entry = journal.get(journal_key)
+        if entry:
+            entries[journal_key] = entry
+    
+    jira_keys = sorted({entry['jira_key'] for entry in entries.values() if entry['jira_key']})
+    chunks = {
+        f"verify-{start}": jira_keys[start:start + JOURNAL_VERIFY_CHUNK_SIZE]
+        for start in range(0, len(jira_keys), JOURNAL_VERIFY_CHUNK_SIZE)
+    }
+    tasks = [
+        PushTask(task_id=task_id, run=lambda deps, chunk=chunk: verify_journaled_keys(chunk))
+        for task_id, chunk in chunks.items()
+    ]
+    
+    missing = set()
+    verify_errors = {}
+    for task, result in run_mcp_push_tasks(tasks):
+        if result.get('success'):
+            missing.update(result['missing'])
+        else:
+            for jira_key in chunks[task.task_id]:
+                verify_errors[jira_key] = (
+                    f"Could not check that {jira_key} from an earlier push still exists: "
+                    f"{result.get('error', 'Unknown error')}"
+                )
+    
+    resume = {}
+    for journal_key, entry in entries.items():
+        if entry['jira_key'] in missing:
+            continue
+        if entry['jira_key'] in verify_errors:
+            entry = {**entry, 'verify_error': verify_errors[entry['jira_key']]}
+        resume[journal_key] = entry
+    return resume
+
+def resolve_unverified_push(journal: PushJournal, journal_key: str, entry: Dict[str, Any],
+                            project_key: str, issue_type: str):
+    """
+    Find the issue an unverified create may have made (a push task step)
+
+    Searches the project for issues of the item's type with exactly its
+    summary, created since the day before the create. The newest match is
+    journaled and returned. With no match the create did not happen and None
+    is returned, so the item is created again.
+    """
+    summary = entry['title']
+    created_since = (datetime.fromisoformat(entry['created_at']) - timedelta(days=1)).strftime('%Y-%m-%d')
+    search_text = summary.replace('\\', '\\\\').replace('"', '\\"')
+    
+    response = yield from mcp_call('jira_search', {
+        'jql': (
+            f'project = {project_key} AND issuetype = "{issue_type}" AND summary ~ "{search_text}" '
+            f'AND created >= "{created_since}" ORDER BY created DESC'
+        ),
+        'fields': 'summary',
+        'limit': JOURNAL_VERIFY_CHUNK_SIZE
+    })
+    if not response.get('success'):
+        return {
+            **entry,
+            'verify_error': f"Could not look up '{summary}' from an earlier push: {response.get('error', 'Unknown error')}"
+        }
+    
+    matches = [record.key for record in search_records(response) if record.summary == summary]
+    if not matches:
+        return None
+    
+    journal.record(journal_key, entry['kind'], {'id': entry['id'], 'title': summary}, matches[0])
+    return journal.get(journal_key)
+
+def journaled_result(already_pushed: Dict[str, Any], jira_server: str) -> Dict[str, Any]:
+    """Result for an item the journal shows was already pushed"""
+    if already_pushed.get('verify_error'):
+        return {'jira_key': None, 'status': 'mcp_failed', 'error': already_pushed['verify_error']}
+    return {
+        'jira_key': already_pushed['jira_key'],
+        'status': 'created',
+        'resumed': True,
+        'url': already_pushed.get('url') or f"{jira_server}/browse/{already_pushed['jira_key']}"
+    }
+
+def get_journaled_push(journal: PushJournal, resume: Dict[str, Dict[str, Any]], journal_key: str,
+                       project_key: str, issue_type: str):
+    """
+    Return the journal entry to resume an item from, or None to create it (a push task step)
+
+    resume comes from check_journal. An unverified entry is looked up in JIRA
+    first, so it only blocks the item (and its Features) until that lookup
+    settles whether the earlier create happened.
+    """
+    already_pushed = resume.get(journal_key)
+    if already_pushed and not already_pushed['jira_key'] and not already_pushed.get('verify_error'):
+        already_pushed = yield from resolve_unverified_push(journal, journal_key, already_pushed, project_key, issue_type)
+    return already_pushed
+
+def push_epic(epic: Dict[str, Any], project_key: str, issue_type_epic: str, preview_key: str,
+              dry_run: bool, jira_server: str, journal: PushJournal, resume: Dict[str, Dict[str, Any]],
+              journal_key: str) -> Dict[str, Any]:
+    """
+    Create (or preview) a single Epic in JIRA, skipping it if the journal shows it was already pushed
+    
+    A push task body: MCP calls are yielded to the push scheduler. resume
+    holds the checked journal entries (see check_journal).
+    """
+    if dry_run:
+        # Dry run - just preview
+        return {
+            'id': epic.get('id', ''),
+            'title': epic.get('title', ''),
+            'jira_key': preview_key,
+            'status': 'preview',
+            'url': f"https://demo.atlassian.net/browse/{preview_key}"
+        }
+    
+    already_pushed = yield from get_journaled_push(journal, resume, journal_key, project_key, issue_type_epic)
+    if already_pushed:
+        return {
+            'id': epic.get('id', ''),
+            'title': epic.get('title', ''),
+            **journaled_result(already_pushed, jira_server)
+        }
+    
+    # Prepare MCP call arguments (using correct parameter names)
+    mcp_call_args = {
+        'project_key': project_key,
+        'issue_type': issue_type_epic,
+        'summary': epic.get('title', ''),
+        'description': epic.get('description', '')
+    }
+    
+    mcp_response = yield from mcp_call('jira_create_issue', mcp_call_args)
+    
+    jira_key = created_issue_key(mcp_response, project_key)
+    if jira_key:
+        url = mcp_response.get('url') or f"{jira_server}/browse/{jira_key}"
+        journal.record(journal_key, 'epic', epic, jira_key, url)
+        return {
+            'id': epic.get('id', ''),
+            'title': epic.get('title', ''),
+            'jira_key': jira_key,
+            'status': 'created',
+            'url': url,
+            'mcp_response': mcp_response
+        }
+    
+    if create_may_have_applied(mcp_response):
+        # The issue may well exist; journal it so a retry does not create it twice
+        journal.record(journal_key, 'epic', epic, None)
+        return {
+            'id': epic.get('id', ''),
+            'title': epic.get('title', ''),
+            'jira_key': None,
+            'status': 'unverified',
+            'error': UNVERIFIED_CREATE_ERROR,
+            'mcp_response': mcp_response
+        }
+    
+    error_msg = mcp_response.get('error', 'No issue key returned by MCP server') if mcp_response else 'No response from MCP server'
+    return {
+        'id': epic.get('id', ''),
+        'title': epic.get('title', ''),
+        'jira_key': preview_key,
+        'status': 'mcp_failed',
+        'url': f"{jira_server}/browse/{preview_key}",
+        'mcp_call': mcp_call_args,
+        'error': error_msg
+    }
+
+def push_feature(feature: Dict[str, Any], epic_result: Dict[str, Any], project_key: str, preview_key: str,
+                 dry_run: bool, jira_server: str, journal: PushJournal, resume: Dict[str, Dict[str, Any]],
+                 journal_key: str) -> Dict[str, Any]:
+    """
+    Create (or preview) a single Feature as a Story linked to its Epic, skipping it if already pushed
+    
+    A push task body: MCP calls are yielded to the push scheduler. resume
+    holds the checked journal entries (see check_journal).
+    """
+    feature_result = {
+        'id': feature.get('id', ''),
+        'title': feature.get('title', ''),
+        'epic_key': epic_result['jira_key']
+    }
+    
+    if dry_run:
+        # Dry run - just preview
+        return {
+            **feature_result,
+            'jira_key': preview_key,
+            'status': 'preview',
+            'url': f"https://demo.atlassian.net/browse/{preview_key}"
+        }
+    
+    already_pushed = yield from get_journaled_push(journal, resume, journal_key, project_key, 'Story')
+    if already_pushed:
+        return {**feature_result, **journaled_result(already_pushed, jira_server)}
+    
+    if epic_result.get('status') != 'created':
+        return {
+            **feature_result,
+            'jira_key': None,
+            'status': 'skipped',
+            'error': f"Epic '{epic_result.get('title', '')}' was not created"
+        }
+    
+    mcp_response = yield from mcp_call('jira_create_issue', {
+        'project_key': project_key,
+        'issue_type': 'Story',
+        'summary': feature.get('title', ''),
+        'description': feature.get('description', ''),
+        'additional_fields': {
+            'parent': epic_result['jira_key'],
+            'priority': {'name': feature.get('priority', 'Medium')}
+        }
+    })
+    
+    jira_key = created_issue_key(mcp_response, project_key)
+    if jira_key:
+        url = mcp_response.get('url') or f"{jira_server}/browse/{jira_key}"
+        journal.record(journal_key, 'feature', feature, jira_key, url)
+        return {
+            **feature_result,
+            'jira_key': jira_key,
+            'status': 'created',
+            'url': url
+        }
+    
+    if create_may_have_applied(mcp_response):
+        # The issue may well exist; journal it so a retry does not create it twice
+        journal.record(journal_key, 'feature', feature, None)
+        return {
+            **feature_result,
+            'jira_key': None,
+            'status': 'unverified',
+            'error': UNVERIFIED_CREATE_ERROR
+        }
+    
+    return {
+        **feature_result,
+        'jira_key': None,
+        'status': 'mcp_failed',
+        'error': mcp_response.get('error', 'No issue key returned by MCP server') if mcp_response else 'No response from MCP server'
+    }
+
+def build_push_tasks(epics: List[Dict[str, Any]], project_key: str, issue_type_epic: str,
+                     push_epics_only: bool, dry_run: bool, jira_server: str,
+                     journal: PushJournal, journal_keys: Dict[str, str],
+                     resume: Dict[str, Dict[str, Any]]) -> List[PushTask]:
+    """Build the push DAG: every Feature depends on the Epic that owns it"""
+    tasks = []
+    feature_number = 0
+    
+    for i, epic in enumerate(epics):
+        epic_task_id = f"epic-{i}"
+        tasks.append(PushTask(
+            task_id=epic_task_id,
+            run=lambda deps, epic=epic, preview_key=f"{project_key}-{101 + i}",
+                       journal_key=journal_keys[plan_item_id('epic', epic, str(i))]: push_epic(
+                epic, project_key, issue_type_epic, preview_key, dry_run, jira_server, journal, resume, journal_key
+            )
+        ))
+        
+        if push_epics_only:
+            continue
+        
+        for j, feature in enumerate(epic.get('features', [])):
+            feature_number += 1
+            tasks.append(PushTask(
+                task_id=f"feature-{i}-{j}",
+                run=lambda deps, feature=feature, epic_task_id=epic_task_id,
+                           preview_key=f"{project_key}-{200 + feature_number}",
+                           journal_key=journal_keys[plan_item_id('feature', feature, f"{i}-{j}")]: push_feature(
+                    feature, deps[epic_task_id], project_key, preview_key, dry_run, jira_server,
+                    journal, resume, journal_key
+                ),
+                depends_on=(epic_task_id,)
+            ))
+    
+    return tasks
+
 def push_to_jira(edited_epics: Dict[str, Any], project_key: str, issue_type_epic: str, push_epics_only: bool, dry_run: bool):
     """Push epics and features to JIRA using MCP server"""
     
@@ -477,176 +816,49 @@ def push_to_jira(edited_epics: Dict[str, Any], project_key: str, issue_type_epic
     status_text = st.empty()
     
     try:
-        epics = edited_epics.get('epics', [])
-        total_items = len(epics)
-        if not push_epics_only:
-            total_items += sum(len(epic.get('features', [])) for epic in epics)
-        
-        current_item = 0
-        
-        # Push Epics
-        for epic in epics:
-            current_item += 1
-            progress = current_item / total_items
-            progress_bar.progress(progress)
-            status_text.text(f"Processing Epic: {epic.get('title', 'Untitled')[:50]}...")
+        config = load_config()
+        jira_server = config.get('jira_server', 'https://your-jira.atlassian.net')
+        
+        # Items recorded in the journal by an earlier (possibly interrupted) push are skipped
+        journal = get_push_journal(project_key)
+        journal_keys = plan_journal_keys(edited_epics, project_key, issue_type_epic)
+        if dry_run:
+            resume = {}
+        else:
+            status_text.text("Checking items from earlier pushes...")
+            resume = check_journal(journal, list(journal_keys.values()))
+        tasks = build_push_tasks(
+            edited_epics.get('epics', []), project_key, issue_type_epic,
+            push_epics_only, dry_run, jira_server, journal, journal_keys, resume
+        )
+        
+        # Epics go out in bounded concurrent MCP batches; each Feature follows once its Epic's key is known
+        results = {}
+        for task, result in run_mcp_push_tasks(tasks):
+            results[task.task_id] = result
+            progress_bar.progress(len(results) / len(tasks))
             
-            # Simulate processing time
-            time.sleep(1)
+            kind = 'Epic' if task.task_id.startswith('epic-') else 'Feature'
+            status_text.text(f"Processed {kind}: {result.get('title', 'Untitled')[:50]} ({len(results)}/{len(tasks)})")
             
-            if dry_run:
-                # Dry run - just preview
-                epic_result = {
-                    'id': epic.get('id', ''),
-                    'title': epic.get('title', ''),
-                    'jira_key': f"{project_key}-{100 + current_item}",
-                    'status': 'preview',
-                    'url': f"https://demo.atlassian.net/browse/{project_key}-{100 + current_item}"
-                }
+            if result.get('resumed'):
+                push_results['resumed_count'] = push_results.get('resumed_count', 0) + 1
+            elif result.get('status') == 'created' and kind == 'Epic':
+                st.success(f"✅ Epic created in JIRA: {result['jira_key']}")
+            elif result.get('error'):
+                st.error(f"❌ {kind} '{result.get('title', 'Untitled')}' failed: {result['error']}")
+                push_results['errors'].append(f"{kind} '{result.get('title', 'Untitled')}': {result['error']}")
+        
+        # Report in the original Epic/Feature order rather than completion order
+        for task in tasks:
+            if task.task_id.startswith('epic-'):
+                push_results['pushed_epics'].append(results[task.task_id])
             else:
-                # Use JIRA MCP server to create Epic
-                try:
-                    st.info(f"🔄 Creating Epic via JIRA MCP server: {epic.get('title', '')}")
-                    
-                    # Prepare MCP call arguments (using correct parameter names)
-                    mcp_call_args = {
-                        'project_key': project_key,
-                        'issue_type': issue_type_epic,
-                        'summary': epic.get('title', ''),
-                        'description': epic.get('description', '')
-                    }
-                    
-                    # Attempt to make the actual MCP call
-                    mcp_response = call_jira_mcp_server(
-                        tool_name='jira_create_issue',
-                        arguments=mcp_call_args
-                    )
-                    
-                    if mcp_response and mcp_response.get('success'):
-                        # Successful MCP call
-                        config = load_config()
-                        epic_result = {
-                            'id': epic.get('id', ''),
-                            'title': epic.get('title', ''),
-                            'jira_key': mcp_response.get('key', f"{project_key}-{100 + current_item}"),
-                            'status': 'created',
-                            'url': mcp_response.get('url', f"{config.get('jira_server')}/browse/{mcp_response.get('key')}"),
-                            'mcp_response': mcp_response
-                        }
-                        
-                        st.success(f"✅ Epic created in JIRA: {mcp_response.get('key')}")
-                        st.info(f"🔗 View at: {mcp_response.get('self', 'N/A')}")
-                        
-                    else:
-                        # MCP call failed
-                        config = load_config()
-                        error_msg = mcp_response.get('error', 'Unknown MCP error') if mcp_response else 'No response from MCP server'
-                        epic_key = f"{project_key}-{100 + current_item}"
-                        epic_result = {
-                            'id': epic.get('id', ''),
-                            'title': epic.get('title', ''),
-                            'jira_key': epic_key,
-                            'status': 'mcp_failed',
-                            'url': f"{config.get('jira_server', 'https://your-jira.atlassian.net')}/browse/{epic_key}",
-                            'error': error_msg
-                        }
-                        
-                        st.error(f"❌ MCP call failed: {error_msg}")
-                        
-                except Exception as mcp_error:
-                    # MCP server not available or other error
-                    config = load_config()
-                    epic_key = f"{project_key}-{100 + current_item}"
-                    epic_result = {
-                        'id': epic.get('id', ''),
-                        'title': epic.get('title', ''),
-                        'jira_key': epic_key,
-                        'status': 'mcp_unavailable',
-                        'url': f"{config.get('jira_server', 'https://your-jira.atlassian.net')}/browse/{epic_key}",
-                        'mcp_call': mcp_call_args,
-                        'error': str(mcp_error)
-                    }
-                    
-                    st.warning(f"⚠️ MCP server not available: {str(mcp_error)}")
-                    st.info("💡 **Note**: To enable real JIRA creation, ensure your JIRA MCP server is running and connected.")
-                    
-                    # Show what the MCP call would look like
-                    st.code(f"""
-# MCP Call that would be executed:
-use_mcp_tool(
-    server_name='jira',
-    tool_name='create_issue',
-    arguments={mcp_call_args}
-)
-                    """, language='python')
-            
-            push_results['pushed_epics'].append(epic_result)
-            
-            # Push Features for this Epic (if not epics only)
-            if not push_epics_only:
-                for feature in epic.get('features', []):
-                    current_item += 1
-                    progress = current_item / total_items
-                    progress_bar.progress(progress)
-                    status_text.text(f"Processing Feature: {feature.get('title', 'Untitled')[:50]}...")
-                    
-                    # Simulate processing time
-                    time.sleep(0.5)
-                    
-                    if dry_run:
-                        # Dry run - just preview
-                        feature_result = {
-                            'id': feature.get('id', ''),
-                            'title': feature.get('title', ''),
-                            'jira_key': f"{project_key}-{200 + current_item}",
-                            'epic_key': epic_result['jira_key'],
-                            'status': 'preview',
-                            'url': f"https://demo.atlassian.net/browse/{project_key}-{200 + current_item}"
-                        }
-                    else:
-                        # Use JIRA MCP server to create Story
-                        try:
-                            # Create Story using MCP
-                            story_response = st.session_state.get('mcp_client', {}).get('jira', {}).create_issue(
-                                project=project_key,
-                                issueType='Story',
-                                summary=feature.get('title', ''),
-                                description=feature.get('description', ''),
-                                priority=feature.get('priority', 'Medium')
-                            )
-                            
-                            if story_response and story_response.get('success'):
-                                feature_result = {
-                                    'id': feature.get('id', ''),
-                                    'title': feature.get('title', ''),
-                                    'jira_key': story_response.get('key', f"{project_key}-{200 + current_item}"),
-                                    'epic_key': epic_result['jira_key'],
-                                    'status': 'created',
-                                    'url': story_response.get('url', f"https://demo.atlassian.net/browse/{story_response.get('key')}")
-                                }
-                            else:
-                                # Fallback to mock
-                                feature_result = {
-                                    'id': feature.get('id', ''),
-                                    'title': feature.get('title', ''),
-                                    'jira_key': f"{project_key}-{200 + current_item}",
-                                    'epic_key': epic_result['jira_key'],
-                                    'status': 'mock_created',
-                                    'url': f"https://demo.atlassian.net/browse/{project_key}-{200 + current_item}"
-                                }
-                                
-                        except Exception as mcp_error:
-                            # Fallback to mock if MCP server not available
-                            feature_result = {
-                                'id': feature.get('id', ''),
-                                'title': feature.get('title', ''),
-                                'jira_key': f"{project_key}-{200 + current_item}",
-                                'epic_key': epic_result['jira_key'],
-                                'status': 'mock_created',
-                                'url': f"https://demo.atlassian.net/browse/{project_key}-{200 + current_item}"
-                            }
-                    
-                    push_results['pushed_features'].append(feature_result)
+                push_results['pushed_features'].append(results[task.task_id])
+        
+        # Cached reads of this project are stale now
+        if not dry_run:
+            get_issue_cache().invalidate(f"project = {project_key}")
         
         # Complete
         progress_bar.progress(1.0)
@@ -655,6 +867,15 @@ use_mcp_tool(
         push_results['status'] = 'complete'
         push_results['completed_at'] = time.time()
         
+        # Remember what was pushed so later edits can be synced incrementally
+        if not dry_run:
+            jira_keys = {
+                item_id: results[f"{kind}-{position}"]['jira_key']
+                for kind, item_id, _, _, position in iter_plan_items(edited_epics)
+                if results.get(f"{kind}-{position}", {}).get('status') == 'created'
+            }
+            save_snapshot(project_key, {**load_snapshot(project_key), **build_snapshot(edited_epics, jira_keys)})
+        
         # Save results
         save_session_data('jira_push_status', push_results)
         
@@ -682,6 +903,183 @@ use_mcp_tool(
         update_workflow_status('jira_push', 'pending')
         st.error(f"Error pushing to JIRA: {str(e)}")
 
+def display_sync_interface(edited_epics: Dict[str, Any], snapshot: Dict[str, Dict[str, Any]],
+                           project_key: str, issue_type_epic: str):
+    """Show the changes since the last push and apply only those"""
+    
+    st.markdown("---")
+    st.markdown("### 🔁 Sync Changes to JIRA")
+    
+    include_deletes = st.checkbox(
+        "Delete JIRA issues removed from the plan",
+        value=False,
+        help="Epics and Features that were pushed earlier but are no longer in the plan will be deleted"
+    )
+    
+    operations = diff_against_snapshot(edited_epics, snapshot, include_deletes=include_deletes)
+    
+    if not operations:
+        st.success("✅ JIRA is up to date with the current plan")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("To Create", sum(1 for op in operations if op.action == 'create'))
+    with col2:
+        st.metric("To Update", sum(1 for op in operations if op.action == 'update'))
+    with col3:
+        st.metric("To Delete", sum(1 for op in operations if op.action == 'delete'))
+    
+    with st.expander("Preview changes", expanded=False):
+        for op in operations:
+            title = (op.item or {}).get('title', op.jira_key)
+            if op.action == 'update':
+                st.write(f"- **update** {op.jira_key} ({op.kind}): {', '.join(op.changes)}")
+            else:
+                st.write(f"- **{op.action}** {op.kind}: {title}")
+    
+    if st.button(f"🔁 Apply {len(operations)} Changes", use_container_width=True):
+        apply_push_operations(operations, edited_epics, snapshot, project_key, issue_type_epic)
+
+def update_or_recreate(op, snapshot: Dict[str, Dict[str, Any]], project_key: str, issue_type_epic: str,
+                       jira_server: str, journal: PushJournal, resume: Dict[str, Dict[str, Any]],
+                       journal_keys: Dict[str, str]) -> Dict[str, Any]:
+    """Apply an update operation, creating the item again if its JIRA issue was deleted (a push task body)"""
+    response = yield from mcp_call('jira_update_issue', {
+        'issue_key': op.jira_key,
+        'fields': jira_update_fields(op)
+    })
+    if not is_missing_issue_response(response):
+        return {**response, 'title': op.item.get('title', ''), 'jira_key': op.jira_key}
+    
+    if op.kind == 'epic':
+        return (yield from push_epic(
+            op.item, project_key, issue_type_epic, op.item_id, False, jira_server,
+            journal, resume, journal_keys[op.item_id]
+        ))
+    
+    epic_result = {
+        'title': op.epic_id,
+        'jira_key': snapshot.get(op.epic_id, {}).get('jira_key'),
+        'status': 'created' if op.epic_id in snapshot else 'missing'
+    }
+    return (yield from push_feature(
+        op.item, epic_result, project_key, op.item_id, False, jira_server,
+        journal, resume, journal_keys[op.item_id]
+    ))
+
+def delete_issue(jira_key: str):
+    """Delete one JIRA issue (a push task body)"""
+    response = yield from mcp_call('jira_delete_issue', {'issue_key': jira_key})
+    return {**response, 'title': jira_key, 'jira_key': None}
+
+def build_sync_tasks(operations, snapshot: Dict[str, Dict[str, Any]], project_key: str, issue_type_epic: str,
+                     jira_server: str, journal: PushJournal, journal_keys: Dict[str, str],
+                     resume: Dict[str, Dict[str, Any]]) -> List[PushTask]:
+    """Turn diff operations into push tasks, ordering creates and deletes by parent/child"""
+    tasks = []
+    create_epic_tasks = {}
+    delete_feature_tasks = {}
+    
+    for op in operations:
+        task_id = f"{op.action}-{op.item_id}"
+        
+        if op.action == 'update':
+            tasks.append(PushTask(
+                task_id=task_id,
+                run=lambda deps, op=op: update_or_recreate(
+                    op, snapshot, project_key, issue_type_epic, jira_server, journal, resume, journal_keys
+                )
+            ))
+        
+        elif op.action == 'delete':
+            depends_on = tuple(delete_feature_tasks.get(op.item_id, [])) if op.kind == 'epic' else ()
+            if op.kind == 'feature':
+                delete_feature_tasks.setdefault(op.epic_id, []).append(task_id)
+            tasks.append(PushTask(
+                task_id=task_id,
+                run=lambda deps, op=op: delete_issue(op.jira_key),
+                depends_on=depends_on
+            ))
+        
+        elif op.kind == 'epic':
+            create_epic_tasks[op.item_id] = task_id
+            tasks.append(PushTask(
+                task_id=task_id,
+                run=lambda deps, op=op: push_epic(
+                    op.item, project_key, issue_type_epic, op.item_id, False, jira_server,
+                    journal, resume, journal_keys[op.item_id]
+                )
+            ))
+        
+        else:
+            if op.epic_id in create_epic_tasks:
+                # New Feature under a new Epic: wait for the Epic's key
+                epic_task_id = create_epic_tasks[op.epic_id]
+                tasks.append(PushTask(
+                    task_id=task_id,
+                    run=lambda deps, op=op, epic_task_id=epic_task_id: push_feature(
+                        op.item, deps[epic_task_id], project_key, op.item_id, False, jira_server,
+                        journal, resume, journal_keys[op.item_id]
+                    ),
+                    depends_on=(epic_task_id,)
+                ))
+            else:
+                epic_result = {
+                    'title': op.epic_id,
+                    'jira_key': snapshot.get(op.epic_id, {}).get('jira_key'),
+                    'status': 'created' if op.epic_id in snapshot else 'missing'
+                }
+                tasks.append(PushTask(
+                    task_id=task_id,
+                    run=lambda deps, op=op, epic_result=epic_result: push_feature(
+                        op.item, epic_result, project_key, op.item_id, False, jira_server,
+                        journal, resume, journal_keys[op.item_id]
+                    )
+                ))
+    
+    return tasks
+
+def apply_push_operations(operations, edited_epics: Dict[str, Any], snapshot: Dict[str, Dict[str, Any]],
+                          project_key: str, issue_type_epic: str):
+    """Apply create/update/delete operations via MCP and record the new snapshot"""
+    
+    config = load_config()
+    jira_server = config.get('jira_server', 'https://your-jira.atlassian.net')
+    journal = get_push_journal(project_key)
+    journal_keys = plan_journal_keys(edited_epics, project_key, issue_type_epic)
+    resume = check_journal(journal, [journal_keys[op.item_id] for op in operations if op.action != 'delete'])
+    
+    operations_by_task = {f"{op.action}-{op.item_id}": op for op in operations}
+    tasks = build_sync_tasks(
+        operations, snapshot, project_key, issue_type_epic, jira_server, journal, journal_keys, resume
+    )
+    
+    progress_bar = st.progress(0)
+    applied = {}
+    errors = []
+    
+    for done, (task, result) in enumerate(run_mcp_push_tasks(tasks), 1):
+        progress_bar.progress(done / len(tasks))
+        op = operations_by_task[task.task_id]
+        
+        # Updates of deleted issues come back as creates with a new key
+        succeeded = result.get('status') == 'created' or (op.action != 'create' and result.get('success'))
+        if succeeded:
+            applied[op.item_id] = result.get('jira_key')
+        else:
+            errors.append(f"{op.action} {op.kind} '{result.get('title', op.item_id)}': {result.get('error', 'Unknown error')}")
+    
+    save_snapshot(project_key, apply_results_to_snapshot(snapshot, edited_epics, applied))
+    get_issue_cache().invalidate(f"project = {project_key}")
+    
+    if errors:
+        st.error(f"❌ {len(errors)} of {len(operations)} changes failed:")
+        for error in errors:
+            st.write(f"- {error}")
+    else:
+        st.success(f"✅ Applied {len(operations)} changes to JIRA")
+
 def display_push_results(push_results: Dict[str, Any]):
     """Display the results of the JIRA push"""
     
@@ -693,6 +1091,9 @@ def display_push_results(push_results: Dict[str, Any]):
     else:
         st.success("**✅ Live Push Results** - JIRA issues have been created")
     
+    if push_results.get('resumed_count'):
+        st.info(f"♻️ Skipped {push_results['resumed_count']} items already created by a previous push")
+    
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
     
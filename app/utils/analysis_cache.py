@@ -0,0 +1,162 @@
+"""
+Content-addressed analysis cache for PI Planning Dashboard
+Memoizes per-goal analysis results in memory with an optional on-disk tier
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.config import load_config
+
+def content_key(*parts: str) -> str:
+    """Hash the given strings into a stable cache key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class AnalysisCache:
+    """
+    Thread-safe LRU of JSON-serializable results keyed by content hash
+
+    Entries evicted from memory survive in disk_dir (one JSON file per key)
+    when it is set, so results are reused across reruns, sessions and
+    worker processes. The disk tier is bounded too: once it holds more than
+    max_disk_entries files, the least recently used ones are removed.
+    Pickling keeps only the settings, so the cache can be handed to process
+    pool workers, which start with an empty memory tier.
+    """
+
+    def __init__(self, max_entries: int = 2048, disk_dir: Optional[Path] = None,
+                 max_disk_entries: int = 20000):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Disk writes since the last prune; the first write always prunes
+        self._disk_writes = max_disk_entries
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            'max_entries': self.max_entries,
+            'disk_dir': self.disk_dir,
+            'max_disk_entries': self.max_disk_entries
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f'{key}.json'
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, checking memory then disk"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+
+        if self.disk_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r') as f:
+                value = json.load(f)
+            # Bump the mtime so pruning treats the file as recently used
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a result in memory and, if enabled, on disk"""
+        self._remember(key, value)
+
+        if self.disk_dir is None:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, so concurrent threads and
+            # processes never write to the same file before the rename
+            with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False) as f:
+                tmp_path = Path(f.name)
+                json.dump(value, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"Could not write analysis cache entry: {e}")
+            return
+
+        # Scanning the directory is not free, so prune once every tenth of the budget
+        with self._lock:
+            self._disk_writes += 1
+            should_prune = self._disk_writes >= max(1, self.max_disk_entries // 10)
+            if should_prune:
+                self._disk_writes = 0
+        if should_prune:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove the least recently used disk entries beyond max_disk_entries"""
+        files = []
+        for path in self.disk_dir.glob('*/*.json'):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue  # Removed by another process meanwhile
+
+        excess = len(files) - self.max_disk_entries
+        if excess <= 0:
+            return
+
+        files.sort()
+        for _, path in files[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _remember(self, key: str, value: Dict[str, Any]):
+        """Insert into the memory tier, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the memory tier (disk entries are left in place)"""
+        with self._lock:
+            self._entries.clear()
+
+# Process-wide goal analysis cache shared by every page and session
+_goal_analysis_cache = None
+_goal_analysis_cache_lock = threading.Lock()
+
+def get_goal_analysis_cache() -> AnalysisCache:
+    """Get or create the process-wide goal analysis cache"""
+    global _goal_analysis_cache
+    if _goal_analysis_cache is None:
+        with _goal_analysis_cache_lock:
+            if _goal_analysis_cache is None:
+                config = load_config()
+                cache_config = config['goal_cache']
+                _goal_analysis_cache = AnalysisCache(
+                    max_entries=cache_config['max_entries'],
+                    disk_dir=config['data_dir'] / 'goal_analysis_cache' if cache_config['disk'] else None,
+                    max_disk_entries=cache_config['max_disk_entries']
+                )
+    return _goal_analysis_cache
@@ -35,6 +35,24 @@ def load_config() -> Dict[str, Any]:
         'jira_user': os.getenv('JIRA_USER', ''),
         'jira_token': os.getenv('JIRA_TOKEN', ''),
         'jira_project_key': os.getenv('JIRA_PROJECT_KEY', 'PI'),
+        'jira_epic_link_field': os.getenv('JIRA_EPIC_LINK_FIELD', 'parent'),
+        'jira_story_points_field': os.getenv('JIRA_STORY_POINTS_FIELD', ''),
+        'jira_pool_size': int(os.getenv('JIRA_POOL_SIZE', '10')),
+        'jira_max_retries': int(os.getenv('JIRA_MAX_RETRIES', '3')),
+        'jira_retry_backoff': float(os.getenv('JIRA_RETRY_BACKOFF', '0.5')),
+        'jira_timeout': float(os.getenv('JIRA_TIMEOUT', '30')),
+        'jira_summary_cache_ttl': float(os.getenv('JIRA_SUMMARY_CACHE_TTL', '30')),
+        'jira_delete_workers': int(os.getenv('JIRA_DELETE_WORKERS', '8')),
+        
+        # MCP Atlassian server and session pool
+        'mcp_server_url': os.getenv('MCP_SERVER_URL', 'http://localhost:3000/mcp/'),
+        'mcp_discovery_ttl': float(os.getenv('MCP_DISCOVERY_TTL', '600')),
+        'mcp_pool': {
+            'max_sessions': int(os.getenv('MCP_POOL_MAX_SESSIONS', '4')),
+            'server_sizes': {},
+            'idle_timeout': float(os.getenv('MCP_POOL_IDLE_TIMEOUT', '300')),
+            'health_check_interval': float(os.getenv('MCP_POOL_HEALTH_CHECK_INTERVAL', '60'))
+        },
         
         # MCP server configuration
         'mcp_servers': {
@@ -76,10 +94,31 @@ def load_config() -> Dict[str, Any]:
         'generated_dir': project_root / 'data' / 'generated',
         'examples_dir': project_root / 'data' / 'examples',
         
+        # Shared JIRA issue cache
+        'issue_cache': {
+            'max_mb': float(os.getenv('ISSUE_CACHE_MAX_MB', '64')),
+            'revalidate_seconds': float(os.getenv('ISSUE_CACHE_REVALIDATE_SECONDS', '30'))
+        },
+        
+        # Per-goal analysis cache (disk tier lives under data_dir)
+        'goal_cache': {
+            'max_entries': int(os.getenv('GOAL_CACHE_MAX_ENTRIES', '2048')),
+            'disk': os.getenv('GOAL_CACHE_DISK', 'True').lower() == 'true',
+            'max_disk_entries': int(os.getenv('GOAL_CACHE_MAX_DISK_ENTRIES', '20000'))
+        },
+        
+        # Category-specific Feature templates (JSON, or YAML with PyYAML installed);
+        # relative paths are resolved from the project root, not the working directory
+        'feature_templates_path': project_root / os.getenv('FEATURE_TEMPLATES_PATH', 'config/feature_templates.json'),
+        
+        # Concurrency limits
+        'max_concurrent_api_calls': int(os.getenv('MAX_CONCURRENT_API_CALLS', '5')),
+        
         # Demo mode settings
         'demo_mode': os.getenv('DEMO_MODE', 'True').lower() == 'true',
         'mock_jira': os.getenv('DEMO_MODE', 'True').lower() == 'true',
         'mock_mcp': os.getenv('DEMO_MODE', 'True').lower() == 'true',
+        'demo_agent_delays': os.getenv('DEMO_AGENT_DELAYS', 'False').lower() == 'true',
     }
     
     # Load MCP configuration file if it exists
@@ -89,6 +128,7 @@ def load_config() -> Dict[str, Any]:
             with open(mcp_config_path, 'r') as f:
                 mcp_config = json.load(f)
                 config['mcp_servers'].update(mcp_config.get('servers', {}))
+                config['mcp_pool']['server_sizes'].update(mcp_config.get('pool_sizes', {}))
         except Exception as e:
             st.warning(f"Could not load MCP configuration: {e}")
     
@@ -99,7 +139,7 @@ def load_config() -> Dict[str, Any]:
     
     return config
 
-def get_jira_config() -> Dict[str, str]:
+def get_jira_config() -> Dict[str, Any]:
     """Get JIRA-specific configuration"""
     config = load_config()
     return {
@@ -107,6 +147,14 @@ def get_jira_config() -> Dict[str, str]:
         'user': config['jira_user'],
         'token': config['jira_token'],
         'project_key': config['jira_project_key'],
+        'epic_link_field': config['jira_epic_link_field'],
+        'story_points_field': config['jira_story_points_field'],
+        'pool_size': config['jira_pool_size'],
+        'max_retries': config['jira_max_retries'],
+        'retry_backoff': config['jira_retry_backoff'],
+        'timeout': config['jira_timeout'],
+        'summary_cache_ttl': config['jira_summary_cache_ttl'],
+        'delete_workers': config['jira_delete_workers'],
         'mock_mode': config['mock_jira']
     }
 
@@ -137,6 +185,11 @@ def is_demo_mode() -> bool:
     config = load_config()
     return config['demo_mode']
 
+def simulate_agent_delays() -> bool:
+    """Check if agents should add artificial "thinking" delays (demo mode only)"""
+    config = load_config()
+    return config['demo_mode'] and config['demo_agent_delays']
+
 def get_file_upload_config() -> Dict[str, Any]:
     """Get file upload configuration"""
     config = load_config()
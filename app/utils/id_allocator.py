@@ -0,0 +1,104 @@
+"""
+ID allocation for PI Planning Dashboard
+Hands out unique, monotonic IDs per prefix, safely across threads and processes
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+from utils.config import load_config
+
+class IDAllocator:
+    """
+    Monotonic ID sequences, one per prefix (e.g. EPIC-1000, EPIC-1001, ...)
+
+    With a state_path, counters live in a JSON file guarded by an exclusive
+    lock file, so every process sharing the file draws from the same
+    sequences and IDs keep increasing across restarts. Without one, counters
+    are kept in memory for this process. reserve() hands out whole blocks,
+    so a batch costs one round trip and pool workers can be given their IDs
+    up front instead of calling the allocator themselves.
+    """
+
+    def __init__(self, state_path: Optional[Path] = None, start: int = 1000):
+        self.state_path = Path(state_path) if state_path else None
+        self.start = start
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, prefix: str, count: int) -> range:
+        """Reserve count consecutive numbers for prefix"""
+        if count <= 0:
+            return range(0)
+
+        with self._lock:
+            if self.state_path is None:
+                first = self._counters.get(prefix, self.start)
+                self._counters[prefix] = first + count
+            else:
+                first = self._reserve_in_file(prefix, count)
+
+        return range(first, first + count)
+
+    def _reserve_in_file(self, prefix: str, count: int) -> int:
+        """Advance the shared counter for prefix under the file lock (thread lock held)"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.state_path.with_suffix('.lock'), 'w') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                counters = {}
+                if self.state_path.exists():
+                    with open(self.state_path, 'r') as f:
+                        counters = json.load(f)
+
+                first = max(int(counters.get(prefix, self.start)), self.start)
+                counters[prefix] = first + count
+
+                # Write-then-rename so a crash never leaves a truncated counter file
+                tmp_path = self.state_path.with_suffix('.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(counters, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                tmp_path.replace(self.state_path)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        return first
+
+    def reserve_ids(self, prefix: str, count: int) -> List[str]:
+        """Reserve count IDs for prefix, formatted as PREFIX-NUMBER"""
+        return [format_id(prefix, number) for number in self.reserve(prefix, count)]
+
+    def allocate(self, prefix: str) -> str:
+        """Allocate a single ID for prefix"""
+        return self.reserve_ids(prefix, 1)[0]
+
+def format_id(prefix: str, number: int) -> str:
+    """Format an allocated number as an ID"""
+    return f"{prefix}-{number}"
+
+# Process-wide allocator persisted under the data directory
+_id_allocator = None
+_id_allocator_lock = threading.Lock()
+
+def get_id_allocator() -> IDAllocator:
+    """Get or create the allocator shared by every page and worker process"""
+    global _id_allocator
+    if _id_allocator is None:
+        with _id_allocator_lock:
+            if _id_allocator is None:
+                config = load_config()
+                _id_allocator = IDAllocator(config['data_dir'] / 'id_sequences.json')
+    return _id_allocator
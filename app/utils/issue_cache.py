@@ -0,0 +1,159 @@
+"""
+Shared JIRA issue cache for PI Planning Dashboard
+Keeps compact issue records per normalized JQL and revalidates them with delta queries
+"""
+
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.config import load_config
+from utils.issue_records import IssueRecord
+
+# Rough per-record overhead (tuple + dict slot) used for the memory budget
+RECORD_OVERHEAD_BYTES = 120
+
+# Largest share of the budget a single query may use; bigger result sets are
+# returned uncached so one full-project read cannot flush every other entry
+MAX_ENTRY_FRACTION = 0.25
+
+class _CacheEntry:
+    """Records for one query plus bookkeeping for revalidation"""
+
+    def __init__(self, records: Dict[str, IssueRecord], synced_at: float):
+        self.records = records
+        self.synced_at = synced_at
+        self.checked_at = synced_at
+        self.size = sum(_record_size(record) for record in records.values())
+
+def _record_size(record: IssueRecord) -> int:
+    return RECORD_OVERHEAD_BYTES + sum(
+        sys.getsizeof(value) for value in record if value is not None
+    )
+
+def normalize_jql(jql: str) -> str:
+    """Collapse whitespace so equivalent queries share one cache entry"""
+    return ' '.join(jql.split())
+
+def _split_order_by(jql: str) -> Tuple[str, str]:
+    """Split a query into its filter and any trailing ORDER BY clause"""
+    upper = jql.upper()
+    index = upper.rfind(' ORDER BY ')
+    if index < 0:
+        return jql, ''
+    return jql[:index], jql[index:]
+
+class IssueCache:
+    """
+    Thread-safe LRU cache of issue records keyed by (normalized JQL, fields)
+
+    Entries older than revalidate_after are refreshed with an
+    `updated >= -Nm` delta query instead of a full refetch. The relative form
+    avoids server/client timezone mismatches. When a count function is
+    supplied, a total that no longer matches the cache triggers a full refetch,
+    which catches deleted issues the delta query cannot see. Result sets larger
+    than MAX_ENTRY_FRACTION of max_bytes are not cached at all.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, revalidate_after: float = 30.0):
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self._entries: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        jql: str,
+        fetch: Callable[[str], List[IssueRecord]],
+        count: Optional[Callable[[str], int]] = None,
+        fields: str = ''
+    ) -> List[IssueRecord]:
+        """Return records for jql, fetching only what changed since the last sync"""
+        normalized = normalize_jql(jql)
+        cache_key = (normalized, fields)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                if time.time() - entry.checked_at < self.revalidate_after:
+                    return list(entry.records.values())
+
+        sync_started = time.time()
+
+        if entry is None:
+            records = {record.key: record for record in fetch(normalized)}
+        else:
+            records = self._revalidate(normalized, entry, fetch, count)
+
+        with self._lock:
+            self._store(cache_key, _CacheEntry(records, sync_started))
+
+        return list(records.values())
+
+    def _revalidate(
+        self,
+        jql: str,
+        entry: _CacheEntry,
+        fetch: Callable[[str], List[IssueRecord]],
+        count: Optional[Callable[[str], int]]
+    ) -> Dict[str, IssueRecord]:
+        """Merge issues updated since the last sync into a copy of the cached records"""
+        # One extra minute of overlap covers JQL's minute granularity
+        minutes = math.ceil((time.time() - entry.synced_at) / 60) + 1
+        query, order_by = _split_order_by(jql)
+        delta_jql = f'({query}) AND updated >= -{minutes}m{order_by}'
+
+        records = dict(entry.records)
+        for record in fetch(delta_jql):
+            records[record.key] = record
+
+        if count is not None and count(jql) != len(records):
+            # Issues were deleted or moved out of the query; start over
+            records = {record.key: record for record in fetch(jql)}
+
+        return records
+
+    def _store(self, cache_key: Tuple[str, str], entry: _CacheEntry):
+        """Insert an entry and evict least recently used ones over budget (lock held)"""
+        previous = self._entries.pop(cache_key, None)
+        if previous is not None:
+            self._total_bytes -= previous.size
+
+        if entry.size > self.max_bytes * MAX_ENTRY_FRACTION:
+            return
+
+        self._entries[cache_key] = entry
+        self._total_bytes += entry.size
+
+        while self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size
+
+    def invalidate(self, jql_fragment: Optional[str] = None):
+        """Drop every entry, or only those whose JQL contains jql_fragment"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                if jql_fragment is None or jql_fragment in cache_key[0]:
+                    self._total_bytes -= self._entries.pop(cache_key).size
+
+# Process-wide cache shared by every page and session
+_issue_cache = None
+_issue_cache_lock = threading.Lock()
+
+def get_issue_cache() -> IssueCache:
+    """Get or create the process-wide issue cache"""
+    global _issue_cache
+    if _issue_cache is None:
+        with _issue_cache_lock:
+            if _issue_cache is None:
+                cache_config = load_config()['issue_cache']
+                _issue_cache = IssueCache(
+                    max_bytes=int(cache_config['max_mb'] * 1024 * 1024),
+                    revalidate_after=cache_config['revalidate_seconds']
+                )
+    return _issue_cache
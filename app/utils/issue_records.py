@@ -0,0 +1,68 @@
+"""
+Issue record parsing for PI Planning Dashboard
+Turns MCP Atlassian tool payloads into compact, typed issue records
+"""
+
+import json
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+# Summary keys used across the dashboard for each JIRA issue type
+ISSUE_TYPE_SUMMARY_KEYS = {
+    'Epic': 'epics',
+    'Story': 'stories',
+    'Task': 'tasks',
+    'Bug': 'bugs'
+}
+
+class IssueRecord(NamedTuple):
+    """Compact view of a JIRA issue as returned by the MCP Atlassian server"""
+    key: str
+    issue_type: str
+    summary: str = ''
+    status: str = ''
+    assignee: Optional[str] = None
+    epic: Optional[str] = None
+    story_points: Optional[float] = None
+    description: Optional[str] = None
+
+def _field_name(value: Any) -> str:
+    """Read a name from either a plain string or a {'name': ...} object"""
+    if isinstance(value, dict):
+        return value.get('name', '') or ''
+    return value or ''
+
+def parse_tool_payload(tool_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode the JSON text content of an MCP tool result"""
+    content = tool_result.get('content', [])
+    if not content:
+        return {}
+
+    text = content[0].get('text', '')
+    return json.loads(text) if text else {}
+
+def parse_issue_page(tool_result: Dict[str, Any]) -> Tuple[List[IssueRecord], int]:
+    """Parse one page of jira_search results into (records, total)"""
+    payload = parse_tool_payload(tool_result)
+    records = []
+
+    for issue in payload.get('issues', []):
+        fields = issue.get('fields', issue)
+        records.append(IssueRecord(
+            key=issue.get('key', ''),
+            issue_type=_field_name(fields.get('issue_type') or fields.get('issuetype')),
+            summary=fields.get('summary', '') or '',
+            status=_field_name(fields.get('status'))
+        ))
+
+    return records, int(payload.get('total', len(records)))
+
+def count_issue_types(records: List[IssueRecord], counts: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Tally records per summary key in a single pass"""
+    counts = counts if counts is not None else {key: 0 for key in ISSUE_TYPE_SUMMARY_KEYS.values()}
+
+    for record in records:
+        summary_key = ISSUE_TYPE_SUMMARY_KEYS.get(record.issue_type)
+        if summary_key:
+            counts[summary_key] += 1
+
+    return counts
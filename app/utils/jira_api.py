@@ -3,11 +3,59 @@ JIRA API Client for PI Planning Dashboard
 Handles JIRA integration with mock implementations for demo mode
 """
 
+import json
 import time
 import random
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence
 from datetime import datetime, timedelta
 
+from utils.issue_records import IssueRecord
+from utils.issue_cache import get_issue_cache
+from utils.story_quality import analyze_backlog_quality_in_chunks
+from utils.id_allocator import IDAllocator
+
+# JIRA Cloud accepts at most 50 issues per bulk-create request
+BULK_CREATE_BATCH_SIZE = 50
+BULK_CREATE_MAX_RETRIES = 2
+
+# Statuses meaning JIRA rejected the request (or item) without creating it, so resending is safe
+BULK_CREATE_RETRY_STATUSES = (429, 503)
+
+# Cleanup paging
+DELETE_PAGE_SIZE = 100
+
+# Page size for streaming issue searches
+ISSUE_PAGE_SIZE = 100
+
+# Issue fields the dashboard reads; everything else is left on the server
+DEFAULT_ISSUE_FIELDS = ('summary', 'status', 'assignee', 'epic', 'story_points')
+
+# Backlog quality scoring also checks descriptions for acceptance criteria
+BACKLOG_QUALITY_FIELDS = DEFAULT_ISSUE_FIELDS + ('description',)
+
+# Summary keys and the JIRA issue types they count
+SUMMARY_ISSUE_TYPES = {
+    'epics': 'Epic',
+    'stories': 'Story',
+    'tasks': 'Task',
+    'bugs': 'Bug'
+}
+
+def _bulk_request_not_applied(error: Exception) -> bool:
+    """True if a failed bulk-create request certainly created nothing, so it can be resent"""
+    import requests
+    from urllib3.exceptions import ConnectTimeoutError
+    
+    if getattr(error, 'status_code', None) in BULK_CREATE_RETRY_STATUSES:
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        # Connect failures never reached JIRA; a dropped response (ProtocolError) might have
+        reason = getattr(error.args[0], 'reason', error.args[0]) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectTimeout) or isinstance(reason, ConnectTimeoutError)
+    return False
+
 class JIRAClient:
     """JIRA API client with mock implementation for demo purposes"""
     
@@ -18,9 +66,26 @@ class JIRAClient:
         self.user = config.get('user', '')
         self.token = config.get('token', '')
         self.project_key = config.get('project_key', 'PI')
+        self.epic_link_field = config.get('epic_link_field', 'parent')
+        self.story_points_field = config.get('story_points_field', '')
+        
+        # Connection pool settings for the shared JIRA session
+        self.pool_size = int(config.get('pool_size', 10))
+        self.max_retries = int(config.get('max_retries', 3))
+        self.retry_backoff = float(config.get('retry_backoff', 0.5))
+        self.timeout = float(config.get('timeout', 30))
+        self.delete_workers = int(config.get('delete_workers', 8))
+        self._jira = None
+        self._jira_lock = threading.Lock()
+        
+        # Short-lived per-project issue counts: {project_key: (summary, fetched_at)}
+        self.summary_cache_ttl = float(config.get('summary_cache_ttl', 30))
+        self._summary_cache = {}
+        self._summary_cache_lock = threading.Lock()
         
-        # Mock data for demo mode
+        # Mock data for demo mode; new mock issues are numbered after the sample ones
         self.mock_data = self._initialize_mock_data()
+        self._mock_key_allocator = IDAllocator(start=100)
     
     def _initialize_mock_data(self) -> Dict[str, Any]:
         """Initialize mock JIRA data for demo purposes"""
@@ -120,6 +185,52 @@ class JIRAClient:
             'labels': ['authentication', 'payment', 'performance', 'mobile', 'security']
         }
     
+    def _get_jira(self):
+        """
+        Return the shared JIRA connection, creating it on first use
+        
+        The underlying requests session keeps a pool of keep-alive connections
+        and retries 429/503 responses and failed connects with exponential
+        backoff (honouring Retry-After), so every method reuses warm connections.
+        Requests whose response was lost are never resent, since JIRA may
+        already have applied them.
+        """
+        if self._jira is None:
+            with self._jira_lock:
+                if self._jira is None:
+                    from jira import JIRA
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+                    
+                    jira = JIRA(
+                        server=self.server,
+                        basic_auth=(self.user, self.token),
+                        get_server_info=False,
+                        max_retries=0,  # Retries are handled by the adapter below
+                        timeout=self.timeout
+                    )
+                    
+                    retry = Retry(
+                        total=self.max_retries,
+                        backoff_factor=self.retry_backoff,
+                        status_forcelist=[429, 503],
+                        allowed_methods=None,
+                        read=False,  # A timed-out POST may already have been applied
+                        respect_retry_after_header=True,
+                        raise_on_status=False
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                        max_retries=retry
+                    )
+                    jira._session.mount('https://', adapter)
+                    jira._session.mount('http://', adapter)
+                    
+                    self._jira = jira
+        
+        return self._jira
+    
     def is_connected(self) -> bool:
         """Check if connected to JIRA"""
         if self.mock_mode:
@@ -145,33 +256,59 @@ class JIRAClient:
                 'bugs': len(self.mock_data['bugs'])
             }
         
+        # Serve recent counts from cache to avoid hitting JIRA on every rerun
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(self.project_key)
+            if cached and time.time() - cached[1] < self.summary_cache_ttl:
+                return dict(cached[0])
+        
         # Real JIRA API call
         try:
-            from jira import JIRA
+            jira = self._get_jira()
             
-            # Connect to JIRA
-            jira = JIRA(server=self.server, basic_auth=(self.user, self.token))
+            # maxResults=0 returns only the exact total, no issue bodies
+            def count_issues(issue_type: str) -> int:
+                result = jira.search_issues(
+                    f'project = {self.project_key} AND issuetype = "{issue_type}"',
+                    maxResults=0,
+                    fields='issuetype',
+                    json_result=True
+                )
+                return int(result.get('total', 0))
             
-            # Get project issues
-            epics = jira.search_issues(f'project = {self.project_key} AND issuetype = Epic')
-            stories = jira.search_issues(f'project = {self.project_key} AND issuetype = Story')
-            tasks = jira.search_issues(f'project = {self.project_key} AND issuetype = Task')
-            bugs = jira.search_issues(f'project = {self.project_key} AND issuetype = Bug')
+            # The four count queries run side by side on the pooled session
+            with ThreadPoolExecutor(max_workers=len(SUMMARY_ISSUE_TYPES)) as executor:
+                counts = dict(zip(
+                    SUMMARY_ISSUE_TYPES.keys(),
+                    executor.map(count_issues, SUMMARY_ISSUE_TYPES.values())
+                ))
             
-            return {
-                'epics': len(epics),
-                'stories': len(stories),
-                'tasks': len(tasks),
-                'bugs': len(bugs)
-            }
+            with self._summary_cache_lock:
+                self._summary_cache[self.project_key] = (counts, time.time())
+            
+            return dict(counts)
             
         except Exception as e:
             # If JIRA connection fails, return empty project
             print(f"JIRA connection failed: {e}")
             return {'epics': 0, 'stories': 0, 'tasks': 0, 'bugs': 0}
     
-    def cleanup_items(self, item_type: str) -> Dict[str, Any]:
-        """Clean up specific type of items"""
+    def invalidate_summary_cache(self):
+        """Drop cached project counts after the project has been modified"""
+        with self._summary_cache_lock:
+            self._summary_cache.pop(self.project_key, None)
+    
+    def cleanup_items(
+        self,
+        item_type: str,
+        progress_callback: Optional[Callable[[int, int, Optional[str], Optional[str]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Clean up specific type of items
+        
+        progress_callback, if given, is called as (done, total, issue_key, error)
+        after each issue is processed, from the calling thread.
+        """
         # Check if we have valid JIRA credentials
         has_valid_credentials = bool(self.server and self.user and self.token and self.token != 'your-jira-api-token')
         
@@ -205,6 +342,9 @@ class JIRAClient:
             if item_type in self.mock_data:
                 self.mock_data[item_type] = []
             
+            if progress_callback:
+                progress_callback(count, count, None, None)
+            
             return {
                 'success': True,
                 'count': count,
@@ -213,10 +353,7 @@ class JIRAClient:
         
         # Real JIRA cleanup implementation
         try:
-            from jira import JIRA
-            
-            # Connect to JIRA
-            jira = JIRA(server=self.server, basic_auth=(self.user, self.token))
+            jira = self._get_jira()
             
             # Map item types to JIRA issue types
             issue_type_mapping = {
@@ -228,23 +365,26 @@ class JIRAClient:
             }
             
             if item_type in issue_type_mapping:
-                # Get all issues of this type
                 jql = f'project = {self.project_key} AND issuetype = "{issue_type_mapping[item_type]}"'
-                issues = jira.search_issues(jql)
+                result = self._delete_matching_issues(jira, jql, progress_callback)
+                self.invalidate_summary_cache()
                 
-                # Delete each issue
-                deleted_count = 0
-                for issue in issues:
-                    try:
-                        issue.delete()
-                        deleted_count += 1
-                    except Exception as e:
-                        print(f"Failed to delete {issue.key}: {e}")
+                if result['failed']:
+                    return {
+                        'success': False,
+                        'count': result['deleted'],
+                        'deleted_keys': result['deleted_keys'],
+                        'error': (
+                            f"Deleted {result['deleted']} {item_type}, failed to delete {result['failed']}: "
+                            + '; '.join(result['errors'][:5])
+                        )
+                    }
                 
                 return {
                     'success': True,
-                    'count': deleted_count,
-                    'message': f'Deleted {deleted_count} {item_type}'
+                    'count': result['deleted'],
+                    'deleted_keys': result['deleted_keys'],
+                    'message': f"Deleted {result['deleted']} {item_type}"
                 }
             
             elif item_type == 'components':
@@ -296,8 +436,112 @@ class JIRAClient:
                 'error': f'JIRA cleanup failed: {str(e)}'
             }
     
-    def get_all_issues(self, issue_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """Get all issues from the project"""
+    def _collect_issues_for_deletion(self, jira, jql: str) -> List[List[str]]:
+        """
+        Page through every issue matching jql and group keys into deletion waves
+        
+        Sub-tasks come first, then standard issues, then epics, so children are
+        always removed before their parents. Keys are collected up front because
+        deleting while paging would shift the startAt offsets.
+        """
+        waves = {0: [], 1: [], 2: []}
+        start_at = 0
+        
+        while True:
+            result = jira.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=DELETE_PAGE_SIZE,
+                fields='issuetype',
+                json_result=True
+            )
+            issues = result.get('issues', [])
+            
+            for issue in issues:
+                issue_type = issue.get('fields', {}).get('issuetype', {})
+                if issue_type.get('subtask'):
+                    waves[0].append(issue['key'])
+                elif issue_type.get('hierarchyLevel', 0) > 0 or issue_type.get('name') == 'Epic':
+                    waves[2].append(issue['key'])
+                else:
+                    waves[1].append(issue['key'])
+            
+            start_at += len(issues)
+            if not issues or start_at >= result.get('total', 0):
+                break
+        
+        return [waves[level] for level in sorted(waves) if waves[level]]
+    
+    def _delete_issue(self, jira, issue_key: str) -> Optional[str]:
+        """
+        Delete one issue; return an error message or None
+        
+        Rate limits (429/503) are retried by the session's retry adapter, so
+        any error that reaches here is final.
+        """
+        try:
+            jira._session.delete(jira._get_url(f'issue/{issue_key}'), params={'deleteSubtasks': 'true'})
+            return None
+        except Exception as e:
+            if getattr(e, 'status_code', None) == 404:
+                # Already gone (e.g. removed along with its parent)
+                return None
+            return f"{issue_key}: {e}"
+    
+    def _delete_matching_issues(
+        self,
+        jira,
+        jql: str,
+        progress_callback: Optional[Callable[[int, int, Optional[str], Optional[str]], None]] = None
+    ) -> Dict[str, Any]:
+        """Delete every issue matching jql on a bounded worker pool, children first"""
+        waves = self._collect_issues_for_deletion(jira, jql)
+        total = sum(len(wave) for wave in waves)
+        done = 0
+        deleted_keys = []
+        errors = []
+        
+        if progress_callback:
+            progress_callback(0, total, None, None)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.delete_workers, self.pool_size))) as executor:
+            for wave in waves:
+                futures = {
+                    executor.submit(self._delete_issue, jira, issue_key): issue_key
+                    for issue_key in wave
+                }
+                # Finish the whole wave before touching the parents in the next one
+                for future in as_completed(futures):
+                    error = future.result()
+                    done += 1
+                    if error:
+                        errors.append(error)
+                    else:
+                        deleted_keys.append(futures[future])
+                    
+                    if progress_callback:
+                        progress_callback(done, total, futures[future], error)
+        
+        return {
+            'total': total,
+            'deleted': len(deleted_keys),
+            'deleted_keys': deleted_keys,
+            'failed': len(errors),
+            'errors': errors
+        }
+    
+    def get_all_issues(
+        self,
+        issue_types: Optional[List[str]] = None,
+        fields: Sequence[str] = DEFAULT_ISSUE_FIELDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all issues from the project as a list
+        
+        Small result sets are served from the shared issue cache; large ones
+        are fetched uncached (see IssueCache). Callers that only iterate
+        should use iter_issues, which never holds the whole result set.
+        """
         if self.mock_mode:
             all_issues = []
             
@@ -315,8 +559,123 @@ class JIRAClient:
             
             return all_issues
         
-        # TODO: Implement real JIRA API call
-        return []
+        # Repeated reads are served from the shared cache and revalidated by delta
+        try:
+            jira_fields = self._jira_fields(fields)
+            records = get_issue_cache().get_or_fetch(
+                self._issue_types_jql(issue_types),
+                fetch=lambda jql: list(self._iter_issue_records(jql, jira_fields)),
+                count=self._count_issues,
+                fields=','.join(sorted(jira_fields))
+            )
+            return [self._issue_dict(record, fields) for record in records]
+        except Exception as e:
+            print(f"Failed to get JIRA issues: {e}")
+            return []
+    
+    def iter_issues(
+        self,
+        issue_types: Optional[List[str]] = None,
+        fields: Sequence[str] = DEFAULT_ISSUE_FIELDS
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream issues from the project one page at a time
+        
+        Only the requested dashboard fields are fetched, and each issue is
+        yielded in the same dict shape as the mock data, so callers can walk
+        a large backlog in constant memory.
+        """
+        if self.mock_mode:
+            yield from self.get_all_issues(issue_types)
+            return
+        
+        jira_fields = self._jira_fields(fields)
+        for record in self._iter_issue_records(self._issue_types_jql(issue_types), jira_fields):
+            yield self._issue_dict(record, fields)
+    
+    def _issue_types_jql(self, issue_types: Optional[List[str]]) -> str:
+        """Build the project query, optionally restricted to some issue types"""
+        jql = f'project = {self.project_key}'
+        if issue_types:
+            jql += ' AND issuetype in (' + ', '.join(f'"{issue_type}"' for issue_type in issue_types) + ')'
+        return jql + ' ORDER BY key'
+    
+    def _jira_fields(self, fields: Sequence[str]) -> List[str]:
+        """Translate dashboard field names into the JIRA fields to request"""
+        field_map = {
+            'summary': 'summary',
+            'status': 'status',
+            'assignee': 'assignee',
+            'epic': self.epic_link_field,
+            'story_points': self.story_points_field,
+            'description': 'description'
+        }
+        jira_fields = ['issuetype']
+        for field in fields:
+            jira_field = field_map.get(field)
+            if jira_field and jira_field not in jira_fields:
+                jira_fields.append(jira_field)
+        return jira_fields
+    
+    def _count_issues(self, jql: str) -> int:
+        """Exact number of issues matching jql, without fetching any of them"""
+        result = self._get_jira().search_issues(jql, maxResults=0, fields='issuetype', json_result=True)
+        return int(result.get('total', 0))
+    
+    def _iter_issue_records(self, jql: str, jira_fields: List[str]) -> Iterator[IssueRecord]:
+        """Page through jql with only jira_fields projected, yielding compact records"""
+        jira = self._get_jira()
+        start_at = 0
+        
+        while True:
+            result = jira.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=ISSUE_PAGE_SIZE,
+                fields=','.join(jira_fields),
+                json_result=True
+            )
+            issues = result.get('issues', [])
+            
+            for issue in issues:
+                yield self._issue_record(issue)
+            
+            start_at += len(issues)
+            if not issues or start_at >= result.get('total', 0):
+                break
+    
+    def _issue_record(self, issue: Dict[str, Any]) -> IssueRecord:
+        """Convert one search result into a compact record"""
+        fields = issue.get('fields', {})
+        
+        assignee = fields.get('assignee') or {}
+        epic = fields.get(self.epic_link_field)
+        if isinstance(epic, dict):
+            # The parent field also points sub-tasks at their story; only keep epics
+            parent_type = epic.get('fields', {}).get('issuetype', {})
+            is_epic = parent_type.get('name') == 'Epic' or parent_type.get('hierarchyLevel', 0) > 0
+            epic = epic.get('key') if is_epic else None
+        
+        story_points = fields.get(self.story_points_field) if self.story_points_field else None
+        
+        return IssueRecord(
+            key=issue.get('key', ''),
+            issue_type=(fields.get('issuetype') or {}).get('name', ''),
+            summary=fields.get('summary') or '',
+            status=(fields.get('status') or {}).get('name', ''),
+            assignee=assignee.get('emailAddress') or assignee.get('displayName'),
+            epic=epic or None,
+            story_points=story_points,
+            description=fields.get('description')
+        )
+    
+    def _issue_dict(self, record: IssueRecord, fields: Sequence[str]) -> Dict[str, Any]:
+        """Map a record into the mock data's issue shape, keeping only requested fields"""
+        issue = {'key': record.key}
+        for field in fields:
+            if field in IssueRecord._fields:
+                issue[field] = getattr(record, field)
+        return issue
     
     def create_epic(self, epic_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Epic in JIRA"""
@@ -325,7 +684,7 @@ class JIRAClient:
             time.sleep(random.uniform(0.5, 1.5))
             
             # Generate mock epic key
-            epic_key = f"{self.project_key}-{random.randint(100, 999)}"
+            epic_key = self._mock_key_allocator.allocate(self.project_key)
             
             epic = {
                 'key': epic_key,
@@ -360,7 +719,7 @@ class JIRAClient:
             time.sleep(random.uniform(0.3, 1.0))
             
             # Generate mock story key
-            story_key = f"{self.project_key}-{random.randint(100, 999)}"
+            story_key = self._mock_key_allocator.allocate(self.project_key)
             
             story = {
                 'key': story_key,
@@ -421,11 +780,170 @@ class JIRAClient:
                 'errors': errors
             }
         
-        # TODO: Implement real JIRA bulk creation
-        return {
-            'success': False,
-            'error': 'Real JIRA bulk creation not implemented yet'
+        # Real JIRA bulk creation: epics first, then features linked to the new epic keys
+        self.invalidate_summary_cache()
+        try:
+            jira = self._get_jira()
+            
+            epics = [issue for issue in issues_data if issue.get('issue_type') == 'Epic']
+            # Copies, since epic keys are filled in below and the caller's dicts must not change
+            features = [dict(issue) for issue in issues_data if issue.get('issue_type') != 'Epic']
+            
+            epic_created, epic_errors = self._bulk_create_in_batches(jira, epics)
+            
+            # Map generated epic IDs to the keys JIRA assigned so features can link to them
+            epic_keys = {
+                issue_data.get('id'): result['key']
+                for issue_data, result in epic_created
+                if issue_data.get('id')
+            }
+            for feature in features:
+                if not feature.get('epic_key') and feature.get('epic_id') in epic_keys:
+                    feature['epic_key'] = epic_keys[feature['epic_id']]
+            
+            feature_created, feature_errors = self._bulk_create_in_batches(jira, features)
+            
+            created_issues = [result for _, result in epic_created + feature_created]
+            errors = epic_errors + feature_errors
+            
+            return {
+                'success': len(errors) == 0,
+                'created_count': len(created_issues),
+                'error_count': len(errors),
+                'created_issues': created_issues,
+                'epic_keys': epic_keys,
+                'errors': errors
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'JIRA bulk creation failed: {str(e)}'
+            }
+    
+    def _build_issue_fields(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the JIRA fields payload for one issue"""
+        fields = {
+            'project': {'key': self.project_key},
+            'issuetype': {'name': issue_data.get('issue_type', 'Story')},
+            'summary': issue_data.get('summary', 'New Issue'),
+            'description': issue_data.get('description', '')
         }
+        
+        if issue_data.get('labels'):
+            fields['labels'] = issue_data['labels']
+        if issue_data.get('components'):
+            fields['components'] = [{'name': name} for name in issue_data['components']]
+        if issue_data.get('priority'):
+            fields['priority'] = {'name': issue_data['priority']}
+        if issue_data.get('assignee'):
+            fields['assignee'] = {'id': issue_data['assignee']}
+        if issue_data.get('story_points') and self.story_points_field:
+            fields[self.story_points_field] = issue_data['story_points']
+        
+        if issue_data.get('epic_key'):
+            if self.epic_link_field == 'parent':
+                fields['parent'] = {'key': issue_data['epic_key']}
+            else:
+                fields[self.epic_link_field] = issue_data['epic_key']
+        
+        return fields
+    
+    def _post_bulk_create(self, jira, field_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        POST one batch to the bulk-create endpoint and return the raw response body
+        
+        Keys come straight from the response instead of fetching every created
+        issue again, and each failed element keeps its HTTP status.
+        JIRA answers 400 when every element fails; that body is returned too.
+        """
+        from jira.exceptions import JIRAError
+        
+        payload = {'issueUpdates': [{'fields': fields} for fields in field_list]}
+        try:
+            response = jira._session.post(jira._get_url('issue/bulk'), data=json.dumps(payload))
+        except JIRAError as e:
+            if e.status_code == 400 and e.response is not None:
+                return e.response.json()
+            raise
+        return response.json()
+    
+    def _bulk_create_in_batches(self, jira, issues_data: List[Dict[str, Any]]):
+        """
+        Create issues through the bulk API in batches, retrying only what JIRA rejected as transient
+        
+        A batch is only resent when it provably created nothing (429/503, or the
+        connection failed before the request was sent); items are only retried
+        when their own status is 429/503. Validation errors and read timeouts,
+        where JIRA may already have created the issues, are reported instead.
+        Returns (created, errors) where created is a list of (issue_data, result) pairs.
+        """
+        created = []
+        errors = []
+        
+        for start in range(0, len(issues_data), BULK_CREATE_BATCH_SIZE):
+            pending = issues_data[start:start + BULK_CREATE_BATCH_SIZE]
+            last_errors = {}
+            
+            for attempt in range(BULK_CREATE_MAX_RETRIES + 1):
+                if attempt > 0:
+                    time.sleep(2 ** attempt)
+                
+                try:
+                    raw = self._post_bulk_create(jira, [self._build_issue_fields(issue_data) for issue_data in pending])
+                except Exception as e:
+                    last_errors = {id(issue_data): str(e) for issue_data in pending}
+                    if _bulk_request_not_applied(e):
+                        continue
+                    break
+                
+                failed_elements = {error.get('failedElementNumber'): error for error in raw.get('errors', [])}
+                accepted = [issue_data for index, issue_data in enumerate(pending) if index not in failed_elements]
+                created_issues = raw.get('issues', [])
+                
+                # JIRA lists created issues in request order, one per element that did not fail;
+                # if the counts disagree the pairing is unknown, so none of them is assumed created
+                if len(created_issues) == len(accepted):
+                    for issue_data, issue in zip(accepted, created_issues):
+                        created.append((issue_data, {
+                            'success': True,
+                            'key': issue['key'],
+                            'url': f"{self.server}/browse/{issue['key']}"
+                        }))
+                else:
+                    returned_keys = ', '.join(issue.get('key', '?') for issue in created_issues) or 'none'
+                    for issue_data in accepted:
+                        errors.append(
+                            f"{issue_data.get('summary', 'Untitled')}: JIRA returned {len(created_issues)} created "
+                            f"issues ({returned_keys}) for {len(accepted)} accepted requests; check JIRA before "
+                            f"creating this issue again"
+                        )
+                
+                retry = []
+                for index, issue_data in enumerate(pending):
+                    error = failed_elements.get(index)
+                    if error is None:
+                        continue
+                    
+                    element_errors = error.get('elementErrors', {})
+                    last_errors[id(issue_data)] = str(
+                        element_errors.get('errors') or element_errors.get('errorMessages') or 'Unknown error'
+                    )
+                    if error.get('status') in BULK_CREATE_RETRY_STATUSES:
+                        retry.append(issue_data)
+                    else:
+                        errors.append(f"{issue_data.get('summary', 'Untitled')}: {last_errors[id(issue_data)]}")
+                
+                pending = retry
+                if not pending:
+                    break
+            
+            for issue_data in pending:
+                errors.append(
+                    f"{issue_data.get('summary', 'Untitled')}: {last_errors.get(id(issue_data), 'Unknown error')}"
+                )
+        
+        return created, errors
     
     def analyze_story_quality(self, story: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze the quality of a user story"""
@@ -484,6 +1002,19 @@ class JIRAClient:
             'recommendations': self._get_story_recommendations(issues)
         }
     
+    def analyze_backlog_quality(self, stories: Optional[Iterable[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Analyze the quality of many user stories at once
+        
+        Scores the given stories, or every Story in the project streamed with
+        their descriptions, using the same rules as analyze_story_quality but
+        as vectorized DataFrame operations, one chunk of stories at a time
+        (see utils.story_quality).
+        """
+        if stories is None:
+            stories = self.iter_issues(['Story'], fields=BACKLOG_QUALITY_FIELDS)
+        return analyze_backlog_quality_in_chunks(stories)
+    
     def _get_story_recommendations(self, issues: List[str]) -> List[str]:
         """Get recommendations based on story issues"""
         recommendations = []
@@ -540,3 +1071,16 @@ class JIRAClient:
         
         # TODO: Implement real dependency analysis
         return []
+
+
+# Shared client instance so every page reuses the same pooled JIRA session
+_jira_client = None
+_jira_client_lock = threading.Lock()
+
+def get_jira_client(config: Dict[str, Any]) -> JIRAClient:
+    """Get or create the shared JIRA client for the given configuration"""
+    global _jira_client
+    with _jira_client_lock:
+        if _jira_client is None or _jira_client.config != config:
+            _jira_client = JIRAClient(config)
+        return _jira_client
@@ -0,0 +1,71 @@
+"""
+Keyword matching utilities for PI Planning Dashboard
+Finds many keywords in a text with a single compiled regex pass
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+class KeywordMatcher:
+    """
+    Single-pass matcher over a fixed set of labelled keywords
+
+    The keywords are folded into a trie and compiled into one regex whose
+    alternations follow the trie, so each text position is checked against
+    all keywords at once, in C, at a cost that does not grow with the number
+    of keywords. The regex reports the longest keyword starting at every
+    position; keywords that are prefixes of it are added from a precomputed
+    table, so overlapping keywords are all found, exactly like substring
+    checks. Keywords are matched literally: lowercase both sides for
+    case-insensitive use.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Hashable]]):
+        self._labels: Dict[str, List[Hashable]] = {}
+        for keyword, label in keywords:
+            if keyword:
+                self._labels.setdefault(keyword, []).append(label)
+
+        # Every keyword implies the labels of the keywords that are its prefixes
+        self._implied: Dict[str, Tuple[Hashable, ...]] = {
+            keyword: tuple(
+                label
+                for end in range(1, len(keyword) + 1)
+                for label in self._labels.get(keyword[:end], ())
+            )
+            for keyword in self._labels
+        }
+
+        self._regex = re.compile(f'(?=({self._trie_pattern()}))', re.DOTALL) if self._labels else None
+
+    def _trie_pattern(self) -> str:
+        """Compile the keywords into a regex that mirrors their trie"""
+        trie: Dict[str, dict] = {}
+        for keyword in self._labels:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def pattern(node: Dict[str, dict]) -> str:
+            terminal = '' in node
+            branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional suffix: prefer the longest keyword at each position
+            return f'(?:{body})?' if terminal else body
+
+        return pattern(trie)
+
+    def scan(self, text: str) -> Set[Hashable]:
+        """Return the labels of every keyword found in text"""
+        found = set()
+        if self._regex is None:
+            return found
+
+        for keyword in set(self._regex.findall(text)):
+            found.update(self._implied[keyword])
+
+        return found
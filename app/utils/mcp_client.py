@@ -4,37 +4,115 @@ This module provides a proper MCP client interface for the Streamlit dashboard
 """
 
 import asyncio
+import concurrent.futures
+import itertools
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 import httpx
 import streamlit as st
 
+from utils.config import load_config
+from utils.mcp_discovery import build_candidate_urls, discover_mcp_endpoint, invalidate_mcp_endpoint
+
 logger = logging.getLogger(__name__)
 
+class MCPResponseError(Exception):
+    """Raised when the MCP server answers a request with a non-200 status"""
+    
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"HTTP {status_code}: {text}")
+        self.status_code = status_code
+        self.text = text
+
+class SSEParser:
+    """
+    Incremental Server-Sent Events parser
+    
+    Lines are fed as they arrive off the wire and each event is returned as soon
+    as its terminating blank line is seen, so nothing beyond the current event
+    is ever buffered. Multi-line data fields are joined with newlines.
+    """
+    
+    def __init__(self):
+        self._event_type = None
+        self._event_id = None
+        self._data_lines = []
+    
+    def feed_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Consume one line; return a completed event or None"""
+        line = line.rstrip("\r\n")
+        
+        if not line:
+            return self._dispatch()
+        
+        if line.startswith(":"):
+            # Comment / keep-alive
+            return None
+        
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        
+        if field == "data":
+            self._data_lines.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            self._event_id = value
+        
+        return None
+    
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Return any event left unterminated at end of stream"""
+        return self._dispatch()
+    
+    def _dispatch(self) -> Optional[Dict[str, Any]]:
+        if not self._data_lines:
+            self._event_type = None
+            return None
+        
+        event = {
+            "event": self._event_type or "message",
+            "id": self._event_id,
+            "data": "\n".join(self._data_lines)
+        }
+        self._event_type = None
+        self._data_lines = []
+        return event
+
 class MCPAtlassianClient:
     """
     MCP client for connecting to the Atlassian MCP server
     """
     
-    def __init__(self, server_url: str = "http://localhost:3000/mcp/"):
+    def __init__(self, server_url: str = "http://localhost:3000/mcp/", max_connections: int = 10):
         self.server_url = server_url
+        self.max_connections = max_connections
         self.client = None
         self.session_id = None
+        self._request_ids = itertools.count(1)
+        self._reinitialize_lock = asyncio.Lock()
+    
+    def _next_request_id(self) -> int:
+        """Allocate a unique JSON-RPC request id for this session"""
+        return next(self._request_ids)
     
     def _parse_sse_response(self, response_text: str) -> Dict[str, Any]:
         """
-        Parse Server-Sent Events response format
+        Parse an already-buffered response body (SSE or plain JSON)
         """
         try:
-            # Handle SSE format: "event: message\ndata: {json}"
-            if "event: message" in response_text and "data: " in response_text:
-                # Extract JSON from SSE format
-                lines = response_text.strip().split('\n')
-                for line in lines:
-                    if line.startswith("data: "):
-                        json_data = line[6:]  # Remove "data: " prefix
-                        return json.loads(json_data)
+            parser = SSEParser()
+            events = [parser.feed_line(line) for line in response_text.splitlines()]
+            events.append(parser.flush())
+            for event in events:
+                if event and event["event"] == "message":
+                    return json.loads(event["data"])
             
             # Try parsing as regular JSON
             return json.loads(response_text)
@@ -77,55 +155,155 @@ class MCPAtlassianClient:
         Connect to the MCP server
         """
         try:
-            self.client = httpx.AsyncClient(timeout=30.0)
+            self.client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            return await self._initialize()
             
-            # Initialize MCP session
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "roots": {
-                            "listChanged": True
-                        },
-                        "sampling": {}
+        except Exception as e:
+            logger.error(f"Error connecting to MCP server: {str(e)}")
+            return False
+    
+    async def _initialize(self) -> bool:
+        """
+        Run the MCP initialize handshake on the current HTTP client
+        """
+        self.session_id = None
+        
+        # Initialize MCP session
+        init_request = {
+            "jsonrpc": "2.0",
+            "id": self._next_request_id(),
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "roots": {
+                        "listChanged": True
                     },
-                    "clientInfo": {
-                        "name": "pi-planning-dashboard",
-                        "version": "1.0.0"
-                    }
+                    "sampling": {}
+                },
+                "clientInfo": {
+                    "name": "pi-planning-dashboard",
+                    "version": "1.0.0"
                 }
             }
+        }
+        
+        response = await self.client.post(
+            self.server_url,
+            json=init_request,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            }
+        )
+        
+        if response.status_code == 200:
+            # Handle SSE response format
+            result = self._parse_sse_response(response.text)
+            if "result" in result:
+                # Extract session ID from headers
+                self.session_id = response.headers.get('mcp-session-id')
+                logger.info(f"Successfully connected to MCP Atlassian server with session ID: {self.session_id}")
+                
+                # Send initialized notification
+                await self._send_initialized_notification()
+                return True
+        
+        logger.error(f"Failed to connect to MCP server: {response.status_code} - {response.text}")
+        return False
+    
+    @asynccontextmanager
+    async def _open_stream(self, request: Dict[str, Any]):
+        """
+        Open a streamed POST for a JSON-RPC request, re-initializing once if the
+        server dropped our session
+        """
+        session_id = self.session_id
+        async with self.client.stream(
+            "POST",
+            self.server_url,
+            json=request,
+            headers=self._request_headers()
+        ) as response:
+            # Streamable HTTP servers answer 404 for an unknown/expired mcp-session-id
+            if not (response.status_code == 404 and session_id):
+                yield response
+                return
+        
+        async with self._reinitialize_lock:
+            # Another in-flight call may already have re-initialized
+            if self.session_id == session_id:
+                logger.warning(f"MCP session {session_id} expired, re-initializing")
+                await self._initialize()
+        
+        async with self.client.stream(
+            "POST",
+            self.server_url,
+            json=request,
+            headers=self._request_headers()
+        ) as response:
+            yield response
+    
+    async def iter_messages(self, request: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Send a JSON-RPC request and yield each message as soon as it arrives
+        
+        SSE responses are parsed incrementally, so progress notifications and the
+        final result are available before the body has finished downloading.
+        """
+        async with self._open_stream(request) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                raise MCPResponseError(response.status_code, body.decode("utf-8", errors="replace"))
             
-            response = await self.client.post(
-                self.server_url,
-                json=init_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                }
-            )
-            
-            if response.status_code == 200:
-                # Handle SSE response format
-                result = self._parse_sse_response(response.text)
-                if "result" in result:
-                    # Extract session ID from headers
-                    self.session_id = response.headers.get('mcp-session-id')
-                    logger.info(f"Successfully connected to MCP Atlassian server with session ID: {self.session_id}")
-                    
-                    # Send initialized notification
-                    await self._send_initialized_notification()
-                    return True
+            if "text/event-stream" not in response.headers.get("content-type", ""):
+                body = await response.aread()
+                if body.strip():
+                    yield json.loads(body)
+                return
             
-            logger.error(f"Failed to connect to MCP server: {response.status_code} - {response.text}")
-            return False
+            parser = SSEParser()
+            async for line in response.aiter_lines():
+                event = parser.feed_line(line)
+                if event and event["event"] == "message":
+                    yield json.loads(event["data"])
             
-        except Exception as e:
-            logger.error(f"Error connecting to MCP server: {str(e)}")
-            return False
+            event = parser.flush()
+            if event and event["event"] == "message":
+                yield json.loads(event["data"])
+    
+    async def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and return the response matching its id
+        """
+        messages = self.iter_messages(request)
+        try:
+            async for message in messages:
+                if message.get("id") == request["id"] and "method" not in message:
+                    return message
+                if message.get("method") == "notifications/progress":
+                    logger.debug(f"MCP progress for request {request['id']}: {message.get('params')}")
+        finally:
+            # Release the streamed connection as soon as our response is in hand
+            await messages.aclose()
+        
+        raise ValueError(f"MCP server closed the stream without a response to request {request['id']}")
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """Build request headers for the current session"""
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream"
+        }
+        if self.session_id:
+            headers["mcp-session-id"] = self.session_id
+        return headers
     
     async def list_tools(self) -> List[Dict[str, Any]]:
         """
@@ -134,96 +312,126 @@ class MCPAtlassianClient:
         try:
             request = {
                 "jsonrpc": "2.0",
-                "id": 2,
+                "id": self._next_request_id(),
                 "method": "tools/list",
                 "params": {}
             }
             
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            }
-            if self.session_id:
-                headers["mcp-session-id"] = self.session_id
-            
-            response = await self.client.post(
-                self.server_url,
-                json=request,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                result = self._parse_sse_response(response.text)
-                if "result" in result and "tools" in result["result"]:
-                    return result["result"]["tools"]
+            result = await self._request(request)
+            if "result" in result and "tools" in result["result"]:
+                return result["result"]["tools"]
             
-            logger.error(f"Failed to list tools: {response.status_code} - {response.text}")
+            logger.error(f"Failed to list tools: {result}")
             return []
             
         except Exception as e:
             logger.error(f"Error listing tools: {str(e)}")
             return []
     
+    def _build_tool_request(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        report_progress: bool = False
+    ) -> Dict[str, Any]:
+        """Build a tools/call request with a fresh id"""
+        request_id = self._next_request_id()
+        params = {
+            "name": tool_name,
+            "arguments": arguments
+        }
+        if report_progress:
+            params["_meta"] = {"progressToken": request_id}
+        
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": params
+        }
+    
+    async def iter_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Call a tool and yield its progress notifications followed by the final response
+        """
+        request = self._build_tool_request(tool_name, arguments, report_progress=True)
+        async for message in self.iter_messages(request):
+            yield message
+    
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call a tool on the MCP server
         """
         try:
-            request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
+            result = await self._request(self._build_tool_request(tool_name, arguments))
+            
+            if "result" in result:
+                return {
+                    "success": True,
+                    "result": result["result"],
+                    "tool_name": tool_name,
                     "arguments": arguments
                 }
-            }
-            
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            }
-            if self.session_id:
-                headers["mcp-session-id"] = self.session_id
-            
-            response = await self.client.post(
-                self.server_url,
-                json=request,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                result = self._parse_sse_response(response.text)
-                if "result" in result:
-                    return {
-                        "success": True,
-                        "result": result["result"],
-                        "tool_name": tool_name,
-                        "arguments": arguments
-                    }
-                elif "error" in result:
-                    return {
-                        "success": False,
-                        "error": result["error"],
-                        "tool_name": tool_name,
-                        "arguments": arguments
-                    }
             
             return {
                 "success": False,
-                "error": f"HTTP {response.status_code}: {response.text}",
+                "error": result.get("error", f"Unexpected response: {result}"),
                 "tool_name": tool_name,
                 "arguments": arguments
             }
             
         except Exception as e:
+            connection_error = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
             return {
                 "success": False,
                 "error": str(e),
                 "tool_name": tool_name,
-                "arguments": arguments
+                "arguments": arguments,
+                # The request never reached the server, so it is safe to send elsewhere
+                "connection_error": connection_error,
+                # The request was sent but no answer came back, so it may have been applied
+                "timed_out": isinstance(e, httpx.TimeoutException) and not connection_error
             }
     
+    async def call_tools_concurrently(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_in_flight: int = 8,
+        call_timeout: Optional[float] = None,
+        results: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Call many tools on the MCP server with up to max_in_flight requests outstanding
+        
+        Each request carries its own JSON-RPC id and shares the session's connection
+        pool, so total time scales with ceil(len(calls) / max_in_flight) round trips.
+        call_timeout bounds each call on its own (time spent waiting for a slot
+        does not count). Results are returned in the same order as calls; when a
+        results list is passed in, it is filled as each call completes, so a
+        caller that gives up on the batch can still tell which calls finished.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+        if results is None:
+            results = [None] * len(calls)
+        
+        async def _bounded_call(index: int, tool_name: str, arguments: Dict[str, Any]):
+            async with semaphore:
+                try:
+                    results[index] = await asyncio.wait_for(self.call_tool(tool_name, arguments), call_timeout)
+                except asyncio.TimeoutError:
+                    results[index] = {
+                        "success": False,
+                        "error": f"MCP call timed out after {call_timeout:.0f}s",
+                        "tool_name": tool_name,
+                        "arguments": arguments,
+                        "timed_out": True
+                    }
+        
+        await asyncio.gather(
+            *(_bounded_call(index, tool_name, arguments) for index, (tool_name, arguments) in enumerate(calls))
+        )
+        return results
+    
     async def disconnect(self):
         """
         Disconnect from the MCP server
@@ -232,70 +440,116 @@ class MCPAtlassianClient:
             await self.client.aclose()
             self.client = None
 
+# Long-lived event loop shared by every synchronous wrapper in the process
+_background_loop = None
+_background_thread = None
+_background_lock = threading.Lock()
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the process-wide asyncio loop running on a daemon thread"""
+    global _background_loop, _background_thread
+    with _background_lock:
+        if (
+            _background_loop is None
+            or _background_loop.is_closed()
+            or _background_thread is None
+            or not _background_thread.is_alive()
+        ):
+            _background_loop = asyncio.new_event_loop()
+            _background_thread = threading.Thread(
+                target=_background_loop.run_forever,
+                name="mcp-event-loop",
+                daemon=True
+            )
+            _background_thread.start()
+    return _background_loop
+
 # Synchronous wrapper for Streamlit
 class StreamlitMCPClient:
     """
     Synchronous wrapper for the MCP client to work with Streamlit
+    
+    All coroutines run on one background event loop, so the underlying
+    httpx session and its keep-alive connections survive Streamlit reruns
+    and the initialize handshake happens once per process.
     """
     
-    def __init__(self, server_url: str = "http://localhost:3000/mcp/"):
+    def __init__(self, server_url: str = "http://localhost:3000/mcp/", timeout: float = 120.0):
         self.server_url = server_url
+        self.timeout = timeout
         self._client = None
+        self._connect_lock = threading.Lock()
     
-    def _get_or_create_loop(self):
-        """Get or create an event loop for async operations"""
+    def _run(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the background loop and wait for its result
+        
+        On timeout the coroutine is cancelled, so it does not keep working
+        on the loop after the caller has given up on it.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                raise RuntimeError("Event loop is closed")
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop
+            return future.result(timeout=timeout or self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def is_connected(self) -> bool:
+        """Check if an initialized MCP session is available"""
+        return self._client is not None and self._client.client is not None
     
     def connect(self) -> bool:
-        """Connect to the MCP server (synchronous)"""
-        loop = self._get_or_create_loop()
-        
-        async def _connect():
-            self._client = MCPAtlassianClient(self.server_url)
-            return await self._client.connect()
-        
-        try:
-            return loop.run_until_complete(_connect())
-        except Exception as e:
-            st.error(f"Failed to connect to MCP server: {str(e)}")
-            return False
+        """Connect to the MCP server (synchronous), reusing an existing session"""
+        with self._connect_lock:
+            if self.is_connected():
+                return True
+            
+            async def _connect():
+                client = MCPAtlassianClient(self.server_url)
+                if await client.connect():
+                    return client
+                await client.disconnect()
+                return None
+            
+            try:
+                self._client = self._run(_connect())
+                return self._client is not None
+            except Exception as e:
+                st.error(f"Failed to connect to MCP server: {str(e)}")
+                return False
     
     def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools (synchronous)"""
-        if not self._client:
-            if not self.connect():
-                return []
-        
-        loop = self._get_or_create_loop()
+        if not self.connect():
+            return []
         
         try:
-            return loop.run_until_complete(self._client.list_tools())
+            return self._run(self._client.list_tools())
         except Exception as e:
             st.error(f"Failed to list tools: {str(e)}")
             return []
     
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool (synchronous)"""
-        if not self._client:
-            if not self.connect():
-                return {
-                    "success": False,
-                    "error": "Failed to connect to MCP server",
-                    "tool_name": tool_name,
-                    "arguments": arguments
-                }
-        
-        loop = self._get_or_create_loop()
+        if not self.connect():
+            return {
+                "success": False,
+                "error": "Failed to connect to MCP server",
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "connection_error": True
+            }
         
         try:
-            return loop.run_until_complete(self._client.call_tool(tool_name, arguments))
+            return self._run(self._client.call_tool(tool_name, arguments))
+        except concurrent.futures.TimeoutError:
+            return {
+                "success": False,
+                "error": f"MCP call timed out after {self.timeout:.0f}s",
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "timed_out": True
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -304,26 +558,299 @@ class StreamlitMCPClient:
                 "arguments": arguments
             }
     
+    def call_tools_concurrently(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_in_flight: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Call many tools with a bounded in-flight window (synchronous)
+        
+        Each call gets its own timeout, and the batch as a whole only as long
+        as its calls can take queued behind each other. Calls that had not
+        finished when the batch was given up on are reported with timed_out set,
+        since they may still have reached JIRA.
+        """
+        if not self.connect():
+            return [
+                {
+                    "success": False,
+                    "error": "Failed to connect to MCP server",
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "connection_error": True
+                }
+                for tool_name, arguments in calls
+            ]
+        
+        results = [None] * len(calls)
+        batch_timeout = self.timeout * (math.ceil(len(calls) / max(1, max_in_flight)) + 1)
+        try:
+            return self._run(
+                self._client.call_tools_concurrently(
+                    calls, max_in_flight=max_in_flight, call_timeout=self.timeout, results=results
+                ),
+                timeout=batch_timeout
+            )
+        except concurrent.futures.TimeoutError:
+            return [
+                result or {
+                    "success": False,
+                    "error": f"MCP batch timed out after {batch_timeout:.0f}s",
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "timed_out": True
+                }
+                for result, (tool_name, arguments) in zip(results, calls)
+            ]
+        except Exception as e:
+            return [
+                {
+                    "success": False,
+                    "error": str(e),
+                    "tool_name": tool_name,
+                    "arguments": arguments
+                }
+                for tool_name, arguments in calls
+            ]
+    
     def disconnect(self):
         """Disconnect from the MCP server (synchronous)"""
-        if self._client:
-            loop = self._get_or_create_loop()
-            try:
-                loop.run_until_complete(self._client.disconnect())
-            except Exception as e:
-                logger.error(f"Error disconnecting: {str(e)}")
-            finally:
-                self._client = None
+        with self._connect_lock:
+            if self._client:
+                try:
+                    self._run(self._client.disconnect())
+                except Exception as e:
+                    logger.error(f"Error disconnecting: {str(e)}")
+                finally:
+                    self._client = None
+
+class MCPSessionPool:
+    """
+    Thread-safe pool of warm MCP sessions shared by every Streamlit session in the process
+    
+    Sessions are pooled per server URL, health-checked with list_tools after sitting
+    idle, and evicted once they exceed the idle timeout.
+    """
+    
+    def __init__(
+        self,
+        max_sessions: int = 4,
+        server_sizes: Optional[Dict[str, int]] = None,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 60.0,
+        acquire_timeout: float = 60.0
+    ):
+        self.max_sessions = max_sessions
+        self.server_sizes = server_sizes or {}
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self._condition = threading.Condition()
+        self._idle: Dict[str, List[Tuple[StreamlitMCPClient, float]]] = {}
+        self._open_counts: Dict[str, int] = {}
+    
+    def max_size(self, server_url: str) -> int:
+        """Maximum number of sessions allowed for a server"""
+        return max(1, self.server_sizes.get(server_url, self.max_sessions))
+    
+    def _evict_idle(self, now: float) -> List[StreamlitMCPClient]:
+        """Remove sessions idle past the timeout (caller must hold the lock)"""
+        expired = []
+        for server_url, entries in self._idle.items():
+            fresh = []
+            for client, last_used in entries:
+                if now - last_used > self.idle_timeout:
+                    expired.append(client)
+                    self._open_counts[server_url] -= 1
+                else:
+                    fresh.append((client, last_used))
+            self._idle[server_url] = fresh
+        return expired
+    
+    def acquire(self, server_url: str) -> StreamlitMCPClient:
+        """Lease a connected session for server_url, waiting if the pool is exhausted"""
+        deadline = time.monotonic() + self.acquire_timeout
+        
+        with self._condition:
+            expired = self._evict_idle(time.time())
+            while True:
+                idle = self._idle.get(server_url)
+                if idle:
+                    # Most recently used session is the most likely to still be warm
+                    client, last_used = idle.pop()
+                    break
+                if self._open_counts.get(server_url, 0) < self.max_size(server_url):
+                    self._open_counts[server_url] = self._open_counts.get(server_url, 0) + 1
+                    client, last_used = StreamlitMCPClient(server_url), None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for an MCP session to {server_url}")
+                self._condition.wait(remaining)
+        
+        for stale_client in expired:
+            stale_client.disconnect()
+        
+        if last_used is not None and time.time() - last_used > self.health_check_interval:
+            if not client.list_tools():
+                logger.warning(f"Pooled MCP session to {server_url} failed health check, reconnecting")
+                client.disconnect()
+        
+        if not client.connect():
+            self.release(client, healthy=False)
+            raise ConnectionError(f"Failed to connect to MCP server at {server_url}")
+        
+        return client
+    
+    def release(self, client: StreamlitMCPClient, healthy: bool = True):
+        """Return a leased session to the pool, closing it if it is unhealthy"""
+        with self._condition:
+            if healthy:
+                self._idle.setdefault(client.server_url, []).append((client, time.time()))
+            else:
+                self._open_counts[client.server_url] -= 1
+            self._condition.notify()
+        
+        if not healthy:
+            client.disconnect()
+    
+    @contextmanager
+    def session(self, server_url: str):
+        """Context manager that leases a session and always returns it"""
+        client = self.acquire(server_url)
+        healthy = True
+        try:
+            yield client
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(client, healthy=healthy)
+    
+    def close_all(self):
+        """Disconnect every idle session"""
+        with self._condition:
+            idle_clients = [client for entries in self._idle.values() for client, _ in entries]
+            for server_url, entries in self._idle.items():
+                self._open_counts[server_url] -= len(entries)
+            self._idle = {}
+        
+        for client in idle_clients:
+            client.disconnect()
+
+class PooledMCPClient:
+    """
+    Drop-in replacement for StreamlitMCPClient that leases a pooled session per call
+    """
+    
+    def __init__(self, pool: MCPSessionPool, server_url: str):
+        self.pool = pool
+        self.server_url = server_url
+    
+    def connect(self) -> bool:
+        """Check that a session to the MCP server can be leased"""
+        try:
+            with self.pool.session(self.server_url):
+                return True
+        except Exception as e:
+            logger.error(f"Error connecting to MCP server: {str(e)}")
+            # The endpoint may have moved; make the next get_mcp_client() re-probe
+            invalidate_mcp_endpoint()
+            return False
+    
+    def list_tools(self) -> List[Dict[str, Any]]:
+        """List available tools using a pooled session"""
+        try:
+            with self.pool.session(self.server_url) as client:
+                return client.list_tools()
+        except Exception as e:
+            logger.error(f"Error listing tools: {str(e)}")
+            return []
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool using a pooled session, re-probing the endpoint once if it cannot be reached"""
+        return self.call_tools_concurrently([(tool_name, arguments)], max_in_flight=1)[0]
+    
+    def call_tools_concurrently(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_in_flight: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Call many tools with a bounded in-flight window using a pooled session
+        
+        Calls that could not reach the cached endpoint are retried once after
+        re-probing, since the server may have moved.
+        """
+        results = self._call_tools(calls, max_in_flight)
+        
+        unreachable = [i for i, result in enumerate(results) if result.get("connection_error")]
+        if unreachable:
+            invalidate_mcp_endpoint()
+            self.server_url = resolve_mcp_server_url()
+            retried = self._call_tools([calls[i] for i in unreachable], max_in_flight)
+            for i, result in zip(unreachable, retried):
+                results[i] = result
+        
+        return results
+    
+    def _call_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_in_flight: int
+    ) -> List[Dict[str, Any]]:
+        """Send calls over one leased session without any endpoint fallback"""
+        try:
+            with self.pool.session(self.server_url) as client:
+                if len(calls) == 1:
+                    return [client.call_tool(*calls[0])]
+                return client.call_tools_concurrently(calls, max_in_flight=max_in_flight)
+        except Exception as e:
+            return [
+                {
+                    "success": False,
+                    "error": str(e),
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "connection_error": isinstance(e, ConnectionError)
+                }
+                for tool_name, arguments in calls
+            ]
+    
+    def disconnect(self):
+        """Sessions are owned by the pool, so there is nothing to close per caller"""
+        pass
+
+# Process-wide session pool shared by all Streamlit sessions
+_mcp_pool = None
+_mcp_pool_lock = threading.Lock()
+
+def get_mcp_pool() -> MCPSessionPool:
+    """Get or create the process-wide MCP session pool"""
+    global _mcp_pool
+    if _mcp_pool is None:
+        with _mcp_pool_lock:
+            if _mcp_pool is None:
+                pool_config = load_config()['mcp_pool']
+                _mcp_pool = MCPSessionPool(
+                    max_sessions=pool_config['max_sessions'],
+                    server_sizes=pool_config.get('server_sizes', {}),
+                    idle_timeout=pool_config['idle_timeout'],
+                    health_check_interval=pool_config['health_check_interval']
+                )
+    return _mcp_pool
 
-# Global client instance for Streamlit
-_mcp_client = None
+def resolve_mcp_server_url(force: bool = False) -> str:
+    """Resolve the MCP endpoint via cached discovery, falling back to the configured URL"""
+    config = load_config()
+    candidates = build_candidate_urls(config['mcp_server_url'])
+    discovered = discover_mcp_endpoint(candidates, ttl=config['mcp_discovery_ttl'], force=force)
+    return discovered or config['mcp_server_url']
 
-def get_mcp_client() -> StreamlitMCPClient:
-    """Get or create the global MCP client instance"""
-    global _mcp_client
-    if _mcp_client is None:
-        _mcp_client = StreamlitMCPClient()
-    return _mcp_client
+def get_mcp_client(server_url: Optional[str] = None) -> PooledMCPClient:
+    """Get an MCP client backed by the shared session pool"""
+    return PooledMCPClient(get_mcp_pool(), server_url or resolve_mcp_server_url())
 
 def test_mcp_connection() -> Dict[str, Any]:
     """
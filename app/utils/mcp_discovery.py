@@ -0,0 +1,131 @@
+"""
+MCP endpoint discovery for PI Planning Dashboard
+Probes candidate MCP server URLs once, in parallel, and caches the winner
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Hosts and endpoint paths the MCP Atlassian server is commonly exposed on
+DEFAULT_BASE_URLS = [
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:9000"
+]
+DEFAULT_ENDPOINT_PATHS = ["/mcp/", "/mcp", "/sse", "", "/api"]
+
+# Winning endpoint per candidate list: {candidates: (url, discovered_at)}
+_endpoint_cache: Dict[Tuple[str, ...], Tuple[str, float]] = {}
+_endpoint_cache_lock = threading.Lock()
+
+def build_candidate_urls(
+    preferred_url: Optional[str] = None,
+    base_urls: Optional[List[str]] = None,
+    endpoint_paths: Optional[List[str]] = None
+) -> List[str]:
+    """Build the ordered, de-duplicated list of URLs to probe"""
+    candidates = [preferred_url] if preferred_url else []
+
+    for base_url in base_urls or DEFAULT_BASE_URLS:
+        for endpoint in endpoint_paths or DEFAULT_ENDPOINT_PATHS:
+            candidates.append(f"{base_url.rstrip('/')}{endpoint}")
+
+    return list(dict.fromkeys(candidates))
+
+def probe_endpoint(url: str, connect_timeout: float = 1.0, read_timeout: float = 3.0) -> Dict[str, Any]:
+    """
+    Check whether url speaks MCP JSON-RPC
+
+    A ping is enough: streamable-http servers answer with a JSON-RPC body even
+    when they reject the request for lacking a session.
+    """
+    started = time.monotonic()
+    try:
+        response = requests.post(
+            url,
+            json={"jsonrpc": "2.0", "id": 0, "method": "ping", "params": {}},
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+            timeout=(connect_timeout, read_timeout),
+            allow_redirects=False
+        )
+        ok = response.status_code == 200 or '"jsonrpc"' in response.text[:500]
+        return {
+            'url': url,
+            'ok': ok,
+            'status_code': response.status_code,
+            'error': None if ok else f"HTTP {response.status_code}: {response.text[:100]}",
+            'elapsed': time.monotonic() - started
+        }
+    except requests.exceptions.ConnectionError:
+        error = "Connection refused"
+    except requests.exceptions.Timeout:
+        error = "Request timed out"
+    except Exception as e:
+        error = str(e)
+
+    return {
+        'url': url,
+        'ok': False,
+        'status_code': None,
+        'error': error,
+        'elapsed': time.monotonic() - started
+    }
+
+def probe_endpoints(
+    urls: List[str],
+    connect_timeout: float = 1.0,
+    read_timeout: float = 3.0
+) -> List[Dict[str, Any]]:
+    """Probe all urls in parallel; results are returned in the same order as urls"""
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(
+            lambda url: probe_endpoint(url, connect_timeout, read_timeout),
+            urls
+        ))
+
+def discover_mcp_endpoint(
+    candidates: List[str],
+    ttl: float = 600.0,
+    force: bool = False
+) -> Optional[str]:
+    """
+    Return the first working endpoint among candidates, probing only on a cache miss
+
+    Preference follows candidate order, not whichever probe answered first.
+    """
+    cache_key = tuple(candidates)
+
+    with _endpoint_cache_lock:
+        cached = _endpoint_cache.get(cache_key)
+        if cached and not force and time.time() - cached[1] < ttl:
+            return cached[0]
+
+    for result in probe_endpoints(candidates):
+        if result['ok']:
+            with _endpoint_cache_lock:
+                _endpoint_cache[cache_key] = (result['url'], time.time())
+            logger.info(f"Discovered MCP endpoint at {result['url']}")
+            return result['url']
+
+    logger.error(f"No MCP endpoint responded among {len(candidates)} candidates")
+    return None
+
+def invalidate_mcp_endpoint(candidates: Optional[List[str]] = None):
+    """Forget the cached endpoint so the next lookup re-probes"""
+    with _endpoint_cache_lock:
+        if candidates is None:
+            _endpoint_cache.clear()
+        else:
+            _endpoint_cache.pop(tuple(candidates), None)
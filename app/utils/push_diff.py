@@ -0,0 +1,187 @@
+"""
+Incremental push diffing for PI Planning Dashboard
+Compares edited Epics/Features with the last pushed snapshot to find the minimal JIRA changes
+"""
+
+import json
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from utils.config import load_config
+
+# Fields compared per item kind, mapped to how they are written to JIRA
+DIFF_FIELDS = {
+    'epic': ('title', 'description', 'priority'),
+    'feature': ('title', 'description', 'priority')
+}
+
+class PushOperation(NamedTuple):
+    """One create/update/delete needed to bring JIRA in line with the edited plan"""
+    action: str
+    kind: str
+    item_id: str
+    jira_key: Optional[str] = None
+    epic_id: Optional[str] = None
+    item: Optional[Dict[str, Any]] = None
+    changes: Optional[Dict[str, Tuple[Any, Any]]] = None
+
+def plan_item_id(kind: str, item: Dict[str, Any], position: str) -> str:
+    """Stable identifier for an item, falling back to its position in the plan"""
+    return item.get('id') or f"{kind}-{position}"
+
+def iter_plan_items(edited_epics: Dict[str, Any]):
+    """
+    Yield (kind, item_id, epic_id, item, position) for every Epic and Feature in the plan
+
+    position is "i" for the i-th Epic and "i-j" for its j-th Feature, matching
+    the task IDs used by the push scheduler ("epic-i", "feature-i-j").
+    """
+    for i, epic in enumerate(edited_epics.get('epics', [])):
+        epic_id = plan_item_id('epic', epic, str(i))
+        yield 'epic', epic_id, None, epic, str(i)
+
+        for j, feature in enumerate(epic.get('features', [])):
+            yield 'feature', plan_item_id('feature', feature, f"{i}-{j}"), epic_id, feature, f"{i}-{j}"
+
+def build_snapshot(edited_epics: Dict[str, Any], jira_keys: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build a snapshot of the pushed plan
+
+    jira_keys maps item IDs to the JIRA key each item was created as; items
+    without a key were not pushed and are left out.
+    """
+    snapshot = {}
+    for kind, item_id, epic_id, item, _ in iter_plan_items(edited_epics):
+        if item_id not in jira_keys:
+            continue
+        snapshot[item_id] = {
+            'kind': kind,
+            'jira_key': jira_keys[item_id],
+            'epic_id': epic_id,
+            'fields': {field: item.get(field) for field in DIFF_FIELDS[kind]}
+        }
+    return snapshot
+
+def diff_against_snapshot(
+    edited_epics: Dict[str, Any],
+    snapshot: Dict[str, Dict[str, Any]],
+    include_deletes: bool = False
+) -> List[PushOperation]:
+    """Compute the minimal operations, field by field, to sync JIRA with the edited plan"""
+    operations = []
+    seen = set()
+
+    for kind, item_id, epic_id, item, _ in iter_plan_items(edited_epics):
+        seen.add(item_id)
+        previous = snapshot.get(item_id)
+
+        if previous is None:
+            operations.append(PushOperation('create', kind, item_id, epic_id=epic_id, item=item))
+            continue
+
+        changes = {
+            field: (previous['fields'].get(field), item.get(field))
+            for field in DIFF_FIELDS[kind]
+            if previous['fields'].get(field) != item.get(field)
+        }
+        if changes:
+            operations.append(PushOperation(
+                'update', kind, item_id, jira_key=previous['jira_key'],
+                epic_id=epic_id, item=item, changes=changes
+            ))
+
+    if include_deletes:
+        # Features go first so Epics are never deleted out from under them
+        removed = sorted(
+            (item_id for item_id in snapshot if item_id not in seen),
+            key=lambda item_id: snapshot[item_id]['kind'] == 'epic'
+        )
+        for item_id in removed:
+            operations.append(PushOperation(
+                'delete', snapshot[item_id]['kind'], item_id,
+                jira_key=snapshot[item_id]['jira_key'], epic_id=snapshot[item_id].get('epic_id')
+            ))
+
+    return operations
+
+def jira_update_fields(operation: PushOperation) -> Dict[str, Any]:
+    """Translate an update operation's changed fields into JIRA fields"""
+    fields = {}
+    for field, (_, new_value) in (operation.changes or {}).items():
+        if field == 'title':
+            fields['summary'] = new_value
+        elif field == 'description':
+            fields['description'] = new_value or ''
+        elif field == 'priority':
+            fields['priority'] = {'name': new_value}
+    return fields
+
+def apply_results_to_snapshot(
+    snapshot: Dict[str, Dict[str, Any]],
+    edited_epics: Dict[str, Any],
+    applied: Dict[str, Optional[str]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Return a new snapshot after operations were applied
+
+    applied maps item IDs of successful operations to their JIRA key (None for
+    deletes). Failed operations keep their previous snapshot entry so they are
+    retried on the next sync.
+    """
+    updated = {item_id: entry for item_id, entry in snapshot.items()}
+
+    for item_id, jira_key in applied.items():
+        if jira_key is None:
+            updated.pop(item_id, None)
+
+    current = build_snapshot(edited_epics, {
+        item_id: jira_key
+        for item_id, jira_key in applied.items()
+        if jira_key is not None
+    })
+    updated.update(current)
+    return updated
+
+def _snapshot_path(project_key: str):
+    return load_config()['data_dir'] / 'push_snapshots' / f'{project_key}.json'
+
+def load_snapshot(project_key: str) -> Dict[str, Dict[str, Any]]:
+    """Load the last pushed snapshot for a project (empty if never pushed)"""
+    path = _snapshot_path(project_key)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+def save_snapshot(project_key: str, snapshot: Dict[str, Dict[str, Any]]):
+    """Persist the pushed snapshot for a project"""
+    path = _snapshot_path(project_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(snapshot, f, indent=2, default=str)
+    tmp_path.replace(path)
+
+def clear_snapshot(project_key: str, kinds: Optional[Iterable[str]] = None,
+                   jira_keys: Optional[Iterable[str]] = None):
+    """
+    Forget pushed items, e.g. after they were deleted from JIRA
+
+    Drops entries of the given kinds and entries for the given JIRA keys;
+    with neither, the whole snapshot is removed.
+    """
+    if kinds is None and jira_keys is None:
+        _snapshot_path(project_key).unlink(missing_ok=True)
+        return
+
+    kinds = set(kinds or ())
+    jira_keys = set(jira_keys or ())
+    snapshot = load_snapshot(project_key)
+    remaining = {
+        item_id: entry for item_id, entry in snapshot.items()
+        if entry['kind'] not in kinds and entry['jira_key'] not in jira_keys
+    }
+    if len(remaining) != len(snapshot):
+        save_snapshot(project_key, remaining)
@@ -0,0 +1,121 @@
+"""
+Push journal for PI Planning Dashboard
+Records which Epics and Features already exist in JIRA so interrupted pushes can resume
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+from utils.config import load_config
+
+class PushJournal:
+    """
+    Append-only, on-disk journal of pushed items keyed by item ID and content hash
+
+    Each line is one JSON record. Re-opening the journal replays it, so a
+    retried push can skip every item that already received a JIRA key.
+    The journal is cleared when the project is wiped.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Replay the journal file into memory, ignoring a torn final line"""
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._entries[entry['key']] = entry
+
+    @staticmethod
+    def item_key(kind: str, project_key: str, item_id: str, item: Dict[str, Any],
+                 parent_key: Optional[str] = None) -> str:
+        """
+        Idempotency key for an Epic or Feature
+
+        A hash of the item's plan ID and the content that gets pushed, so
+        identical items in different places of the plan get their own keys.
+        """
+        content = {
+            'kind': kind,
+            'project_key': project_key,
+            'item_id': item_id,
+            'title': item.get('title', ''),
+            'description': item.get('description', ''),
+            'parent': parent_key
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the journal entry for key, if the item was already pushed"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def record(self, key: str, kind: str, item: Dict[str, Any], jira_key: str, url: str = ''):
+        """Durably record that an item was created in JIRA"""
+        entry = {
+            'key': key,
+            'kind': kind,
+            'id': item.get('id', ''),
+            'title': item.get('title', ''),
+            'jira_key': jira_key,
+            'url': url,
+            'created_at': datetime.now().isoformat()
+        }
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+                f.flush()
+            self._entries[key] = entry
+
+    def clear(self, kinds: Optional[Iterable[str]] = None, jira_keys: Optional[Iterable[str]] = None):
+        """
+        Forget pushed items, e.g. after they were deleted from JIRA
+
+        Drops entries of the given kinds and entries for the given JIRA keys;
+        with neither, everything is dropped.
+        """
+        with self._lock:
+            if kinds is None and jira_keys is None:
+                self._entries.clear()
+            else:
+                kinds = set(kinds or ())
+                jira_keys = set(jira_keys or ())
+                self._entries = {
+                    key: entry for key, entry in self._entries.items()
+                    if entry['kind'] not in kinds and entry['jira_key'] not in jira_keys
+                }
+
+            if not self._entries:
+                self.path.unlink(missing_ok=True)
+                return
+
+            # Rewrite the surviving entries, then swap them in atomically
+            tmp_path = self.path.with_suffix('.jsonl.tmp')
+            with open(tmp_path, 'w') as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry) + '\n')
+            tmp_path.replace(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+def get_push_journal(project_key: str) -> PushJournal:
+    """Open the push journal for a JIRA project under the data directory"""
+    config = load_config()
+    return PushJournal(config['data_dir'] / 'push_journal' / f'{project_key}.jsonl')
@@ -0,0 +1,99 @@
+"""
+Dependency-aware push scheduler for PI Planning Dashboard
+Runs JIRA push tasks concurrently, releasing each task as soon as its dependencies finish
+"""
+
+from typing import Dict, Any, Callable, Generator, Iterator, List, NamedTuple, Optional, Tuple
+
+# A tool call requested by a task: (tool_name, arguments)
+ToolRequest = Tuple[str, Dict[str, Any]]
+
+# Task bodies are generators: they yield tool requests, receive each raw MCP
+# response back from the scheduler, and return the task's result
+TaskBody = Generator[ToolRequest, Dict[str, Any], Dict[str, Any]]
+
+class PushTask(NamedTuple):
+    """
+    One unit of push work
+
+    run receives the results of the tasks listed in depends_on, keyed by task_id,
+    and returns a generator (see TaskBody).
+    """
+    task_id: str
+    run: Callable[[Dict[str, Dict[str, Any]]], TaskBody]
+    depends_on: Tuple[str, ...] = ()
+
+def run_push_tasks(
+    tasks: List[PushTask],
+    call_tools: Callable[[List[ToolRequest]], List[Dict[str, Any]]],
+    max_batch: Optional[int] = None
+) -> Iterator[Tuple[PushTask, Dict[str, Any]]]:
+    """
+    Execute tasks as a DAG, batching the tool calls of running tasks
+
+    Each round sends the pending requests of up to max_batch running tasks
+    (all of them by default) through one call_tools batch, e.g. the MCP
+    client's call_tools_concurrently; the rest wait for the next round.
+    Keeping batches small means each one finishes well within its deadline
+    and every task handles (e.g. journals) its response before the next
+    batch goes out. Yields (task, result) on the calling thread as tasks
+    finish, so callers can update the UI as results arrive. An exception
+    raised by a task becomes {'success': False, 'error': ...}.
+    """
+    tasks_by_id = {task.task_id: task for task in tasks}
+    for task in tasks:
+        missing = [dep for dep in task.depends_on if dep not in tasks_by_id]
+        if missing:
+            raise ValueError(f"Task {task.task_id} depends on unknown tasks: {missing}")
+
+    remaining_deps = {task.task_id: len(task.depends_on) for task in tasks}
+    dependents: Dict[str, List[str]] = {task.task_id: [] for task in tasks}
+    for task in tasks:
+        for dep in task.depends_on:
+            dependents[dep].append(task.task_id)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    ready = [task for task in tasks if not task.depends_on]
+    waiting: Dict[str, Tuple[TaskBody, ToolRequest]] = {}
+    finished: List[PushTask] = []
+
+    def complete(task: PushTask, result: Dict[str, Any]):
+        """Record a task's result and release the tasks that were waiting on it"""
+        results[task.task_id] = result
+        finished.append(task)
+        for dependent_id in dependents[task.task_id]:
+            remaining_deps[dependent_id] -= 1
+            if remaining_deps[dependent_id] == 0:
+                ready.append(tasks_by_id[dependent_id])
+
+    def advance(task: PushTask, body: TaskBody, response: Dict[str, Any] = None):
+        """Run a task until its next tool request or its result"""
+        try:
+            waiting[task.task_id] = (body, body.send(response))
+        except StopIteration as stop:
+            complete(task, stop.value)
+        except Exception as e:
+            complete(task, {'success': False, 'error': str(e)})
+
+    while ready or waiting:
+        while ready:
+            task = ready.pop(0)
+            try:
+                advance(task, task.run({dep: results[dep] for dep in task.depends_on}))
+            except Exception as e:
+                complete(task, {'success': False, 'error': str(e)})
+
+        if waiting:
+            batch = list(waiting.items())[:max_batch]
+            for task_id, _ in batch:
+                del waiting[task_id]
+            responses = call_tools([request for _, (_, request) in batch])
+            for (task_id, (body, _)), response in zip(batch, responses):
+                advance(tasks_by_id[task_id], body, response)
+
+        while finished:
+            task = finished.pop(0)
+            yield task, results[task.task_id]
+
+    if len(results) != len(tasks):
+        raise ValueError("Push tasks contain a dependency cycle")
@@ -0,0 +1,135 @@
+"""
+Backlog quality scoring for PI Planning Dashboard
+Scores whole DataFrames of stories with vectorized column operations
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable
+
+# (flag column, issue message, score penalty, recommendation) - same rules as JIRAClient.analyze_story_quality
+QUALITY_RULES = (
+    ('bad_format', 'Story does not follow "As a... I want... So that..." format', 20,
+     'Rewrite using: "As a [user type], I want [functionality] so that [benefit]"'),
+    ('missing_acceptance_criteria', 'Missing acceptance criteria', 15,
+     'Add clear acceptance criteria with Given/When/Then format'),
+    ('missing_story_points', 'Missing story points estimation', 10,
+     'Estimate story points using planning poker or similar technique'),
+    ('missing_assignee', 'No assignee specified', 10,
+     'Assign to appropriate team member based on skills required'),
+    ('missing_epic', 'Not linked to an Epic', 10,
+     'Link to relevant Epic to show business context'),
+    ('summary_too_short', 'Summary too short', 5,
+     'Adjust summary length to be clear and concise (10-100 characters)'),
+    ('summary_too_long', 'Summary too long', 5,
+     'Adjust summary length to be clear and concise (10-100 characters)')
+)
+
+# Score thresholds for each quality level (lower bound inclusive)
+QUALITY_BINS = [-np.inf, 50, 70, 90, np.inf]
+QUALITY_LEVELS = ['Poor', 'Fair', 'Good', 'Excellent']
+
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column as strings with missing values blanked (all blank if absent)"""
+    if column not in df:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].fillna('').astype(str)
+
+def _missing_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """True where a value is absent or falsy, like `not story.get(column)`"""
+    if column not in df:
+        return pd.Series(True, index=df.index)
+    values = df[column]
+    return values.isna() | ~values.astype(bool)
+
+# Stories turned into a DataFrame at a time when scoring a stream
+BACKLOG_CHUNK_SIZE = 10000
+
+def score_stories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-row scores for every story in df, with one boolean column per rule
+
+    Expects the issue dict columns used elsewhere (summary, description,
+    story_points, assignee, epic); missing columns count as failed checks.
+    """
+    summary = _text_column(df, 'summary')
+    summary_length = summary.str.len()
+
+    flags = pd.DataFrame({
+        'bad_format': ~summary.str.lower().str.startswith('as a'),
+        'missing_acceptance_criteria': ~_text_column(df, 'description').str.contains(
+            'acceptance criteria', case=False, regex=False
+        ),
+        'missing_story_points': _missing_column(df, 'story_points'),
+        'missing_assignee': _missing_column(df, 'assignee'),
+        'missing_epic': _missing_column(df, 'epic'),
+        'summary_too_short': summary_length < 10,
+        'summary_too_long': summary_length > 100
+    }, index=df.index)
+
+    penalties = np.array([penalty for _, _, penalty, _ in QUALITY_RULES])
+    raw_score = 100 - flags[[column for column, _, _, _ in QUALITY_RULES]].to_numpy(dtype=np.int64) @ penalties
+
+    scores = pd.DataFrame(index=df.index)
+    if 'key' in df:
+        scores['key'] = df['key']
+    scores['score'] = np.maximum(raw_score, 0)
+    scores['quality'] = pd.cut(raw_score, bins=QUALITY_BINS, labels=QUALITY_LEVELS, right=False)
+    return scores.join(flags)
+
+def summarize_scores(scores: pd.DataFrame) -> Dict[str, Any]:
+    """Aggregate distributions and recommendations for scores from score_stories"""
+    rule_failures = scores[[column for column, _, _, _ in QUALITY_RULES]].sum()
+    recommendations = []
+    for column, _, _, recommendation in QUALITY_RULES:
+        if rule_failures[column] and recommendation not in recommendations:
+            recommendations.append(recommendation)
+
+    return {
+        'scores': scores,
+        'total': len(scores),
+        'average_score': float(scores['score'].mean()) if len(scores) else 0.0,
+        'quality_distribution': {
+            level: int(count)
+            for level, count in scores['quality'].value_counts().reindex(QUALITY_LEVELS, fill_value=0).items()
+        },
+        'issue_counts': {
+            message: int(rule_failures[column])
+            for column, message, _, _ in QUALITY_RULES
+        },
+        'recommendations': recommendations
+    }
+
+def analyze_backlog_quality(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Score every story in df at once
+
+    Returns per-row scores (see score_stories) plus aggregate distributions
+    and the recommendations for rules that any story failed.
+    """
+    return summarize_scores(score_stories(df))
+
+def analyze_backlog_quality_in_chunks(stories: Iterable[Dict[str, Any]],
+                                      chunk_size: int = BACKLOG_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Score a stream of story dicts, chunk_size stories at a time
+
+    Only one chunk of story dicts is held at once; the result has the same
+    shape as analyze_backlog_quality, and its scores table keeps one compact
+    row per story.
+    """
+    stories = iter(stories)
+    chunks = []
+    for start in itertools.count(0, chunk_size):
+        chunk = list(itertools.islice(stories, chunk_size))
+        if not chunk:
+            break
+        scores = score_stories(pd.DataFrame.from_records(chunk))
+        scores.index += start
+        chunks.append(scores)
+
+    if not chunks:
+        return analyze_backlog_quality(pd.DataFrame())
+    return summarize_scores(pd.concat(chunks))
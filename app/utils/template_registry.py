@@ -0,0 +1,208 @@
+"""
+Feature template registry for PI Planning Dashboard
+Loads category-specific Feature templates once and indexes them for fast selection
+
+Template files are JSON (or YAML when PyYAML is installed) shaped like:
+
+    {
+      "categories": {
+        "Security": [
+          {
+            "title": "Threat Modelling",
+            "description": "Identify threats and mitigations",
+            "acceptance_criteria": ["Threat model reviewed"],
+            "effort_size": "M",
+            "keywords": ["threat", "attack surface"]
+          }
+        ],
+        "default": [...]
+      }
+    }
+
+Categories without templates fall back to "default". The templates shipped
+in config/feature_templates.json cover the goal categories used by the app.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from utils.config import load_config
+from utils.keyword_matcher import KeywordMatcher
+
+# Effort sizes understood by the Epic Generator's estimation guidelines
+EFFORT_SIZES = ('XS', 'S', 'M', 'L', 'XL', 'XXL')
+
+DEFAULT_CATEGORY = 'default'
+
+class FeatureTemplate(NamedTuple):
+    """Immutable Feature template"""
+    title: str
+    description: str
+    acceptance_criteria: Tuple[str, ...]
+    effort_size: str
+    keywords: Tuple[str, ...] = ()
+
+# Generic templates used for every category unless a template file overrides them
+DEFAULT_FEATURE_TEMPLATES = {
+    DEFAULT_CATEGORY: [
+        {
+            'title': 'Requirements Analysis and Design',
+            'description': 'Analyze requirements and create technical design',
+            'acceptance_criteria': ['Requirements documented', 'Design approved'],
+            'effort_size': 'M'
+        },
+        {
+            'title': 'Core Implementation',
+            'description': 'Implement core functionality',
+            'acceptance_criteria': ['Core features working', 'Unit tests passing'],
+            'effort_size': 'L'
+        },
+        {
+            'title': 'User Interface Development',
+            'description': 'Create user interface components',
+            'acceptance_criteria': ['UI components created', 'Responsive design'],
+            'effort_size': 'M'
+        },
+        {
+            'title': 'Integration and Testing',
+            'description': 'Integrate components and perform testing',
+            'acceptance_criteria': ['Integration complete', 'All tests passing'],
+            'effort_size': 'M'
+        },
+        {
+            'title': 'Documentation and Deployment',
+            'description': 'Create documentation and deploy to production',
+            'acceptance_criteria': ['Documentation complete', 'Successfully deployed'],
+            'effort_size': 'S'
+        }
+    ]
+}
+
+def _build_template(data: Dict[str, Any]) -> FeatureTemplate:
+    """Validate one template definition and freeze it"""
+    effort_size = str(data.get('effort_size', 'M')).upper()
+    if effort_size not in EFFORT_SIZES:
+        raise ValueError(f"Unknown effort size '{effort_size}' in template '{data.get('title', '')}'")
+
+    return FeatureTemplate(
+        title=data['title'],
+        description=data.get('description', ''),
+        acceptance_criteria=tuple(data.get('acceptance_criteria', [])),
+        effort_size=effort_size,
+        keywords=tuple(keyword.lower() for keyword in data.get('keywords', []))
+    )
+
+class TemplateRegistry:
+    """
+    Feature templates indexed by category and keyword
+
+    Templates are built once. select() is a dictionary lookup for the
+    category plus one keyword scan of the goal text against that
+    category's keywords, so the number of templates does not affect
+    per-Epic cost.
+    """
+
+    def __init__(self, templates_by_category: Dict[str, Iterable[Dict[str, Any]]]):
+        self._by_category: Dict[str, Tuple[FeatureTemplate, ...]] = {}
+        for category, templates in templates_by_category.items():
+            self._by_category[category.lower()] = tuple(_build_template(data) for data in templates)
+
+        if DEFAULT_CATEGORY not in self._by_category:
+            self._by_category[DEFAULT_CATEGORY] = tuple(
+                _build_template(data) for data in DEFAULT_FEATURE_TEMPLATES[DEFAULT_CATEGORY]
+            )
+
+        # Per category: keyword -> position of every template that declares it
+        self._keywords: Dict[str, KeywordMatcher] = {
+            category: KeywordMatcher(
+                (keyword, position)
+                for position, template in enumerate(templates)
+                for keyword in template.keywords
+            )
+            for category, templates in self._by_category.items()
+        }
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._by_category)
+
+    def _category_key(self, category: Optional[str]) -> str:
+        """Registry key for category, or the default one if it has no templates"""
+        key = (category or '').lower()
+        return key if key in self._by_category else DEFAULT_CATEGORY
+
+    def templates_for(self, category: Optional[str]) -> Tuple[FeatureTemplate, ...]:
+        """Templates registered for category, or the default ones"""
+        return self._by_category[self._category_key(category)]
+
+    def select(self, category: Optional[str], goal_text: str = '', limit: Optional[int] = None) -> List[FeatureTemplate]:
+        """
+        Pick the templates for a goal
+
+        Only the category's own templates are considered. Those whose
+        keywords appear in the goal text come first, followed by the rest,
+        each in file order; templates listed last can therefore be kept for
+        goals that mention their keywords.
+        """
+        key = self._category_key(category)
+        templates = self._by_category[key]
+        matched = self._keywords[key].scan(goal_text.lower()) if goal_text else set()
+
+        selected = [template for position, template in enumerate(templates) if position in matched]
+        selected.extend(template for position, template in enumerate(templates) if position not in matched)
+
+        return selected[:limit] if limit is not None else selected
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'TemplateRegistry':
+        """Load templates from a JSON or YAML file"""
+        path = Path(path)
+        with open(path, 'r') as f:
+            if path.suffix.lower() in ('.yaml', '.yml'):
+                import yaml  # Optional dependency, only needed for YAML template files
+                data = yaml.safe_load(f) or {}
+            else:
+                data = json.load(f)
+
+        return cls(data.get('categories', data))
+
+# Registries are immutable, so one instance per file is shared by every agent
+_registries: Dict[Optional[str], TemplateRegistry] = {}
+_registries_lock = threading.Lock()
+
+def load_template_registry(path: Optional[Path] = None) -> TemplateRegistry:
+    """
+    Get the registry for a template file, loading it on first use
+
+    Falls back to the built-in templates when no file is given, the file does
+    not exist, or it cannot be loaded. Failed loads are not cached, so a
+    fixed file is picked up on the next call.
+    """
+    cache_key = str(path) if path and Path(path).exists() else None
+
+    with _registries_lock:
+        registry = _registries.get(cache_key)
+        if registry is not None:
+            return registry
+
+        if cache_key is not None:
+            try:
+                registry = TemplateRegistry.from_file(Path(path))
+            except ImportError:
+                print(f"PyYAML is not installed; cannot load feature templates from {path}")
+            except Exception as e:
+                print(f"Could not load feature templates from {path}: {e}")
+
+        if registry is not None:
+            _registries[cache_key] = registry
+            return registry
+
+        if None not in _registries:
+            _registries[None] = TemplateRegistry(DEFAULT_FEATURE_TEMPLATES)
+        return _registries[None]
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the registry for the configured template file (FEATURE_TEMPLATES_PATH)"""
+    return load_template_registry(load_config()['feature_templates_path'])
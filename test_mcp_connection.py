@@ -7,80 +7,36 @@ This script helps debug MCP server connectivity issues
 import requests
 import json
 import sys
+from pathlib import Path
 from typing import Dict, Any
 
+# Add the app directory to Python path for imports
+app_dir = Path(__file__).parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from utils.mcp_discovery import build_candidate_urls, probe_endpoints
+
 def test_mcp_connection():
     """Test connection to MCP Atlassian server"""
     
-    # Possible MCP server URLs to try
-    possible_urls = [
-        "http://localhost:3000",
-        "http://localhost:3000:3000", 
-        "http://localhost:9000",
-        "http://127.0.0.1:3000"
-    ]
-    
-    # Try different endpoint paths
-    endpoint_paths = ["/mcp", "/sse", "", "/api"]
+    # Probe every candidate URL in parallel with short timeouts
+    candidate_urls = build_candidate_urls()
     
     print("🔍 Testing MCP Atlassian Server Connection...")
     print("=" * 50)
+    print(f"📡 Probing {len(candidate_urls)} candidate URLs in parallel")
     
-    for base_url in possible_urls:
-        print(f"\n📡 Testing base URL: {base_url}")
-        
-        for endpoint in endpoint_paths:
-            full_url = f"{base_url.rstrip('/')}{endpoint}"
-            print(f"  🔗 Trying: {full_url}")
-            
-            try:
-                # Test 1: Basic connectivity
-                response = requests.get(full_url, timeout=5)
-                print(f"    ✅ GET request successful: {response.status_code}")
-                
-                # Test 2: MCP tools/list call
-                mcp_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/list",
-                    "params": {}
-                }
-                
-                response = requests.post(
-                    full_url,
-                    json=mcp_payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json"
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    print(f"    ✅ MCP tools/list successful!")
-                    print(f"    📋 Available tools: {len(result.get('result', {}).get('tools', []))}")
-                    
-                    # List available tools
-                    tools = result.get('result', {}).get('tools', [])
-                    for tool in tools[:5]:  # Show first 5 tools
-                        print(f"      - {tool.get('name', 'Unknown')}")
-                    
-                    if len(tools) > 5:
-                        print(f"      ... and {len(tools) - 5} more tools")
-                    
-                    print(f"\n🎉 SUCCESS! MCP server found at: {full_url}")
-                    return full_url
-                    
-                else:
-                    print(f"    ❌ MCP call failed: {response.status_code} - {response.text[:100]}")
-                    
-            except requests.exceptions.ConnectionError:
-                print(f"    ❌ Connection refused")
-            except requests.exceptions.Timeout:
-                print(f"    ❌ Request timed out")
-            except Exception as e:
-                print(f"    ❌ Error: {str(e)}")
+    working_url = None
+    for result in probe_endpoints(candidate_urls):
+        if result['ok']:
+            print(f"  ✅ {result['url']} ({result['elapsed']:.2f}s)")
+            working_url = working_url or result['url']
+        else:
+            print(f"  ❌ {result['url']}: {result['error']}")
+    
+    if working_url:
+        print(f"\n🎉 SUCCESS! MCP server found at: {working_url}")
+        return working_url
     
     print(f"\n❌ No working MCP server found!")
     print("\n💡 Troubleshooting Tips:")
@@ -143,7 +99,7 @@ if __name__ == "__main__":
     
     if working_url:
         print(f"\n✅ Update your .env file with:")
-        print(f"JIRA_MCP_SERVER_URL={working_url}")
+        print(f"MCP_SERVER_URL={working_url}")
         
         # Test JIRA functionality
         if "--test-jira" in sys.argv:
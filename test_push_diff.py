@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental push diffing
+Checks the create, update and delete operations computed against the last pushed snapshot
+"""
+
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path for imports
+app_dir = Path(__file__).parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from utils.push_diff import (
+    apply_results_to_snapshot, build_snapshot, diff_against_snapshot, jira_update_fields
+)
+
+def make_plan():
+    return {'epics': [
+        {'id': 'E1', 'title': 'Checkout', 'description': 'Faster checkout', 'priority': 'High',
+         'features': [
+             {'id': 'F1', 'title': 'One-click pay', 'description': '', 'priority': 'High'},
+             {'id': 'F2', 'title': 'Saved cards', 'description': '', 'priority': 'Medium'}
+         ]},
+        {'id': 'E2', 'title': 'Search', 'description': 'Better search', 'priority': 'Medium',
+         'features': [{'id': 'F3', 'title': 'Typo tolerance', 'description': '', 'priority': 'Low'}]},
+    ]}
+
+PUSHED_KEYS = {'E1': 'PI-1', 'F1': 'PI-2', 'F2': 'PI-3', 'E2': 'PI-4', 'F3': 'PI-5'}
+
+def test_unchanged_plan_needs_nothing():
+    """Re-pushing the plan that was just pushed sends no operations"""
+    plan = make_plan()
+    snapshot = build_snapshot(plan, PUSHED_KEYS)
+
+    assert diff_against_snapshot(plan, snapshot, include_deletes=True) == []
+
+def test_new_items_are_created():
+    """Items missing from the snapshot become creates, Features keeping their Epic"""
+    plan = make_plan()
+    snapshot = build_snapshot(plan, {'E1': 'PI-1', 'F1': 'PI-2'})
+
+    operations = diff_against_snapshot(plan, snapshot)
+
+    assert [(op.action, op.item_id, op.epic_id) for op in operations] == [
+        ('create', 'F2', 'E1'), ('create', 'E2', None), ('create', 'F3', 'E2')
+    ]
+    assert all(op.jira_key is None for op in operations)
+
+def test_changed_fields_are_updated():
+    """Only edited fields are sent, translated to JIRA fields"""
+    snapshot = build_snapshot(make_plan(), PUSHED_KEYS)
+    plan = make_plan()
+    plan['epics'][0]['title'] = 'One-page checkout'
+    plan['epics'][1]['features'][0]['priority'] = 'High'
+    plan['epics'][1]['features'][0]['description'] = None
+
+    operations = diff_against_snapshot(plan, snapshot)
+
+    assert [(op.action, op.item_id, op.jira_key) for op in operations] == [
+        ('update', 'E1', 'PI-1'), ('update', 'F3', 'PI-5')
+    ]
+    assert operations[0].changes == {'title': ('Checkout', 'One-page checkout')}
+    assert jira_update_fields(operations[0]) == {'summary': 'One-page checkout'}
+    assert jira_update_fields(operations[1]) == {'description': '', 'priority': {'name': 'High'}}
+
+def test_removed_items_are_deleted_features_first():
+    """Deletes are opt-in and remove Features before the Epic they hang off"""
+    snapshot = build_snapshot(make_plan(), PUSHED_KEYS)
+    plan = make_plan()
+    del plan['epics'][0]
+
+    assert diff_against_snapshot(plan, snapshot) == []
+
+    operations = diff_against_snapshot(plan, snapshot, include_deletes=True)
+
+    assert [op.action for op in operations] == ['delete'] * 3
+    assert [op.jira_key for op in operations][-1] == 'PI-1'
+    assert sorted(op.jira_key for op in operations[:-1]) == ['PI-2', 'PI-3']
+    assert all(op.epic_id == 'E1' for op in operations[:-1])
+
+def test_results_update_the_snapshot():
+    """Successful operations land in the snapshot; failed ones are retried next sync"""
+    snapshot = build_snapshot(make_plan(), {'E1': 'PI-1', 'F1': 'PI-2', 'F2': 'PI-3'})
+    plan = make_plan()
+    plan['epics'][0]['title'] = 'One-page checkout'
+    plan['epics'][0]['features'][0]['title'] = 'Two-click pay'
+    del plan['epics'][0]['features'][1]
+
+    # E1 updated, F2 deleted, E2 created; the F1 update and F3 create failed
+    applied = {'E1': 'PI-1', 'F2': None, 'E2': 'PI-4'}
+    updated = apply_results_to_snapshot(snapshot, plan, applied)
+
+    assert sorted(updated) == ['E1', 'E2', 'F1']
+    assert updated['E1']['fields']['title'] == 'One-page checkout'
+    assert updated['E2']['jira_key'] == 'PI-4'
+    assert snapshot['E1']['fields']['title'] == 'Checkout'
+
+    remaining = diff_against_snapshot(plan, updated, include_deletes=True)
+    assert [(op.action, op.item_id) for op in remaining] == [('update', 'F1'), ('create', 'F3')]
+
+if __name__ == "__main__":
+    print("🚀 Testing Push Diff")
+    print("=" * 50)
+
+    tests = [
+        test_unchanged_plan_needs_nothing,
+        test_new_items_are_created,
+        test_changed_fields_are_updated,
+        test_removed_items_are_deleted_features_first,
+        test_results_update_the_snapshot
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n🏁 {len(tests) - failures}/{len(tests)} tests passed")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script for the push journal
+Checks that a push interrupted part-way resumes without creating anything twice
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the app directory to Python path for imports
+app_dir = Path(__file__).parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from utils.push_journal import PushJournal
+from utils.push_scheduler import PushTask, run_push_tasks
+
+PLAN = [
+    {'id': 'E1', 'title': 'Checkout', 'description': 'Faster checkout',
+     'features': [{'id': 'F1', 'title': 'One-click pay'}, {'id': 'F2', 'title': 'Saved cards'}]},
+    {'id': 'E2', 'title': 'Search', 'description': 'Better search',
+     'features': [{'id': 'F3', 'title': 'Typo tolerance'}]},
+]
+
+class FakeJira:
+    """Creates issues with increasing keys, failing every create whose summary is listed"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.created = []
+
+    def __call__(self, requests):
+        responses = []
+        for _, arguments in requests:
+            if arguments['summary'] in self.failing:
+                responses.append({'success': False, 'error': 'HTTP 503: Service Unavailable'})
+                continue
+            self.created.append(arguments['summary'])
+            responses.append({'success': True, 'key': f"PI-{len(self.created)}"})
+        return responses
+
+def push_task(journal, task_id, kind, item, parent_id=None):
+    """Journal-aware create task, shaped like the Review & Push page's push_epic/push_feature"""
+    def run(dependencies):
+        parent_key = dependencies[parent_id].get('jira_key') if parent_id else None
+        if parent_id and not parent_key:
+            return {'success': False, 'error': 'Parent Epic was not created'}
+
+        key = PushJournal.item_key(kind, 'PI', item['id'], item, parent_key)
+        entry = journal.get(key)
+        if entry:
+            return {'success': True, 'jira_key': entry['jira_key'], 'resumed': True}
+
+        response = yield ('jira_create_issue', {'summary': item['title'], 'parent': parent_key})
+        if not response['success']:
+            return {'success': False, 'error': response['error']}
+        journal.record(key, kind, item, response['key'])
+        return {'success': True, 'jira_key': response['key']}
+    return PushTask(task_id, run, (parent_id,) if parent_id else ())
+
+def push(journal, jira):
+    tasks = []
+    for epic in PLAN:
+        tasks.append(push_task(journal, epic['id'], 'epic', epic))
+        for feature in epic['features']:
+            tasks.append(push_task(journal, feature['id'], 'feature', feature, epic['id']))
+    return {task.task_id: result for task, result in run_push_tasks(tasks, jira)}
+
+def test_replay_after_partial_failure():
+    """Only the items that failed are created when the push is retried"""
+    path = Path(tempfile.mkdtemp()) / 'PI.jsonl'
+
+    first = FakeJira(failing={'Saved cards', 'Search'})
+    results = push(PushJournal(path), first)
+    assert sorted(task_id for task_id, result in results.items() if not result['success']) == ['E2', 'F2', 'F3']
+    assert first.created == ['Checkout', 'One-click pay']
+
+    # A fresh journal replays what the first run recorded on disk
+    journal = PushJournal(path)
+    assert len(journal) == 2
+    second = FakeJira()
+    results = push(journal, second)
+
+    assert all(result['success'] for result in results.values())
+    assert sorted(second.created) == ['Saved cards', 'Search', 'Typo tolerance']
+    assert results['E1'] == {'success': True, 'jira_key': 'PI-1', 'resumed': True}
+    assert results['F1'] == {'success': True, 'jira_key': 'PI-2', 'resumed': True}
+    assert len(PushJournal(path)) == 5
+
+def test_replay_ignores_torn_last_line():
+    """A write cut off mid-line (e.g. a crash) loses only that entry"""
+    path = Path(tempfile.mkdtemp()) / 'PI.jsonl'
+    journal = PushJournal(path)
+    journal.record('a', 'epic', {'id': 'E1', 'title': 'Checkout'}, 'PI-1')
+    journal.record('b', 'feature', {'id': 'F1', 'title': 'One-click pay'}, 'PI-2')
+    with open(path, 'a') as f:
+        f.write('{"key": "c", "kind": "feat')
+
+    replayed = PushJournal(path)
+
+    assert len(replayed) == 2
+    assert replayed.get('b')['jira_key'] == 'PI-2'
+    assert replayed.get('c') is None
+
+def test_last_entry_per_key_wins():
+    """Re-recording a key (e.g. after the issue was re-created) replaces the old JIRA key"""
+    path = Path(tempfile.mkdtemp()) / 'PI.jsonl'
+    journal = PushJournal(path)
+    journal.record('a', 'epic', {'id': 'E1'}, 'PI-1')
+    journal.record('a', 'epic', {'id': 'E1'}, 'PI-7')
+
+    assert PushJournal(path).get('a')['jira_key'] == 'PI-7'
+
+def test_clear_by_kind_and_key():
+    """Wiping Epics or single issues forgets only those entries, on disk too"""
+    path = Path(tempfile.mkdtemp()) / 'PI.jsonl'
+    journal = PushJournal(path)
+    journal.record('a', 'epic', {'id': 'E1'}, 'PI-1')
+    journal.record('b', 'feature', {'id': 'F1'}, 'PI-2')
+    journal.record('c', 'feature', {'id': 'F2'}, 'PI-3')
+
+    journal.clear(jira_keys=['PI-2'])
+    assert sorted(PushJournal(path)._entries) == ['a', 'c']
+
+    journal.clear(kinds=['epic'])
+    assert sorted(PushJournal(path)._entries) == ['c']
+
+    journal.clear()
+    assert not path.exists()
+
+if __name__ == "__main__":
+    print("🚀 Testing Push Journal")
+    print("=" * 50)
+
+    tests = [
+        test_replay_after_partial_failure,
+        test_replay_ignores_torn_last_line,
+        test_last_entry_per_key_wins,
+        test_clear_by_kind_and_key
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n🏁 {len(tests) - failures}/{len(tests)} tests passed")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for the dependency-aware push scheduler
+Checks DAG ordering, batching and how failures reach dependent tasks
+"""
+
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path for imports
+app_dir = Path(__file__).parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from utils.push_scheduler import PushTask, run_push_tasks
+
+class FakeTools:
+    """Stands in for call_tools_concurrently, answering every request with its task's name"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, requests):
+        self.batches.append([arguments['name'] for _, arguments in requests])
+        return [{'success': True, 'key': arguments['name'].upper()} for _, arguments in requests]
+
+def create_task(task_id, depends_on=(), seen=None):
+    """A task that creates one issue, recording the dependency results it was started with"""
+    def run(dependencies):
+        if seen is not None:
+            seen[task_id] = dependencies
+        response = yield ('jira_create_issue', {'name': task_id})
+        return {'success': response['success'], 'jira_key': response['key']}
+    return PushTask(task_id, run, tuple(depends_on))
+
+def test_dependents_run_after_their_dependencies():
+    """Features are only sent once their Epic's result is in, and receive that result"""
+    tools = FakeTools()
+    seen = {}
+    tasks = [
+        create_task('feature-0-0', ['epic-0'], seen),
+        create_task('epic-0', seen=seen),
+        create_task('epic-1', seen=seen),
+        create_task('feature-1-0', ['epic-1'], seen),
+    ]
+
+    order = [task.task_id for task, _ in run_push_tasks(tasks, tools)]
+
+    assert tools.batches == [['epic-0', 'epic-1'], ['feature-0-0', 'feature-1-0']]
+    assert order.index('epic-0') < order.index('feature-0-0')
+    assert order.index('epic-1') < order.index('feature-1-0')
+    assert seen['feature-0-0'] == {'epic-0': {'success': True, 'jira_key': 'EPIC-0'}}
+    assert seen['epic-0'] == {}
+
+def test_max_batch_bounds_each_round():
+    """No more than max_batch tool calls go out per round"""
+    tools = FakeTools()
+    tasks = [create_task(f'epic-{i}') for i in range(5)]
+
+    results = {task.task_id: result for task, result in run_push_tasks(tasks, tools, max_batch=2)}
+
+    assert [len(batch) for batch in tools.batches] == [2, 2, 1]
+    assert len(results) == 5 and all(result['success'] for result in results.values())
+
+def test_failure_propagates_to_dependents():
+    """A task that raises fails on its own, and its dependents see the failed result"""
+    def failing_epic(dependencies):
+        yield ('jira_create_issue', {'name': 'epic-0'})
+        raise RuntimeError("JIRA rejected the Epic")
+
+    def feature(dependencies):
+        epic = dependencies['epic-0']
+        if not epic['success']:
+            return {'success': False, 'error': f"Parent Epic failed: {epic['error']}"}
+        yield ('jira_create_issue', {'name': 'feature-0-0'})
+
+    tools = FakeTools()
+    tasks = [
+        PushTask('epic-0', failing_epic),
+        PushTask('feature-0-0', feature, ('epic-0',)),
+        create_task('epic-1'),
+    ]
+
+    results = {task.task_id: result for task, result in run_push_tasks(tasks, tools)}
+
+    assert results['epic-0'] == {'success': False, 'error': 'JIRA rejected the Epic'}
+    assert results['feature-0-0'] == {'success': False, 'error': 'Parent Epic failed: JIRA rejected the Epic'}
+    assert results['epic-1']['success']
+    assert 'feature-0-0' not in sum(tools.batches, [])
+
+def test_task_failing_before_its_first_request():
+    """A task that raises before yielding still completes with an error"""
+    def broken(dependencies):
+        raise ValueError("no summary")
+
+    results = list(run_push_tasks([PushTask('epic-0', broken)], FakeTools()))
+
+    assert results[0][1] == {'success': False, 'error': 'no summary'}
+
+def test_unknown_dependency_and_cycle():
+    """Malformed task graphs are rejected instead of silently skipped"""
+    try:
+        list(run_push_tasks([create_task('feature-0-0', ['epic-9'])], FakeTools()))
+        assert False, "unknown dependency was accepted"
+    except ValueError as e:
+        assert 'epic-9' in str(e)
+
+    try:
+        list(run_push_tasks([create_task('a', ['b']), create_task('b', ['a'])], FakeTools()))
+        assert False, "cycle was accepted"
+    except ValueError as e:
+        assert 'cycle' in str(e)
+
+if __name__ == "__main__":
+    print("🚀 Testing Push Scheduler")
+    print("=" * 50)
+
+    tests = [
+        test_dependents_run_after_their_dependencies,
+        test_max_batch_bounds_each_round,
+        test_failure_propagates_to_dependents,
+        test_task_failing_before_its_first_request,
+        test_unknown_dependency_and_cycle
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n🏁 {len(tests) - failures}/{len(tests)} tests passed")
+    sys.exit(1 if failures else 0)
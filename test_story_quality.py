@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test script for vectorized backlog quality scoring
+Checks that JIRAClient.analyze_backlog_quality matches the per-story analyze_story_quality
+"""
+
+import sys
+from pathlib import Path
+
+# Add the app directory to Python path for imports
+app_dir = Path(__file__).parent / "app"
+sys.path.insert(0, str(app_dir))
+
+from utils.jira_api import JIRAClient
+from utils.story_quality import QUALITY_RULES, analyze_backlog_quality_in_chunks
+
+# Edge cases around every rule, on top of the mock backlog
+EXTRA_STORIES = [
+    {'key': 'T-1', 'summary': 'As a user', 'description': 'Acceptance Criteria: given...',
+     'story_points': 3, 'assignee': 'a@example.com', 'epic': 'T-0'},
+    {'key': 'T-2', 'summary': 'As a admin', 'description': None,
+     'story_points': 0, 'assignee': '', 'epic': None},
+    {'key': 'T-3', 'summary': 'As a ' + 'x' * 95, 'description': 'no criteria here',
+     'story_points': 5, 'assignee': 'b@example.com', 'epic': 'T-0'},
+    {'key': 'T-4', 'summary': 'As a ' + 'x' * 96, 'description': 'ACCEPTANCE CRITERIA',
+     'story_points': 1, 'assignee': 'c@example.com', 'epic': 'T-0'},
+    {'key': 'T-5', 'summary': 'Short'},
+    {'key': 'T-6', 'summary': 'Make the export faster for managers', 'description': '',
+     'story_points': 2.5, 'assignee': None, 'epic': 'T-0'},
+]
+
+def test_backlog_quality_matches_per_story():
+    """Every story gets the same score, quality level and issues from both paths"""
+    client = JIRAClient({'mock_mode': True})
+    stories = client.mock_data['stories'] + EXTRA_STORIES
+
+    backlog = client.analyze_backlog_quality(stories)
+    scores = backlog['scores']
+    assert backlog['total'] == len(stories)
+
+    expected_recommendations = []
+    for position, story in enumerate(stories):
+        expected = client.analyze_story_quality(story)
+        row = scores.iloc[position]
+
+        assert row['key'] == story['key']
+        assert row['score'] == expected['score'], story['key']
+        assert row['quality'] == expected['quality'], story['key']
+
+        failed = [message for column, message, _, _ in QUALITY_RULES if row[column]]
+        assert failed == expected['issues'], story['key']
+
+        for recommendation in expected['recommendations']:
+            if recommendation not in expected_recommendations:
+                expected_recommendations.append(recommendation)
+
+    assert set(backlog['recommendations']) == set(expected_recommendations)
+
+def test_backlog_quality_aggregates():
+    """Distributions and averages agree with the per-story results"""
+    client = JIRAClient({'mock_mode': True})
+    stories = client.mock_data['stories'] + EXTRA_STORIES
+    expected = [client.analyze_story_quality(story) for story in stories]
+
+    backlog = client.analyze_backlog_quality(stories)
+
+    assert backlog['average_score'] == sum(result['score'] for result in expected) / len(expected)
+    for level, count in backlog['quality_distribution'].items():
+        assert count == sum(1 for result in expected if result['quality'] == level), level
+    for message, count in backlog['issue_counts'].items():
+        assert count == sum(1 for result in expected if message in result['issues']), message
+
+def test_backlog_quality_defaults_to_project_stories():
+    """Without explicit stories, the project's stories are scored"""
+    client = JIRAClient({'mock_mode': True})
+
+    backlog = client.analyze_backlog_quality()
+
+    assert backlog['total'] == len(client.mock_data['stories'])
+    assert list(backlog['scores']['key']) == [story['key'] for story in client.mock_data['stories']]
+
+def test_backlog_quality_in_chunks():
+    """Scoring a stream chunk by chunk gives the same rows and aggregates as one DataFrame"""
+    client = JIRAClient({'mock_mode': True})
+    stories = client.mock_data['stories'] + EXTRA_STORIES
+
+    whole = client.analyze_backlog_quality(stories)
+    chunked = analyze_backlog_quality_in_chunks(iter(stories), chunk_size=3)
+
+    assert list(chunked['scores'].index) == list(range(len(stories)))
+    assert list(chunked['scores']['score']) == list(whole['scores']['score'])
+    assert list(chunked['scores']['quality']) == list(whole['scores']['quality'])
+    for field in ('total', 'average_score', 'quality_distribution', 'issue_counts', 'recommendations'):
+        assert chunked[field] == whole[field], field
+
+class FakeJira:
+    """Stands in for the jira library's client, serving one page of search results"""
+
+    def __init__(self, issues):
+        self.issues = issues
+        self.requested_fields = []
+
+    def search_issues(self, jql, startAt=0, maxResults=50, fields=None, json_result=True):
+        self.requested_fields.append(fields)
+        page = self.issues[startAt:startAt + maxResults]
+        return {'issues': page, 'total': len(self.issues)}
+
+def test_backlog_quality_reads_descriptions():
+    """Project stories are fetched with their descriptions, so acceptance criteria count"""
+    client = JIRAClient({'mock_mode': False, 'story_points_field': 'customfield_10016'})
+    client._jira = FakeJira([{
+        'key': 'PI-1',
+        'fields': {
+            'issuetype': {'name': 'Story'},
+            'summary': 'As a planner, I want epics scored',
+            'description': 'Acceptance Criteria: every epic has a score',
+            'status': {'name': 'To Do'},
+            'assignee': {'emailAddress': 'a@example.com'},
+            'parent': {'key': 'PI-0', 'fields': {'issuetype': {'name': 'Epic'}}},
+            'customfield_10016': 3
+        }
+    }])
+
+    backlog = client.analyze_backlog_quality()
+
+    assert 'description' in client._jira.requested_fields[0].split(',')
+    assert backlog['scores']['score'].tolist() == [100]
+    assert not backlog['scores']['missing_acceptance_criteria'].any()
+
+def test_backlog_quality_empty():
+    """An empty backlog scores without errors"""
+    backlog = JIRAClient({'mock_mode': True}).analyze_backlog_quality([])
+
+    assert backlog['total'] == 0
+    assert backlog['average_score'] == 0.0
+    assert backlog['recommendations'] == []
+
+if __name__ == "__main__":
+    print("🚀 Testing Backlog Quality Scoring")
+    print("=" * 50)
+
+    tests = [
+        test_backlog_quality_matches_per_story,
+        test_backlog_quality_aggregates,
+        test_backlog_quality_defaults_to_project_stories,
+        test_backlog_quality_in_chunks,
+        test_backlog_quality_reads_descriptions,
+        test_backlog_quality_empty
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print(f"\n🏁 {len(tests) - failures}/{len(tests)} tests passed")
+    sys.exit(1 if failures else 0)